@@ -17,6 +17,7 @@ from .constants import PageAttributes as PG
 from .constants import PagesAttributes as PA
 from .errors import PdfReadError
 from .generic import ArrayObject, BooleanObject, ByteStringObject, Destination, DictionaryObject, EncodedStreamObject, Field, Fit, FloatObject, IndirectObject, NameObject, NullObject, NumberObject, PdfObject, TextStringObject, TreeObject, ViewerPreferences, create_string_object
+from .generic._base import _cached_name_object
 from .types import OutlineType, PagemodeType
 from .xmp import XmpInformation
 
@@ -436,6 +437,48 @@ class PdfDocCommon:
         """
         pass
 
+    def _flatten(self, pages: Union[None, DictionaryObject, PageObject]=None, inherit: Optional[Dict[str, Any]]=None, indirect_reference: Optional[IndirectObject]=None) -> None:
+        inheritable_page_attributes = (_cached_name_object(PG.RESOURCES), _cached_name_object(PG.MEDIABOX), _cached_name_object(PG.CROPBOX), _cached_name_object(PG.ROTATE))
+        if inherit is None:
+            inherit = {}
+        if pages is None:
+            catalog = self.root_object
+            pages = catalog['/Pages'].get_object()
+            assert isinstance(pages, DictionaryObject)
+            self.flattened_pages = []
+        assert self.flattened_pages is not None
+        visited = set()
+        stack: List[Tuple[DictionaryObject, Optional[IndirectObject]]] = [(pages, indirect_reference)]
+        while stack:
+            node, node_reference = stack.pop()
+            if PA.TYPE in node:
+                t = cast(str, node[PA.TYPE])
+            elif PA.KIDS not in node:
+                t = '/Page'
+            else:
+                t = '/Pages'
+            if t == '/Pages':
+                if id(node) in visited:
+                    logger_warning('Loop detected in /Pages tree', __name__)
+                    continue
+                visited.add(id(node))
+                for attr in inheritable_page_attributes:
+                    if attr in node:
+                        inherit[attr] = node[attr]
+                kids: List[Tuple[DictionaryObject, Optional[IndirectObject]]] = []
+                for page in cast(ArrayObject, node[PA.KIDS]):
+                    obj = page.get_object()
+                    if obj:
+                        kids.append((obj, page if isinstance(page, IndirectObject) else None))
+                stack.extend(reversed(kids))
+            elif t == '/Page':
+                for attr_in, value in list(inherit.items()):
+                    if attr_in not in node:
+                        node[attr_in] = value
+                page_obj = PageObject(self, node_reference)
+                page_obj.update(node)
+                self.flattened_pages.append(page_obj)
+
     def remove_page(self, page: Union[int, PageObject, IndirectObject], clean: bool=False) -> None:
         """
         Remove page from pages list.
@@ -465,7 +465,25 @@ class PageObject(DictionaryObject):
         However, it is possible that this function will perform no action if
         content stream compression becomes "automatic".
         """
-        pass
+        content = self.get_contents()
+        if content is not None:
+            self._set_compressed_contents(content, content.flate_encode(level))
+
+    def _set_compressed_contents(self, content: ContentStream, content_obj: EncodedStreamObject) -> None:
+        """
+        Store the result of compressing ``content`` in place of the page contents.
+
+        Args:
+            content: the content stream returned by get_contents.
+            content_obj: the compressed version of ``content``.
+        """
+        try:
+            content.indirect_reference.pdf._objects[content.indirect_reference.idnum - 1] = content_obj
+        except AttributeError:
+            if self.indirect_reference is not None and hasattr(self.indirect_reference.pdf, '_add_object'):
+                self.replace_contents(content_obj)
+            else:
+                raise ValueError('Page must be part of a PdfWriter')
 
     @property
     def page_number(self) -> Optional[int]:
@@ -57,10 +57,56 @@ A       Uppercase letters (A to Z for the first 26 pages,
 a       Lowercase letters (a to z for the first 26 pages,
                            aa to zz for the next 26, and so on)
 """
-from typing import Iterator, List, Optional, Tuple, cast
+from typing import List, Optional, Tuple, cast
 from ._protocols import PdfCommonDocProtocol
 from ._utils import logger_warning
 from .generic import ArrayObject, DictionaryObject, NullObject, NumberObject
+_ROMAN_NUMERALS = ((1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'), (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'), (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I'))
+_UPPERCASE_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def number2uppercase_roman_numeral(num: int) -> str:
+    numerals = []
+    for value, numeral in _ROMAN_NUMERALS:
+        count, num = divmod(num, value)
+        numerals.append(numeral * count)
+        if num <= 0:
+            break
+    return ''.join(numerals)
+
+def number2lowercase_roman_numeral(number: int) -> str:
+    return number2uppercase_roman_numeral(number).lower()
+
+def number2uppercase_letter(number: int) -> str:
+    if number <= 0:
+        raise ValueError('Expecting a positive number')
+    letters = []
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters.append(_UPPERCASE_LETTERS[remainder])
+    return ''.join(reversed(letters))
+
+def number2lowercase_letter(number: int) -> str:
+    return number2uppercase_letter(number).lower()
+
+def get_label_from_nums(dictionary_object: DictionaryObject, index: int) -> str:
+    nums = cast(ArrayObject, dictionary_object['/Nums'])
+    i = 0
+    value = None
+    start_index = 0
+    while i < len(nums):
+        start_index = nums[i]
+        value = nums[i + 1].get_object()
+        if i + 2 == len(nums):
+            break
+        if nums[i + 2] > index:
+            break
+        i += 2
+    m = {None: lambda n: '', '/D': lambda n: str(n), '/R': number2uppercase_roman_numeral, '/r': number2lowercase_roman_numeral, '/A': number2uppercase_letter, '/a': number2lowercase_letter}
+    if not isinstance(value, dict):
+        return str(index + 1)
+    start = value.get('/St', 1)
+    prefix = value.get('/P', '')
+    return prefix + m[value.get('/S')](index - start_index + start)
 
 def index2label(reader: PdfCommonDocProtocol, index: int) -> str:
     """
@@ -73,7 +119,30 @@ def index2label(reader: PdfCommonDocProtocol, index: int) -> str:
     Returns:
         The label of the page, e.g. "iv" or "4".
     """
-    pass
+    root = cast(DictionaryObject, reader.root_object)
+    if '/PageLabels' not in root:
+        return str(index + 1)
+    number_tree = cast(DictionaryObject, root['/PageLabels'].get_object())
+    if '/Nums' in number_tree:
+        return get_label_from_nums(number_tree, index)
+    if '/Kids' in number_tree and (not isinstance(number_tree['/Kids'], NullObject)):
+        level = 0
+        while level < 100:
+            kids = cast(List[DictionaryObject], number_tree['/Kids'])
+            for kid in kids:
+                limits = cast(List[int], kid['/Limits'])
+                if limits[0] <= index <= limits[1]:
+                    if kid.get('/Kids', None) is not None:
+                        level += 1
+                        if level == 100:
+                            raise NotImplementedError('Too deep nesting is not supported.')
+                        number_tree = kid
+                        break
+                    return get_label_from_nums(kid, index)
+            else:
+                break
+    logger_warning(f'Could not reliably determine page label for {index}.', __name__)
+    return str(index + 1)
 
 def nums_insert(key: NumberObject, value: DictionaryObject, nums: ArrayObject) -> None:
     """
@@ -1,17 +1,25 @@
 import os
 import re
-from io import BytesIO, UnsupportedOperation
+import sys
+from collections import OrderedDict
+from io import DEFAULT_BUFFER_SIZE, BytesIO, UnsupportedOperation
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union, cast
 from ._doc_common import PdfDocCommon, convert_to_int
 from ._encryption import Encryption, PasswordType
 from ._page import PageObject
 from ._utils import StrByteType, StreamType, b_, logger_warning, read_non_whitespace, read_previous_line, read_until_whitespace, skip_over_comment, skip_over_whitespace
 from .constants import TrailerKeys as TK
-from .errors import EmptyFileError, FileNotDecryptedError, PdfReadError, PdfStreamError, WrongPasswordError
+from .errors import STREAM_TRUNCATED_PREMATURELY, EmptyFileError, FileNotDecryptedError, PdfReadError, PdfStreamError, WrongPasswordError
 from .generic import ArrayObject, ContentStream, DecodedStreamObject, DictionaryObject, EncodedStreamObject, IndirectObject, NameObject, NullObject, NumberObject, PdfObject, TextStringObject, read_object
 from .xmp import XmpInformation
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    cached_property = property
+_EOF_MARKER = b'%%EOF'
+_STARTXREF_RE = re.compile(b'startxref(\\s*?)(\\d+)\\s*\\Z')
 
 class PdfReader(PdfDocCommon):
     """
@@ -30,16 +38,23 @@ class PdfReader(PdfDocCommon):
         password: Decrypt PDF file at initialization. If the
             password is None, the file will not be decrypted.
             Defaults to ``None``.
+        cache_size: Maximum number of resolved indirect objects kept in
+            memory. The least recently used object is dropped once the limit
+            is exceeded and parsed again on its next access, so changes made
+            to it are lost. ``None`` keeps every object.
+            Defaults to ``None``.
     """
 
-    def __init__(self, stream: Union[StrByteType, Path], strict: bool=False, password: Union[None, str, bytes]=None) -> None:
+    def __init__(self, stream: Union[StrByteType, Path], strict: bool=False, password: Union[None, str, bytes]=None, cache_size: Optional[int]=None) -> None:
         self.strict = strict
         self.flattened_pages: Optional[List[PageObject]] = None
-        self.resolved_objects: Dict[Tuple[Any, Any], Optional[PdfObject]] = {}
+        self._cache_size = cache_size
+        self.resolved_objects: Dict[Tuple[Any, Any], Optional[PdfObject]] = {} if cache_size is None else OrderedDict()
         self.xref_index = 0
         self.xref: Dict[int, Dict[Any, Any]] = {}
         self.xref_free_entry: Dict[int, Dict[Any, Any]] = {}
         self.xref_objStm: Dict[int, Tuple[Any, Any]] = {}
+        self._objstm_prefetched: Set[int] = set()
         self.trailer = DictionaryObject()
         self._page_id2num: Optional[Dict[Any, Any]] = None
         if hasattr(stream, 'mode') and 'b' not in stream.mode:
@@ -74,14 +89,24 @@ class PdfReader(PdfDocCommon):
 
     def close(self) -> None:
         """Close the stream if opened in __init__ and clear memory."""
-        pass
-
-    @property
+        if self._stream_opened:
+            self.stream.close()
+        self.flattened_pages = []
+        self.resolved_objects = {} if self._cache_size is None else OrderedDict()
+        self.trailer = DictionaryObject()
+        self.xref = {}
+        self.xref_free_entry = {}
+        self.xref_objStm = {}
+        self._objstm_prefetched = set()
+        for name in ('root_object', '_info', '_ID', 'pdf_header'):
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def root_object(self) -> DictionaryObject:
         """Provide access to "/Root". Standardized with PdfWriter."""
-        pass
+        return cast(DictionaryObject, self.trailer[TK.ROOT].get_object())
 
-    @property
+    @cached_property
     def _info(self) -> Optional[DictionaryObject]:
         """
         Provide access to "/Info". Standardized with PdfWriter.
@@ -89,9 +114,15 @@ class PdfReader(PdfDocCommon):
         Returns:
             /Info Dictionary; None if the entry does not exist
         """
-        pass
-
-    @property
+        info = self.trailer.get(TK.INFO, None)
+        if info is None:
+            return None
+        info = info.get_object()
+        if info is None:
+            raise PdfReadError('Trailer not found or does not point to document information directory')
+        return cast(DictionaryObject, info)
+
+    @cached_property
     def _ID(self) -> Optional[ArrayObject]:
         """
         Provide access to "/ID". Standardized with PdfWriter.
@@ -99,7 +130,8 @@ class PdfReader(PdfDocCommon):
         Returns:
             /ID array; None if the entry does not exist
         """
-        pass
+        id = self.trailer.get(TK.ID, None)
+        return None if id is None else cast(ArrayObject, id.get_object())
 
     def _repr_mimebundle_(self, include: Union[None, Iterable[str]]=None, exclude: Union[None, Iterable[str]]=None) -> Dict[str, Any]:
         """
@@ -112,7 +144,7 @@ class PdfReader(PdfDocCommon):
         """
         pass
 
-    @property
+    @cached_property
     def pdf_header(self) -> str:
         """
         The first 8 bytes of the file.
@@ -120,12 +152,20 @@ class PdfReader(PdfDocCommon):
         This is typically something like ``'%PDF-1.6'`` and can be used to
         detect if the file is actually a PDF file and which version it is.
         """
-        pass
+        loc = self.stream.tell()
+        self.stream.seek(0, 0)
+        pdf_file_version = self.stream.read(8).decode('utf-8', 'backslashreplace')
+        self.stream.seek(loc, 0)
+        return pdf_file_version
 
     @property
     def xmp_metadata(self) -> Optional[XmpInformation]:
         """XMP (Extensible Metadata Platform) data."""
-        pass
+        try:
+            self._override_encryption = True
+            return cast(XmpInformation, self.trailer['/Root'].xmp_metadata)
+        finally:
+            self._override_encryption = False
 
     def _get_page(self, page_number: int) -> PageObject:
         """
@@ -138,7 +178,10 @@ class PdfReader(PdfDocCommon):
         Returns:
             A :class:`PageObject<pypdf._page.PageObject>` instance.
         """
-        pass
+        if self.flattened_pages is None:
+            self._flatten()
+        assert self.flattened_pages is not None, 'hint for mypy'
+        return self.flattened_pages[page_number]
 
     def _get_page_number_by_indirect(self, indirect_reference: Union[None, int, NullObject, IndirectObject]) -> Optional[int]:
         """
@@ -152,6 +195,76 @@ class PdfReader(PdfDocCommon):
         """
         pass
 
+    def cache_get_indirect_object(self, generation: int, idnum: int) -> Optional[PdfObject]:
+        if self._cache_size is None:
+            return self.resolved_objects.get((generation, idnum))
+        resolved_objects = cast('OrderedDict[Tuple[Any, Any], Optional[PdfObject]]', self.resolved_objects)
+        try:
+            resolved_objects.move_to_end((generation, idnum))
+        except KeyError:
+            return None
+        return resolved_objects[generation, idnum]
+
+    def cache_indirect_object(self, generation: int, idnum: int, obj: Optional[PdfObject]) -> Optional[PdfObject]:
+        if (generation, idnum) in self.resolved_objects:
+            msg = f'Overwriting cache for {generation} {idnum}'
+            if self.strict:
+                raise PdfReadError(msg)
+            logger_warning(msg, __name__)
+        self.resolved_objects[generation, idnum] = obj
+        if self._cache_size is not None and len(self.resolved_objects) > self._cache_size:
+            cast('OrderedDict[Tuple[Any, Any], Optional[PdfObject]]', self.resolved_objects).popitem(last=False)
+        if obj is not None:
+            obj.indirect_reference = IndirectObject(idnum, generation, self)
+        return obj
+
+    def _prefetch_object_stream(self, stmnum: int) -> None:
+        """
+        Parse all the objects of an object stream into the cache in one pass.
+
+        Resolving the objects of an object stream one at a time rescans the
+        stream header for each of them, which is quadratic when most of them
+        end up being used, as when a document is cloned or merged. Objects
+        already cached or superseded by a later revision are left untouched.
+        Nothing is done for a bounded cache, where prefetching would only
+        evict objects still in use.
+
+        Args:
+            stmnum: The object number of the object stream.
+        """
+        if self._cache_size is not None or stmnum in self._objstm_prefetched:
+            return
+        self._objstm_prefetched.add(stmnum)
+        obj_stm = IndirectObject(stmnum, 0, self).get_object()
+        if not isinstance(obj_stm, (DecodedStreamObject, EncodedStreamObject)) or obj_stm.get('/Type') != '/ObjStm':
+            return
+        stream_data = BytesIO(b_(obj_stm.get_data()))
+        first = cast(int, obj_stm['/First'])
+        offsets = []
+        try:
+            for _ in range(cast(int, obj_stm['/N'])):
+                read_non_whitespace(stream_data)
+                stream_data.seek(-1, 1)
+                objnum = int(NumberObject.read_from_stream(stream_data))
+                read_non_whitespace(stream_data)
+                stream_data.seek(-1, 1)
+                offsets.append((objnum, int(NumberObject.read_from_stream(stream_data))))
+        except (PdfReadError, PdfStreamError, ValueError):
+            return
+        for objnum, offset in offsets:
+            location = self.xref_objStm.get(objnum)
+            if location is None or location[0] != stmnum or (0, objnum) in self.resolved_objects:
+                continue
+            stream_data.seek(first + offset, 0)
+            read_non_whitespace(stream_data)
+            stream_data.seek(-1, 1)
+            try:
+                obj = read_object(stream_data, self)
+            except PdfStreamError:
+                # left to the lazy path, which reports the error
+                continue
+            self.cache_indirect_object(0, objnum, obj)
+
     def _basic_validation(self, stream: StreamType) -> None:
         """Ensure file is not empty. Read at most 5 bytes."""
         pass
@@ -164,7 +277,28 @@ class PdfReader(PdfDocCommon):
         the file. Hence for standard-compliant PDF documents this function will
         read only the last part (DEFAULT_BUFFER_SIZE).
         """
-        pass
+        stream.seek(0, os.SEEK_END)
+        end = stream.tell()
+        to_read = DEFAULT_BUFFER_SIZE
+        while True:
+            start = max(end - to_read, 0)
+            stream.seek(start, os.SEEK_SET)
+            tail = stream.read(end - start)
+            idx = tail.rfind(_EOF_MARKER)
+            while idx > 0 and tail[idx - 1] not in b'\r\n':
+                idx = tail.rfind(_EOF_MARKER, 0, idx)
+            if idx == 0 and start > 0:
+                idx = -1
+            if idx >= 0:
+                stream.seek(start + len(tail[:idx].rstrip(b'\r\n')), os.SEEK_SET)
+                return
+            if start == 0:
+                break
+            to_read *= 2
+        if self.strict:
+            raise PdfReadError('EOF marker not found')
+        logger_warning('EOF marker not found', __name__)
+        raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
 
     def _find_startxref_pos(self, stream: StreamType) -> int:
         """
@@ -176,7 +310,15 @@ class PdfReader(PdfDocCommon):
         Returns:
             The bytes offset
         """
-        pass
+        end = stream.tell()
+        start = max(end - DEFAULT_BUFFER_SIZE, 0)
+        stream.seek(start, os.SEEK_SET)
+        match = _STARTXREF_RE.search(stream.read(end - start))
+        if match is None:
+            raise PdfReadError('startxref not found')
+        if b'\r' not in match.group(1) and b'\n' not in match.group(1):
+            logger_warning('startxref on same line as offset', __name__)
+        return int(match.group(2))
 
     @staticmethod
     def _get_xref_issues(stream: StreamType, startxref: int) -> int:
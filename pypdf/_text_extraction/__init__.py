@@ -65,13 +65,17 @@ def set_custom_rtl(
 
 
 def mult(m: List[float], n: List[float]) -> List[float]:
+    # unpacking the affine a/b/c/d/e/f coefficients once is cheaper than
+    # indexing both lists sixteen times
+    m0, m1, m2, m3, m4, m5 = m
+    n0, n1, n2, n3, n4, n5 = n
     return [
-        m[0] * n[0] + m[1] * n[2],
-        m[0] * n[1] + m[1] * n[3],
-        m[2] * n[0] + m[3] * n[2],
-        m[2] * n[1] + m[3] * n[3],
-        m[4] * n[0] + m[5] * n[2] + n[4],
-        m[4] * n[1] + m[5] * n[3] + n[5],
+        m0 * n0 + m1 * n2,
+        m0 * n1 + m1 * n3,
+        m2 * n0 + m3 * n2,
+        m2 * n1 + m3 * n3,
+        m4 * n0 + m5 * n2 + n4,
+        m4 * n1 + m5 * n3 + n5,
     ]
 
 
@@ -1,14 +1,15 @@
 """Extract PDF text preserving the layout of the source PDF"""
 import sys
-from itertools import groupby
+from collections import defaultdict
 from math import ceil
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
 from ..._utils import logger_warning
 from .. import LAYOUT_NEW_BT_GROUP_SPACE_WIDTHS
 from ._font import Font
 from ._text_state_manager import TextStateManager
 from ._text_state_params import TextStateParams
+_CONTROL_CHARS_TO_SPACE = str.maketrans(dict.fromkeys(range(14, 32), ' '))
 if sys.version_info >= (3, 8):
     from typing import Literal, TypedDict
 else:
@@ -47,7 +48,7 @@ def bt_group(tj_op: TextStateParams, rendered_text: str, dispaced_tx: float) ->
         rendered_text (str): rendered text
         dispaced_tx (float): x coordinate of last character in BTGroup
     """
-    pass
+    return BTGroup(tx=tj_op.tx, ty=tj_op.ty, font_size=tj_op.font_size, font_height=tj_op.font_height, text=rendered_text, displaced_tx=dispaced_tx, flip_sort=-1 if tj_op.flip_vertical else 1)
 
 def recurs_to_target_op(ops: Iterator[Tuple[List[Any], bytes]], text_state_mgr: TextStateManager, end_target: Literal[b'Q', b'ET'], fonts: Dict[str, Font], strip_rotated: bool=True) -> Tuple[List[BTGroup], List[TextStateParams]]:
     """
@@ -63,7 +64,94 @@ def recurs_to_target_op(ops: Iterator[Tuple[List[Any], bytes]], text_state_mgr:
     Returns:
         tuple: list of BTGroup dicts + list of TextStateParams dataclass instances.
     """
-    pass
+    bt_groups: List[BTGroup] = []
+    tj_ops: List[TextStateParams] = []
+    if end_target == b'Q':
+        text_state_mgr.add_q()
+    while True:
+        try:
+            operands, op = next(ops)
+        except StopIteration:
+            return (bt_groups, tj_ops)
+        if op == end_target:
+            if op == b'Q':
+                text_state_mgr.remove_q()
+            if op == b'ET':
+                if not tj_ops:
+                    return (bt_groups, tj_ops)
+                _text = ''
+                bt_idx = 0
+                last_displaced_tx = tj_ops[bt_idx].displaced_tx
+                last_ty = tj_ops[bt_idx].ty
+                new_group_widths = LAYOUT_NEW_BT_GROUP_SPACE_WIDTHS
+                for _idx, _tj in enumerate(tj_ops):
+                    if strip_rotated and _tj.rotated:
+                        continue
+                    tx, ty, space_tx = (_tj.tx, _tj.ty, _tj.space_tx)
+                    if abs(ty - last_ty) > _tj.font_height:
+                        if _text.strip():
+                            bt_groups.append(bt_group(tj_ops[bt_idx], _text, last_displaced_tx))
+                        bt_idx = _idx
+                        _text = ''
+                    if last_displaced_tx - tx > space_tx * new_group_widths:
+                        if _text.strip():
+                            bt_groups.append(bt_group(tj_ops[bt_idx], _text, last_displaced_tx))
+                        bt_idx = _idx
+                        last_displaced_tx = _tj.displaced_tx
+                        _text = ''
+                    if space_tx and _idx != bt_idx:
+                        _text = _text + ' ' * int(round(tx - last_displaced_tx, 3) // space_tx) + _tj.txt
+                    else:
+                        _text = _text + _tj.txt
+                    last_ty = ty
+                    last_displaced_tx = _tj.displaced_tx
+                if _text:
+                    bt_groups.append(bt_group(tj_ops[bt_idx], _text, last_displaced_tx))
+                text_state_mgr.reset_tm()
+            return (bt_groups, tj_ops)
+        if op == b'q':
+            bts, tjs = recurs_to_target_op(ops, text_state_mgr, b'Q', fonts, strip_rotated)
+            bt_groups.extend(bts)
+            tj_ops.extend(tjs)
+        elif op == b'cm':
+            text_state_mgr.add_cm(*operands)
+        elif op == b'BT':
+            bts, tjs = recurs_to_target_op(ops, text_state_mgr, b'ET', fonts, strip_rotated)
+            bt_groups.extend(bts)
+            tj_ops.extend(tjs)
+        elif op == b'Tj':
+            tj_ops.append(text_state_mgr.text_state_params(operands[0]))
+        elif op == b'TJ':
+            _tj = text_state_mgr.text_state_params()
+            for tj_op in operands[0]:
+                if isinstance(tj_op, bytes):
+                    _tj = text_state_mgr.text_state_params(tj_op)
+                    tj_ops.append(_tj)
+                else:
+                    text_state_mgr.add_trm(_tj.displacement_matrix(TD_offset=tj_op))
+        elif op == b"'":
+            text_state_mgr.reset_trm()
+            text_state_mgr.add_tm([0, -text_state_mgr.TL])
+            tj_ops.append(text_state_mgr.text_state_params(operands[0]))
+        elif op == b'"':
+            text_state_mgr.reset_trm()
+            text_state_mgr.set_state_param(b'Tw', operands[0])
+            text_state_mgr.set_state_param(b'Tc', operands[1])
+            text_state_mgr.add_tm([0, -text_state_mgr.TL])
+            tj_ops.append(text_state_mgr.text_state_params(operands[2]))
+        elif op in (b'Td', b'Tm', b'TD', b'T*'):
+            text_state_mgr.reset_trm()
+            if op == b'Tm':
+                text_state_mgr.reset_tm()
+            elif op == b'TD':
+                text_state_mgr.set_state_param(b'TL', -operands[1])
+            elif op == b'T*':
+                operands = [0, -text_state_mgr.TL]
+            text_state_mgr.add_tm(operands)
+        elif op == b'Tf':
+            text_state_mgr.set_font(fonts[operands[0]], operands[1])
+        else:
+            text_state_mgr.set_state_param(op, operands)
 
 def y_coordinate_groups(bt_groups: List[BTGroup], debug_path: Optional[Path]=None) -> Dict[int, List[BTGroup]]:
     """
@@ -77,7 +165,27 @@ def y_coordinate_groups(bt_groups: List[BTGroup], debug_path: Optional[Path]=Non
         Dict[int, List[BTGroup]]: dict of lists of text rendered by each BT operator
             keyed by y coordinate
     """
-    pass
+    rows: DefaultDict[int, List[BTGroup]] = defaultdict(list)
+    for bt_grp in bt_groups:
+        rows[int(bt_grp['ty'] * bt_grp['flip_sort'])].append(bt_grp)
+    ty_groups = {ty: sorted(grp, key=lambda x: x['tx']) for ty, grp in rows.items()}
+    last_ty = next(iter(ty_groups))
+    last_txs = {int(_t['tx']) for _t in ty_groups[last_ty] if _t['text'].strip()}
+    for ty in list(ty_groups)[1:]:
+        fsz = min((ty_groups[_y][0]['font_height'] for _y in (ty, last_ty)))
+        txs = {int(_t['tx']) for _t in ty_groups[ty] if _t['text'].strip()}
+        no_text_overlap = not txs & last_txs
+        offset_less_than_font_height = abs(ty - last_ty) < fsz
+        if no_text_overlap and offset_less_than_font_height:
+            ty_groups[last_ty] = sorted(ty_groups.pop(ty) + ty_groups[last_ty], key=lambda x: x['tx'])
+            last_txs |= txs
+        else:
+            last_ty = ty
+            last_txs = txs
+    if debug_path:
+        import json
+        debug_path.joinpath('bt_groups.json').write_text(json.dumps(ty_groups, indent=2, default=str), 'utf-8')
+    return ty_groups
 
 def text_show_operations(ops: Iterator[Tuple[List[Any], bytes]], fonts: Dict[str, Font], strip_rotated: bool=True, debug_path: Optional[Path]=None) -> List[BTGroup]:
     """
@@ -92,7 +200,36 @@ def text_show_operations(ops: Iterator[Tuple[List[Any], bytes]], fonts: Dict[str
     Returns:
         List[BTGroup]: list of dicts of text rendered by each BT operator
     """
-    pass
+    state_mgr = TextStateManager()
+    debug = bool(debug_path)
+    bt_groups: List[BTGroup] = []
+    tj_debug: List[TextStateParams] = []
+    try:
+        warned_rotation = False
+        while True:
+            operands, op = next(ops)
+            if op in (b'BT', b'q'):
+                bts, tjs = recurs_to_target_op(ops, state_mgr, b'ET' if op == b'BT' else b'Q', fonts, strip_rotated)
+                if not warned_rotation and any((tj.rotated for tj in tjs)):
+                    warned_rotation = True
+                    if strip_rotated:
+                        logger_warning('Rotated text discovered. Output will be incomplete.', __name__)
+                    else:
+                        logger_warning('Rotated text discovered. Layout will be degraded.', __name__)
+                bt_groups.extend(bts)
+                if debug:
+                    tj_debug.extend(tjs)
+            else:
+                state_mgr.set_state_param(op, operands)
+    except StopIteration:
+        pass
+    min_x = min((x['tx'] for x in bt_groups), default=0.0)
+    bt_groups = [dict(ogrp, tx=ogrp['tx'] - min_x, displaced_tx=ogrp['displaced_tx'] - min_x) for ogrp in sorted(bt_groups, key=lambda x: (x['ty'] * x['flip_sort'], -x['tx']), reverse=True)]  # type: ignore[misc]
+    if debug_path:
+        import json
+        debug_path.joinpath('bts.json').write_text(json.dumps(bt_groups, indent=2, default=str), 'utf-8')
+        debug_path.joinpath('tjs.json').write_text(json.dumps(tj_debug, indent=2, default=lambda x: getattr(x, 'to_dict', str)(x)), 'utf-8')
+    return bt_groups
 
 def fixed_char_width(bt_groups: List[BTGroup], scale_weight: float=1.25) -> float:
     """
@@ -106,7 +243,12 @@ def fixed_char_width(bt_groups: List[BTGroup], scale_weight: float=1.25) -> floa
     Returns:
         float: fixed character width
     """
-    pass
+    weighted_width = 0.0
+    total_weight = 0.0
+    for _bt in bt_groups:
+        weighted_width += _bt['displaced_tx'] - _bt['tx']
+        total_weight += len(_bt['text']) * scale_weight
+    return weighted_width / total_weight
 
 def fixed_width_page(ty_groups: Dict[int, List[BTGroup]], char_width: float, space_vertically: bool) -> str:
     """
@@ -121,4 +263,26 @@ def fixed_width_page(ty_groups: Dict[int, List[BTGroup]], char_width: float, spa
         str: page text in a fixed width format that closely adheres to the rendered
             layout in the source pdf.
     """
-    pass
\ No newline at end of file
+    lines: List[str] = []
+    last_y_coord = 0
+    for y_coord, line_data in ty_groups.items():
+        if space_vertically and lines:
+            blank_lines = int(abs(y_coord - last_y_coord) / line_data[0]['font_height']) - 1
+            lines.extend([''] * blank_lines)
+        parts: List[str] = []
+        line_len = 0
+        last_disp = 0.0
+        for bt_op in line_data:
+            offset = int(bt_op['tx'] // char_width)
+            spaces = (offset - line_len) * (ceil(last_disp) < int(bt_op['tx']))
+            if spaces > 0:
+                parts.append(' ' * spaces)
+                line_len += spaces
+            parts.append(bt_op['text'])
+            line_len += len(bt_op['text'])
+            last_disp = bt_op['displaced_tx']
+        line = ''.join(parts)
+        if line.strip() or lines:
+            lines.append(line.translate(_CONTROL_CHARS_TO_SPACE))
+        last_y_coord = y_coord
+    return '\n'.join((ln.rstrip() for ln in lines if space_vertically or ln.strip()))
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Font constants and classes for "layout" mode text operations"""
 from dataclasses import dataclass, field
-from typing import Any, Dict, Sequence, Union
+from typing import Any, Dict, Sequence, Tuple, Union
 from ...generic import IndirectObject
 from ._font_widths import STANDARD_WIDTHS
 
@@ -24,6 +24,9 @@ class Font:
     width_map: Dict[str, int] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
+        self._word_widths: Dict[str, float] = {}
+        self._decoded_text: Dict[bytes, str] = {}
+        self._space_txs: Dict[Tuple[float, float, float, float], float] = {}
         if isinstance(self.encoding, dict) and '/Widths' in self.font_dictionary:
             first_char = self.font_dictionary.get('/FirstChar', 0)
             self.width_map = {self.encoding.get(idx + first_char, chr(idx + first_char)): width for idx, width in enumerate(self.font_dictionary['/Widths'])}
@@ -58,9 +61,32 @@ class Font:
 
     def word_width(self, word: str) -> float:
         """Sum of character widths specified in PDF font for the supplied word"""
-        pass
+        try:
+            return self._word_widths[word]
+        except KeyError:
+            width = sum([self.width_map.get(char, self.space_width * 2) for char in word], 0.0)
+            self._word_widths[word] = width
+            return width
+
+    def space_tx(self, font_size: float, Tc: float, Tw: float, Tz: float) -> float:
+        """
+        Horizontal displacement of a space character for the supplied text state.
+
+        Falls back to twice the font's space_width when the space glyph has no
+        usable width.
+        """
+        key = (font_size, Tc, Tw, Tz)
+        try:
+            return self._space_txs[key]
+        except KeyError:
+            scale = Tz / 100.0
+            space_tx = round((font_size * (self.word_width(' ') / 1000.0) + Tc + Tw) * scale, 3)
+            if space_tx < 1e-06:
+                space_tx = round((font_size * ((self.word_width('') + self.space_width * 2) / 1000.0) + Tc) * scale, 3)
+            self._space_txs[key] = space_tx
+            return space_tx
 
     @staticmethod
     def to_dict(font_instance: 'Font') -> Dict[str, Any]:
         """Dataclass to dict for json.dumps serialization."""
-        pass
\ No newline at end of file
+        return {k: getattr(font_instance, k) for k in font_instance.__dataclass_fields__}
\ No newline at end of file
@@ -1,21 +1,45 @@
 """manage the PDF transform stack during "layout" mode text extraction"""
-from collections import ChainMap, Counter
-from typing import Any, Dict, List, MutableMapping, Union
-from typing import ChainMap as ChainMapType
+from collections import Counter
+from typing import Any, Dict, List, Union
 from typing import Counter as CounterType
 from ...errors import PdfReadError
-from .. import mult
 from ._font import Font
 from ._text_state_params import TextStateParams
-TextStateManagerChainMapType = ChainMapType[Union[int, str], Union[float, bool]]
-TextStateManagerDictType = MutableMapping[Union[int, str], Union[float, bool]]
+IS_TEXT = 1
+IS_RENDER = 2
+
+class Xform:
+    """
+    A single cm/tm/trm transformation matrix on the transform stack.
+
+    Attributes:
+        a, b, c, d, e, f (float): matrix params
+        flags (int): bitmask of IS_TEXT (set by tm and trm transforms) and
+            IS_RENDER (set by trm transforms)
+    """
+    __slots__ = ('a', 'b', 'c', 'd', 'e', 'f', 'flags')
+
+    def __init__(self, a: float=1.0, b: float=0.0, c: float=0.0, d: float=1.0, e: float=0.0, f: float=0.0, flags: int=0) -> None:
+        self.a = float(a)
+        self.b = float(b)
+        self.c = float(c)
+        self.d = float(d)
+        self.e = float(e)
+        self.f = float(f)
+        self.flags = flags
+
+    def matrix(self) -> List[float]:
+        """The a/b/c/d/e/f matrix params as a list"""
+        return [self.a, self.b, self.c, self.d, self.e, self.f]
+TransformStackType = List[Xform]
 
 class TextStateManager:
     """
     Tracks the current text state including cm/tm/trm transformation matrices.
 
     Attributes:
-        transform_stack (ChainMap): ChainMap of cm/tm transformation matrices
+        transform_stack (List[Xform]): cm/tm/trm transformation matrices, most
+            recent last
         q_queue (Counter[int]): Counter of q operators
         q_depth (List[int]): list of q operator nesting levels
         Tc (float): character spacing
@@ -28,7 +52,7 @@ class TextStateManager:
     """
 
     def __init__(self) -> None:
-        self.transform_stack: TextStateManagerChainMapType = ChainMap(self.new_transform())
+        self.transform_stack: TransformStackType = [self.new_transform()]
         self.q_queue: CounterType[int] = Counter()
         self.q_depth = [0]
         self.Tc: float = 0.0
@@ -49,7 +73,9 @@ class TextStateManager:
             value (float | List[Any]): new parameter value. If a list,
                 value[0] is used.
         """
-        pass
+        if op not in (b'Tc', b'Tz', b'Tw', b'TL', b'Ts'):
+            return
+        self.__setattr__(op.decode(), value[0] if isinstance(value, list) else value)
 
     def set_font(self, font: Font, size: float) -> None:
         """
@@ -59,7 +85,8 @@ class TextStateManager:
             font (Font): a layout mode Font
             size (float): font size
         """
-        pass
+        self.font = font
+        self.font_size = size
 
     def text_state_params(self, value: Union[bytes, str]='') -> TextStateParams:
         """
@@ -75,51 +102,88 @@ class TextStateManager:
         Returns:
             TextStateParams: current text state parameters
         """
-        pass
+        if not isinstance(self.font, Font):
+            raise PdfReadError('font not set: is PDF missing a Tf operator?')
+        if isinstance(value, bytes):
+            try:
+                txt = self.font._decoded_text[value]
+            except KeyError:
+                try:
+                    if isinstance(self.font.encoding, str):
+                        txt = value.decode(self.font.encoding, 'surrogatepass')
+                    else:
+                        txt = ''.join((self.font.encoding[x] if x in self.font.encoding else bytes((x,)).decode() for x in value))
+                except (UnicodeEncodeError, UnicodeDecodeError):
+                    txt = value.decode('utf-8', 'replace')
+                txt = ''.join((self.font.char_map[x] if x in self.font.char_map else x for x in txt))
+                self.font._decoded_text[value] = txt
+        else:
+            txt = value
+        return TextStateParams(txt, self.font, self.font_size, self.Tc, self.Tw, self.Tz, self.TL, self.Ts, self.effective_transform)
 
     @staticmethod
     def raw_transform(_a: float=1.0, _b: float=0.0, _c: float=0.0, _d: float=1.0, _e: float=0.0, _f: float=0.0) -> Dict[int, float]:
         """Only a/b/c/d/e/f matrix params"""
-        pass
+        return dict(zip(range(6), map(float, (_a, _b, _c, _d, _e, _f))))
 
     @staticmethod
-    def new_transform(_a: float=1.0, _b: float=0.0, _c: float=0.0, _d: float=1.0, _e: float=0.0, _f: float=0.0, is_text: bool=False, is_render: bool=False) -> TextStateManagerDictType:
-        """Standard a/b/c/d/e/f matrix params + 'is_text' and 'is_render' keys"""
-        pass
-
-    def reset_tm(self) -> TextStateManagerChainMapType:
-        """Clear all transforms from chainmap having is_text==True or is_render==True"""
-        pass
-
-    def reset_trm(self) -> TextStateManagerChainMapType:
-        """Clear all transforms from chainmap having is_render==True"""
-        pass
-
-    def remove_q(self) -> TextStateManagerChainMapType:
+    def new_transform(_a: float=1.0, _b: float=0.0, _c: float=0.0, _d: float=1.0, _e: float=0.0, _f: float=0.0, is_text: bool=False, is_render: bool=False) -> Xform:
+        """Standard a/b/c/d/e/f matrix params + IS_TEXT and IS_RENDER flags"""
+        return Xform(_a, _b, _c, _d, _e, _f, IS_TEXT * is_text | IS_RENDER * is_render)
+
+    def reset_tm(self) -> TransformStackType:
+        """Clear all transforms from the stack having IS_TEXT or IS_RENDER set"""
+        while self.transform_stack[-1].flags:
+            self.transform_stack.pop()
+        return self.transform_stack
+
+    def reset_trm(self) -> TransformStackType:
+        """Clear all transforms from the stack having IS_RENDER set"""
+        while self.transform_stack[-1].flags & IS_RENDER:
+            self.transform_stack.pop()
+        return self.transform_stack
+
+    def remove_q(self) -> TransformStackType:
         """Rewind to stack prior state after closing a 'q' with internal 'cm' ops"""
-        pass
+        self.reset_tm()
+        cm_count = self.q_queue.pop(self.q_depth.pop(), 0)
+        if cm_count:
+            del self.transform_stack[-cm_count:]
+        return self.transform_stack
 
     def add_q(self) -> None:
         """Add another level to q_queue"""
-        pass
+        self.q_depth.append(len(self.q_depth))
 
-    def add_cm(self, *args: Any) -> TextStateManagerChainMapType:
+    def add_cm(self, *args: Any) -> TransformStackType:
         """Concatenate an additional transform matrix"""
-        pass
+        self.reset_tm()
+        self.q_queue.update(self.q_depth[-1:])
+        self.transform_stack.append(self.new_transform(*args))
+        return self.transform_stack
 
     def _complete_matrix(self, operands: List[float]) -> List[float]:
         """Adds a, b, c, and d to an "e/f only" operand set (e.g Td)"""
-        pass
+        if len(operands) == 2:
+            operands = [1.0, 0.0, 0.0, 1.0, *operands]
+        return operands
 
-    def add_tm(self, operands: List[float]) -> TextStateManagerChainMapType:
+    def add_tm(self, operands: List[float]) -> TransformStackType:
         """Append a text transform matrix"""
-        pass
+        self.transform_stack.append(self.new_transform(*self._complete_matrix(operands), is_text=True))  # type: ignore[misc, arg-type]
+        return self.transform_stack
 
-    def add_trm(self, operands: List[float]) -> TextStateManagerChainMapType:
+    def add_trm(self, operands: List[float]) -> TransformStackType:
         """Append a text rendering transform matrix"""
-        pass
+        self.transform_stack.append(self.new_transform(*self._complete_matrix(operands), is_text=True, is_render=True))  # type: ignore[misc, arg-type]
+        return self.transform_stack
 
     @property
     def effective_transform(self) -> List[float]:
         """Current effective transform accounting for cm, tm, and trm transforms"""
-        pass
\ No newline at end of file
+        stack = self.transform_stack
+        m0, m1, m2, m3, m4, m5 = stack[-1].matrix()
+        for idx in range(len(stack) - 2, -1, -1):
+            n = stack[idx]
+            m0, m1, m2, m3, m4, m5 = (m0 * n.a + m1 * n.c, m0 * n.b + m1 * n.d, m2 * n.a + m3 * n.c, m2 * n.b + m3 * n.d, m4 * n.a + m5 * n.c + n.e, m4 * n.b + m5 * n.d + n.f)
+        return [m0, m1, m2, m3, m4, m5]
\ No newline at end of file
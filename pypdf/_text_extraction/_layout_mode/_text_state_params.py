@@ -1,11 +1,36 @@
 """A dataclass that captures the CTM and Text State for a tj operation"""
 import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
+from ..._utils import _DATACLASS_SLOTS
 from .. import mult, orient
 from ._font import Font
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _canonicalize_ctm(transform: Tuple[float, ...]) -> Tuple[Tuple[float, ...], bool]:
+    """
+    Undo 90/180/270 degree text rotation in a transformation matrix.
+
+    Args:
+        transform: the effective transformation matrix of a text operation
+
+    Returns:
+        tuple: the upright transformation matrix and True if it was rotated.
+    """
+    matrix = list(transform)
+    rotated = False
+    orientation = orient(matrix)
+    if orientation in (90, 270):
+        matrix = mult([1.0, -matrix[1], -matrix[2], 1.0, 0.0, 0.0], matrix)
+        rotated = True
+        orientation = orient(matrix)
+    if orientation == 180 and matrix[0] < -1e-06:
+        matrix = mult([-1.0, 0.0, 0.0, -1.0, 0.0, 0.0], matrix)
+        rotated = True
+    return (tuple(matrix), rotated)
+
+@dataclass(**_DATACLASS_SLOTS)
 class TextStateParams:
     """
     Text state parameters and operator values for a single text value in a
@@ -47,32 +72,31 @@ class TextStateParams:
     rotated: bool = field(default=False, init=False)
 
     def __post_init__(self) -> None:
-        if orient(self.transform) in (90, 270):
-            self.transform = mult([1.0, -self.transform[1], -self.transform[2], 1.0, 0.0, 0.0], self.transform)
-            self.rotated = True
-        if orient(self.transform) == 180 and self.transform[0] < -1e-06:
-            self.transform = mult([-1.0, 0.0, 0.0, -1.0, 0.0, 0.0], self.transform)
-            self.rotated = True
-        self.displaced_tx = self.displaced_transform()[4]
-        self.tx = self.transform[4]
-        self.ty = self.render_transform()[5]
-        self.space_tx = round(self.word_tx(' '), 3)
-        if self.space_tx < 1e-06:
-            self.space_tx = round(self.word_tx('', self.font.space_width * -2), 3)
-        self.font_height = self.font_size * math.sqrt(self.transform[1] ** 2 + self.transform[3] ** 2)
-        self.flip_vertical = self.transform[3] < -1e-06
+        transform, self.rotated = _canonicalize_ctm(tuple(self.transform))
+        self.transform = list(transform)
+        _a, _b, _c, _d, _e, _f = self.transform[:6]
+        self.tx = _e
+        self.displaced_tx = self.word_tx(self.txt) * _a + _e
+        self.ty = self.Ts * _d + _f
+        self.space_tx = self.font.space_tx(self.font_size, self.Tc, self.Tw, self.Tz)
+        self.font_height = self.font_size * math.sqrt(_b ** 2 + _d ** 2)
+        self.flip_vertical = _d < -1e-06
 
     def font_size_matrix(self) -> List[float]:
         """Font size matrix"""
-        pass
+        return [self.font_size * (self.Tz / 100.0), 0.0, 0.0, self.font_size, 0.0, self.Ts]
 
     def displaced_transform(self) -> List[float]:
         """Effective transform matrix after text has been rendered."""
-        pass
+        _a, _b, _c, _d, _e, _f = self.transform[:6]
+        word_tx = self.word_tx(self.txt)
+        return [_a, _b, _c, _d, word_tx * _a + _e, word_tx * _b + _f]
 
     def render_transform(self) -> List[float]:
         """Effective transform matrix accounting for font size, Tz, and Ts."""
-        pass
+        _a, _b, _c, _d, _e, _f = self.transform[:6]
+        scale_x = self.font_size * (self.Tz / 100.0)
+        return [scale_x * _a, scale_x * _b, self.font_size * _c, self.font_size * _d, self.Ts * _c + _e, self.Ts * _d + _f]
 
     def displacement_matrix(self, word: Union[str, None]=None, TD_offset: float=0.0) -> List[float]:
         """
@@ -83,13 +107,14 @@ class TextStateParams:
                 returned.
             TD_offset (float, optional): translation applied by TD operator. Defaults to 0.0.
         """
-        pass
+        word = word if word is not None else self.txt
+        return [1.0, 0.0, 0.0, 1.0, self.word_tx(word, TD_offset), 0.0]
 
     def word_tx(self, word: str, TD_offset: float=0.0) -> float:
         """Horizontal text displacement for any word according this text state"""
-        pass
+        return (self.font_size * ((self.font.word_width(word) - TD_offset) / 1000.0) + self.Tc + word.count(' ') * self.Tw) * (self.Tz / 100.0)
 
     @staticmethod
     def to_dict(inst: 'TextStateParams') -> Dict[str, Any]:
         """Dataclass to dict for json.dumps serialization"""
-        pass
\ No newline at end of file
+        return {'txt': inst.txt, 'font_size': inst.font_size, 'Tc': inst.Tc, 'Tw': inst.Tw, 'Tz': inst.Tz, 'TL': inst.TL, 'Ts': inst.Ts, 'transform': inst.transform, 'tx': inst.tx, 'ty': inst.ty, 'displaced_tx': inst.displaced_tx, 'space_tx': inst.space_tx, 'font_height': inst.font_height, 'flip_vertical': inst.flip_vertical, 'rotated': inst.rotated}
\ No newline at end of file
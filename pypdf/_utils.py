@@ -20,6 +20,7 @@ TransformationMatrixType: TypeAlias = Tuple[Tuple[float, float, float], Tuple[fl
 CompressedTransformationMatrix: TypeAlias = Tuple[float, float, float, float, float, float]
 StreamType = IO[Any]
 StrByteType = Union[str, StreamType]
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 def read_until_whitespace(stream: StreamType, maxchars: Optional[int]=None) -> bytes:
     """
@@ -34,7 +35,31 @@ def read_until_whitespace(stream: StreamType, maxchars: Optional[int]=None) -> b
     Returns:
         The data which was read.
     """
-    pass
+    if isinstance(stream, BytesIO):
+        data = stream.getvalue()
+        pos = stream.tell()
+        endpos = len(data) if maxchars is None else min(pos + maxchars, len(data))
+        m = _SPACE_RE.search(data, pos, endpos)
+        if m is None:
+            stream.seek(max(pos, endpos))
+            return data[pos:endpos]
+        stream.seek(m.end())
+        return data[pos:m.start()]
+    txt = b''
+    size = 64
+    while True:
+        to_read = size if maxchars is None else min(size, maxchars - len(txt))
+        tok = stream.read(to_read)
+        if not tok:
+            return txt
+        m = _SPACE_RE.search(tok)
+        if m is not None:
+            stream.seek(m.end() - len(tok), SEEK_CUR)
+            return txt + tok[:m.start()]
+        txt += tok
+        if len(txt) == maxchars:
+            return txt
+        size *= 2
 
 def read_non_whitespace(stream: StreamType) -> bytes:
     """
@@ -46,7 +71,27 @@ def read_non_whitespace(stream: StreamType) -> bytes:
     Returns:
         The data which was read.
     """
-    pass
+    tok = stream.read(1)
+    if tok not in _WHITESPACES_SET:
+        return tok
+    tok = stream.read(1)
+    if tok not in _WHITESPACES_SET:
+        return tok
+    if isinstance(stream, BytesIO):
+        m = _NON_WHITESPACE_RE.search(stream.getvalue(), stream.tell())
+        if m is None:
+            stream.seek(0, 2)
+            return b''
+        stream.seek(m.end())
+        return m.group()
+    while True:
+        buf = stream.read(32)
+        if not buf:
+            return b''
+        rest = buf.lstrip(WHITESPACES_AS_BYTES)
+        if rest:
+            stream.seek(1 - len(rest), SEEK_CUR)
+            return rest[:1]
 
 def skip_over_whitespace(stream: StreamType) -> bool:
     """
@@ -59,7 +104,10 @@ def skip_over_whitespace(stream: StreamType) -> bool:
     Returns:
         True if more than one whitespace was skipped, otherwise return False.
     """
-    pass
+    if stream.read(1) not in _WHITESPACES_SET:
+        return False
+    read_non_whitespace(stream)
+    return True
 
 def check_if_whitespace_only(value: bytes) -> bool:
     """
@@ -71,7 +119,7 @@ def check_if_whitespace_only(value: bytes) -> bool:
     Returns:
         True if the value only has whitespace characters, otherwise return False.
     """
-    pass
+    return not value.translate(None, WHITESPACES_AS_BYTES)
 
 def read_until_regex(stream: StreamType, regex: Pattern[bytes]) -> bytes:
     """
@@ -84,7 +132,27 @@ def read_until_regex(stream: StreamType, regex: Pattern[bytes]) -> bytes:
     Returns:
         The read bytes.
     """
-    pass
+    if isinstance(stream, BytesIO):
+        data = stream.getvalue()
+        pos = stream.tell()
+        m = regex.search(data, pos)
+        if m is None:
+            stream.seek(0, 2)
+            return data[pos:]
+        stream.seek(m.start())
+        return data[pos:m.start()]
+    buf = b''
+    size = 64
+    while True:
+        tok = stream.read(size)
+        if not tok:
+            return buf
+        buf += tok
+        m = regex.search(buf)
+        if m is not None:
+            stream.seek(m.start() - len(buf), SEEK_CUR)
+            return buf[:m.start()]
+        size *= 2
 
 def read_block_backwards(stream: StreamType, to_read: int) -> bytes:
     """
@@ -100,7 +168,13 @@ def read_block_backwards(stream: StreamType, to_read: int) -> bytes:
     Returns:
         The data which was read.
     """
-    pass
+    start = stream.tell() - to_read
+    if start < 0:
+        raise PdfStreamError('Could not read malformed PDF file')
+    stream.seek(start)
+    read = stream.read(to_read)
+    stream.seek(start)
+    return read
 
 def read_previous_line(stream: StreamType) -> bytes:
     """
@@ -118,7 +192,29 @@ def read_previous_line(stream: StreamType) -> bytes:
     Returns:
         The data which was read.
     """
-    pass
+    line_content = []
+    found_crlf = False
+    if stream.tell() == 0:
+        raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+    while True:
+        to_read = min(DEFAULT_BUFFER_SIZE, stream.tell())
+        if to_read == 0:
+            break
+        block = read_block_backwards(stream, to_read)
+        if found_crlf:
+            rest = block.rstrip(b'\r\n')
+        else:
+            idx = max(block.rfind(b'\r'), block.rfind(b'\n'))
+            if idx < 0:
+                line_content.append(block)
+                continue
+            found_crlf = True
+            line_content.append(block[idx + 1:])
+            rest = block[:idx].rstrip(b'\r\n')
+        if rest:
+            stream.seek(len(rest), SEEK_CUR)
+            break
+    return b''.join(line_content[::-1])
 
 def mark_location(stream: StreamType) -> None:
     """Create text file showing current location in context."""
@@ -126,23 +222,40 @@ def mark_location(stream: StreamType) -> None:
 B_CACHE: Dict[Union[str, bytes], bytes] = {}
 WHITESPACES = (b' ', b'\n', b'\r', b'\t', b'\x00')
 WHITESPACES_AS_BYTES = b''.join(WHITESPACES)
+_WHITESPACES_SET = frozenset(WHITESPACES)
 WHITESPACES_AS_REGEXP = b'[' + WHITESPACES_AS_BYTES + b']'
+_SPACE_RE = re.compile(b'\\s')
+_NON_WHITESPACE_RE = re.compile(b'[^' + WHITESPACES_AS_BYTES + b']')
+
+def deprecate(msg: str, stacklevel: int=3) -> None:
+    warnings.warn(msg, DeprecationWarning, stacklevel=stacklevel)
+
+def deprecation(msg: str) -> None:
+    raise DeprecationError(msg)
+
+@functools.lru_cache(maxsize=None)
+def _deprecation_message(name: str, removed_in: str, new_name: Optional[str]=None, removed: bool=False) -> str:
+    """Build the deprecation text once per call site."""
+    msg = f"{name} is deprecated and {('was' if removed else 'will be')} removed in pypdf {removed_in}."
+    if new_name is not None:
+        msg += f' Use {new_name} instead.'
+    return msg
 
 def deprecate_with_replacement(old_name: str, new_name: str, removed_in: str) -> None:
     """Raise an exception that a feature will be removed, but has a replacement."""
-    pass
+    deprecate(_deprecation_message(old_name, removed_in, new_name), 4)
 
 def deprecation_with_replacement(old_name: str, new_name: str, removed_in: str) -> None:
     """Raise an exception that a feature was already removed, but has a replacement."""
-    pass
+    deprecation(_deprecation_message(old_name, removed_in, new_name, removed=True))
 
 def deprecate_no_replacement(name: str, removed_in: str) -> None:
     """Raise an exception that a feature will be removed without replacement."""
-    pass
+    deprecate(_deprecation_message(name, removed_in), 4)
 
 def deprecation_no_replacement(name: str, removed_in: str) -> None:
     """Raise an exception that a feature was already removed without replacement."""
-    pass
+    deprecation(_deprecation_message(name, removed_in, removed=True))
 
 def logger_error(msg: str, src: str) -> None:
     """
@@ -183,7 +296,16 @@ def rename_kwargs(func_name: str, kwargs: Dict[str, Any], aliases: Dict[str, str
         aliases:
         fail:
     """
-    pass
+    if kwargs.keys().isdisjoint(aliases):
+        return
+    for old_term, new_term in aliases.items():
+        if old_term in kwargs:
+            if fail:
+                raise DeprecationError(f'{old_term} is deprecated as an argument. Use {new_term} instead')
+            if new_term in kwargs:
+                raise TypeError(f'{func_name} received both {old_term} and {new_term} as an argument. {old_term} is deprecated. Use {new_term} instead.')
+            kwargs[new_term] = kwargs.pop(old_term)
+            warnings.warn(message=f'{old_term} is deprecated as an argument. Use {new_term} instead', category=DeprecationWarning)
 
 class classproperty:
     """
@@ -197,7 +319,7 @@ class classproperty:
     def __get__(self, instance, cls=None) -> Any:
         return self.fget(cls)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class File:
     from .generic import IndirectObject
     name: str
@@ -211,7 +333,7 @@ class File:
     def __repr__(self) -> str:
         return self.__str__()[:-1] + f', hash: {hash(self.data)})'
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ImageFile(File):
     from .generic import IndirectObject
     image: Optional[Any] = None
@@ -238,32 +360,62 @@ class ImageFile(File):
         """
         pass
 
-@functools.total_ordering
+@functools.lru_cache(maxsize=256)
+def _parse_version_components(version_str: str) -> Tuple[Tuple[int, str], ...]:
+    """Split a dotted version string into (integer prefix, suffix) pairs."""
+    parsed_components = []
+    for component in version_str.split('.'):
+        if component.isdecimal():
+            parsed_components.append((int(component), ''))
+            continue
+        match = Version.COMPONENT_PATTERN.match(component)
+        if not match:
+            parsed_components.append((0, component))
+            continue
+        parsed_components.append((int(match.group(1)), match.group(2)))
+    return tuple(parsed_components)
+
 class Version:
+    __slots__ = ('version_str', 'components', '_key')
     COMPONENT_PATTERN = re.compile('^(\\d+)(.*)$')
 
     def __init__(self, version_str: str) -> None:
         self.version_str = version_str
         self.components = self._parse_version(version_str)
+        self._key = tuple(self.components)
+
+    def _parse_version(self, version_str: str) -> List[Tuple[int, str]]:
+        return list(_parse_version_components(version_str))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Version):
             return False
-        return self.components == other.components
+        return self._key == other._key
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return True
+        return self._key != other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def __lt__(self, other: Any) -> bool:
         if not isinstance(other, Version):
             raise ValueError(f'Version cannot be compared against {type(other)}')
-        min_len = min(len(self.components), len(other.components))
-        for i in range(min_len):
-            self_value, self_suffix = self.components[i]
-            other_value, other_suffix = other.components[i]
-            if self_value < other_value:
-                return True
-            elif self_value > other_value:
-                return False
-            if self_suffix < other_suffix:
-                return True
-            elif self_suffix > other_suffix:
-                return False
-        return len(self.components) < len(other.components)
\ No newline at end of file
+        return self._key < other._key
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            raise ValueError(f'Version cannot be compared against {type(other)}')
+        return self._key <= other._key
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            raise ValueError(f'Version cannot be compared against {type(other)}')
+        return self._key > other._key
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            raise ValueError(f'Version cannot be compared against {type(other)}')
+        return self._key >= other._key
\ No newline at end of file
@@ -1,18 +1,19 @@
 import collections
 import decimal
 import enum
-import hashlib
 import re
+import secrets
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, FileIO, IOBase
+from itertools import chain
 from pathlib import Path
 from types import TracebackType
-from typing import IO, Any, Callable, Deque, Dict, Iterable, List, Optional, Pattern, Tuple, Type, Union, cast
+from typing import IO, Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Type, Union, cast
 from ._cmap import _default_fonts_space_width, build_char_map_from_dict
 from ._doc_common import PdfDocCommon
 from ._encryption import EncryptAlgorithm, Encryption
 from ._page import PageObject
-from ._page_labels import nums_clear_range, nums_insert, nums_next
 from ._reader import PdfReader
 from ._utils import StrByteType, StreamType, _get_max_pdf_version_header, b_, deprecate_with_replacement, logger_warning
 from .constants import AnnotationDictionaryAttributes as AA
@@ -25,11 +26,25 @@ from .constants import PagesAttributes as PA
 from .constants import TrailerKeys as TK
 from .errors import PyPdfError
 from .generic import PAGE_FIT, ArrayObject, BooleanObject, ByteStringObject, ContentStream, DecodedStreamObject, Destination, DictionaryObject, Fit, FloatObject, IndirectObject, NameObject, NullObject, NumberObject, PdfObject, RectangleObject, StreamObject, TextStringObject, TreeObject, ViewerPreferences, create_string_object, hex_to_rgb
+from .generic._base import _cached_name_object, _cached_number_object
 from .pagerange import PageRange, PageRangeSpec
 from .types import AnnotationSubtype, BorderArrayType, LayoutType, OutlineItemType, OutlineType, PagemodeType
 from .xmp import XmpInformation
 ALL_DOCUMENT_PERMISSIONS = UserAccessPermissions.all()
 DEFAULT_FONT_HEIGHT_IN_MULTILINE = 12
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+_PAGE_LABEL_STYLES: FrozenSet[str] = frozenset((PageLabelStyle.DECIMAL, PageLabelStyle.UPPERCASE_ROMAN, PageLabelStyle.LOWERCASE_ROMAN, PageLabelStyle.UPPERCASE_LETTER, PageLabelStyle.LOWERCASE_LETTER))
+_N_TYPE = NameObject(PA.TYPE)
+_N_KIDS = NameObject(PA.KIDS)
+_N_COUNT = NameObject(PA.COUNT)
+_N_PAGES = NameObject(CO.PAGES)
+_N_CATALOG = NameObject(CO.CATALOG)
+_N_PRODUCER = NameObject('/Producer')
+_N_SIZE = NameObject(TK.SIZE)
+_N_ROOT = NameObject(TK.ROOT)
+_N_INFO = NameObject(TK.INFO)
+_N_ID = NameObject(TK.ID)
+_N_ENCRYPT = NameObject(TK.ENCRYPT)
 
 class ObjectDeletionFlag(enum.IntFlag):
     NONE = 0
@@ -53,27 +68,34 @@ class PdfWriter(PdfDocCommon):
 
     def __init__(self, fileobj: Union[None, PdfReader, StrByteType, Path]='', clone_from: Union[None, PdfReader, StrByteType, Path]=None) -> None:
         self._header = b'%PDF-1.3'
-        self._objects: List[PdfObject] = []
+        self._objects: List[Optional[PdfObject]] = []
         'The indirect objects in the PDF.'
         self._idnum_hash: Dict[bytes, IndirectObject] = {}
         'Maps hash values of indirect objects to their IndirectObject instances.'
         self._id_translated: Dict[int, Dict[int, int]] = {}
+        self._page_id2num: Dict[int, int] = {}
+        'Maps the idnum of each page to its page number; rebuilt when it no longer matches flattened_pages.'
+        self._clone_id_cache: Dict[int, Tuple[PdfObject, IndirectObject]] = {}
+        'Maps id() of already resolved source objects to their IndirectObject, skipping the hash on revisits.'
         pages = DictionaryObject()
-        pages.update({NameObject(PA.TYPE): NameObject('/Pages'), NameObject(PA.COUNT): NumberObject(0), NameObject(PA.KIDS): ArrayObject()})
+        pages.update({_N_TYPE: _N_PAGES, _N_COUNT: NumberObject(0), _N_KIDS: ArrayObject()})
         self._pages = self._add_object(pages)
         self.flattened_pages = []
         info = DictionaryObject()
-        info.update({NameObject('/Producer'): create_string_object('pypdf')})
+        info.update({_N_PRODUCER: create_string_object('pypdf')})
         self._info_obj: PdfObject = self._add_object(info)
         self._root_object = DictionaryObject()
-        self._root_object.update({NameObject(PA.TYPE): NameObject(CO.CATALOG), NameObject(CO.PAGES): self._pages})
+        self._root_object.update({_N_TYPE: _N_CATALOG, _N_PAGES: self._pages})
         self._root = self._add_object(self._root_object)
 
         def _get_clone_from(fileobj: Union[None, PdfReader, str, Path, IO[Any], BytesIO], clone_from: Union[None, PdfReader, str, Path, IO[Any], BytesIO]) -> Union[None, PdfReader, str, Path, IO[Any], BytesIO]:
             if not isinstance(fileobj, (str, Path, IO, BytesIO)) or (fileobj != '' and clone_from is None):
                 cloning = True
-                if not (not isinstance(fileobj, (str, Path)) or (Path(str(fileobj)).exists() and Path(str(fileobj)).stat().st_size > 0)):
-                    cloning = False
+                if isinstance(fileobj, (str, Path)):
+                    try:
+                        cloning = Path(str(fileobj)).stat().st_size > 0
+                    except (FileNotFoundError, NotADirectoryError, ValueError):
+                        cloning = False
                 if isinstance(fileobj, (IO, BytesIO)):
                     t = fileobj.tell()
                     fileobj.seek(-1, 2)
@@ -232,7 +254,19 @@ class PdfWriter(PdfDocCommon):
         Returns:
             The page number or None
         """
-        pass
+        if indirect_reference is None or isinstance(indirect_reference, NullObject):
+            return None
+        if isinstance(indirect_reference, int):
+            indirect_reference = IndirectObject(indirect_reference, 0, self)
+        if not isinstance(indirect_reference.get_object(), PageObject):
+            return None
+        idnum = indirect_reference.idnum
+        pages = self.flattened_pages or []
+        page_number = self._page_id2num.get(idnum)
+        if page_number is None or page_number >= len(pages) or getattr(pages[page_number].indirect_reference, 'idnum', None) != idnum:
+            self._page_id2num = {page.indirect_reference.idnum: i for i, page in enumerate(pages) if page.indirect_reference is not None}
+            page_number = self._page_id2num.get(idnum)
+        return page_number
 
     def add_blank_page(self, width: Optional[float]=None, height: Optional[float]=None) -> PageObject:
         """
@@ -321,7 +355,18 @@ class PdfWriter(PdfDocCommon):
                 the callback is a reference to the page just appended to the
                 document.
         """
-        pass
+        self._clone_id_cache = {}
+        self.clone_reader_document_root(reader)
+        inf = reader._info
+        if inf is not None:
+            self._info_obj = self._add_object(inf.clone(self))
+        try:
+            self._ID = cast(ArrayObject, reader._ID).clone(self)
+        except AttributeError:
+            pass
+        if callable(after_page_append):
+            for page in cast(ArrayObject, cast(DictionaryObject, self._pages.get_object())['/Kids']):
+                after_page_append(page.get_object())
     FFBITS_NUL = FA.FfBits(0)
 
     def update_page_form_field_values(self, page: Union[PageObject, List[PageObject], None], fields: Dict[str, Any], flags: FA.FfBits=FFBITS_NUL, auto_regenerate: Optional[bool]=True) -> None:
@@ -406,7 +451,9 @@ class PdfWriter(PdfDocCommon):
         identifier matches, a different version of the correct file has been found.
         see 14.4 "File Identifiers".
         """
-        pass
+        id2 = ByteStringObject(secrets.token_bytes(16))
+        id1 = self._ID[0] if self._ID else id2
+        self._ID = ArrayObject([id1, id2])
 
     def encrypt(self, user_password: str, owner_password: Optional[str]=None, use_128bit: bool=True, permissions_flag: UserAccessPermissions=ALL_DOCUMENT_PERMISSIONS, *, algorithm: Optional[str]=None) -> None:
         """
@@ -434,6 +481,25 @@ class PdfWriter(PdfDocCommon):
         """
         pass
 
+    def write_stream(self, stream: StreamType) -> None:
+        """
+        Write the document to an already opened binary stream.
+
+        Unlike :meth:`write`, the stream is never closed.
+
+        Args:
+            stream: An object supporting the ``write`` and ``tell`` methods,
+                opened in binary mode.
+        """
+        if hasattr(stream, 'mode') and 'b' not in stream.mode:
+            logger_warning(f'File <{stream.name}> to write to is not in binary mode. It may not be written to correctly.', __name__)
+        if not self._root:
+            self._root = self._add_object(self._root_object)
+        self._sweep_indirect_references(self._root)
+        object_positions = self._write_pdf_structure(stream)
+        xref_location = self._write_xref_table(stream, object_positions)
+        self._write_trailer(stream, xref_location)
+
     def write(self, stream: Union[Path, StrByteType]) -> Tuple[bool, IO[Any]]:
         """
         Write the collection of pages added to this object out as a PDF file.
@@ -447,7 +513,137 @@ class PdfWriter(PdfDocCommon):
         Returns:
             A tuple (bool, IO).
         """
-        pass
+        my_file = False
+        if stream == '':
+            raise ValueError(f'Output(stream={stream}) is empty.')
+        if isinstance(stream, (str, Path)):
+            stream = FileIO(stream, 'wb')
+            self.with_as_usage = True
+            my_file = True
+        self.write_stream(stream)
+        if self.with_as_usage:
+            stream.close()
+        return (my_file, stream)
+
+    def _write_pdf_structure(self, stream: StreamType) -> List[int]:
+        """
+        Write the header and all indirect objects, returning their offsets.
+
+        Objects are serialized into an in-memory buffer that is handed to
+        ``stream`` in blocks of about WRITE_BUFFER_SIZE bytes, so a file stream
+        sees a few large writes instead of several small ones per object.
+        """
+        object_positions: List[int] = []
+        add_position = object_positions.append
+        encryption = self._encryption
+        offset = stream.tell()
+        buf = BytesIO()
+        buf.write(self.pdf_header.encode() + b'\n')
+        buf.write(b'%\xe2\xe3\xcf\xd3\n')
+        position = buf.tell()
+        for idnum, obj in enumerate(self._objects, 1):
+            if obj is not None:
+                add_position(offset + position)
+                buf.write(b'%d 0 obj\n' % idnum)
+                if encryption and obj != self._encrypt_entry:
+                    obj = encryption.encrypt_object(obj, idnum, 0)
+                obj.write_to_stream(buf)
+                buf.write(b'\nendobj\n')
+                position = buf.tell()
+                if position >= WRITE_BUFFER_SIZE:
+                    offset += position
+                    stream.write(buf.getvalue())
+                    buf = BytesIO()
+                    position = 0
+            else:
+                add_position(-1)
+        stream.write(buf.getvalue())
+        return object_positions
+
+    def _write_xref_table(self, stream: StreamType, object_positions: List[int]) -> int:
+        xref_location = stream.tell()
+        lines = [b'xref\n', b'0 %d\n' % (len(self._objects) + 1), b'0000000000 65535 f \n']
+        free_idx = 1
+        for offset in object_positions:
+            if offset >= 0:
+                lines.append(b'%010d 00000 n \n' % offset)
+            else:
+                lines.append(b'%010d 00001 f \n' % free_idx)
+                free_idx += 1
+        stream.write(b''.join(lines))
+        return xref_location
+
+    def deduplicate_resources(self) -> None:
+        """
+        Merge identical indirect objects reachable from the page resources.
+
+        Objects below each page's /Resources (fonts, XObjects, ...) are
+        compared by hash value, stream data included. All references to a
+        duplicate are redirected to the first copy and the duplicate is
+        removed from the writer, so an :class:`IndirectObject` still pointing
+        to it resolves to ``None`` afterwards. This is repeated until no
+        duplicates are left, so that containers become identical once their
+        children have been merged.
+
+        Call it once the document is complete, right before :meth:`write`.
+        """
+        candidates: Set[int] = set()
+        stack: List[Any] = [dict.get(page, PG.RESOURCES) for page in self.flattened_pages or () if PG.RESOURCES in page]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, IndirectObject):
+                if value.pdf is not self or value.idnum in candidates:
+                    continue
+                candidates.add(value.idnum)
+                value = self._objects[value.idnum - 1]
+            if isinstance(value, DictionaryObject):
+                stack.extend((v for k, v in value.items() if k not in (PG.PARENT, '/P')))
+            elif isinstance(value, ArrayObject):
+                stack.extend(value)
+        ordered = sorted(candidates)
+        while True:
+            seen: Dict[bytes, IndirectObject] = {}
+            merged: Dict[int, IndirectObject] = {}
+            for idnum in ordered:
+                obj = self._objects[idnum - 1]
+                if obj is None:
+                    continue
+                hash_value = obj.hash_value()
+                if hash_value in seen:
+                    merged[idnum] = seen[hash_value]
+                else:
+                    seen[hash_value] = IndirectObject(idnum, 0, self)
+            if not merged:
+                return
+            self._replace_indirect_references(merged)
+            for idnum in merged:
+                self._objects[idnum - 1] = None
+
+    def _replace_indirect_references(self, replacements: Dict[int, IndirectObject]) -> None:
+        """
+        Redirect every reference to an idnum in ``replacements`` to its new target.
+
+        Args:
+            replacements: Maps the idnum of a dropped object to the
+                IndirectObject that replaces it.
+        """
+        stack: List[Any] = [obj for obj in self._objects if isinstance(obj, (DictionaryObject, ArrayObject))]
+        while stack:
+            container = stack.pop()
+            for key, value in container.items():
+                if isinstance(value, IndirectObject):
+                    if value.pdf is self and value.idnum in replacements:
+                        container[key] = replacements[value.idnum]
+                elif isinstance(value, (DictionaryObject, ArrayObject)):
+                    stack.append(value)
+        for hash_value, reference in self._idnum_hash.items():
+            if reference.idnum in replacements:
+                self._idnum_hash[hash_value] = replacements[reference.idnum]
+        self._clone_id_cache = {}
+        for translation in self._id_translated.values():
+            for source_idnum, idnum in translation.items():
+                if idnum in replacements:
+                    translation[source_idnum] = replacements[idnum].idnum
 
     def _write_trailer(self, stream: StreamType, xref_location: int) -> None:
         """
@@ -457,7 +653,42 @@ class PdfWriter(PdfDocCommon):
             [The] trailer [gives] the location of the cross-reference table and
             of certain special objects within the body of the file.
         """
-        pass
+        stream.write(b'trailer\n')
+        trailer = DictionaryObject()
+        trailer.update({_N_SIZE: NumberObject(len(self._objects) + 1), _N_ROOT: self._root, _N_INFO: self._info_obj})
+        if self._ID:
+            trailer[_N_ID] = self._ID
+        if self._encrypt_entry:
+            trailer[_N_ENCRYPT] = self._encrypt_entry.indirect_reference
+        trailer.write_to_stream(stream)
+        stream.write(f'\nstartxref\n{xref_location}\n%%EOF\n'.encode())
+
+    def compress_content_streams(self, level: int=-1, workers: int=1) -> None:
+        """
+        Compress the content streams of all pages.
+
+        See :meth:`PageObject.compress_content_streams<pypdf._page.PageObject.compress_content_streams>`.
+
+        Args:
+            level: zlib compression level, see
+                https://docs.python.org/3/library/zlib.html#zlib.compress
+            workers: number of threads used for compressing. zlib releases
+                the GIL, so the streams of several pages can be compressed
+                at the same time.
+        """
+        if workers <= 1:
+            for page in self.pages:
+                page.compress_content_streams(level)
+            return
+        contents: List[Tuple[PageObject, ContentStream]] = []
+        for page in self.pages:
+            content = page.get_contents()
+            if content is not None:
+                contents.append((page, content))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            encoded = list(executor.map(lambda content: content.flate_encode(level), (content for _, content in contents)))
+        for (page, content), content_obj in zip(contents, encoded):
+            page._set_compressed_contents(content, content_obj)
 
     def add_metadata(self, infos: Dict[str, Any]) -> None:
         """
@@ -485,7 +716,41 @@ class PdfWriter(PdfDocCommon):
         Args:
             root: The root of the PDF object tree to sweep.
         """
-        pass
+        containers = (ArrayObject, DictionaryObject)
+        indirect_object = IndirectObject
+        stream_object = StreamObject
+        idnum_hash = self._idnum_hash
+        resolve = self._resolve_indirect_object
+        add_object = self._add_object
+        stack: Deque[Tuple[Any, Optional[Any], Any, List[PdfObject]]] = collections.deque()
+        push = stack.append
+        pop = stack.pop
+        discovered: Set[int] = set()
+        push((root, None, None, []))
+        while stack:
+            data, parent, key_or_id, grant_parents = pop()
+            if isinstance(data, containers):
+                children_grant_parents = grant_parents + [parent] if parent is not None else []
+                for key, value in data.items():
+                    push((value, data, key, children_grant_parents))
+            elif isinstance(data, indirect_object) and data.pdf != self:
+                data = resolve(data)
+                if data.idnum not in discovered:
+                    discovered.add(data.idnum)
+                    push((data.get_object(), None, None, []))
+            if isinstance(parent, containers):
+                if isinstance(data, stream_object):
+                    data = cast(StreamObject, add_object(data))
+                if parent[key_or_id] == data:
+                    continue
+                update_hashes = [parent.hash_value()] + [grant_parent.hash_value() for grant_parent in grant_parents]
+                parent[key_or_id] = data
+                for old_hash in update_hashes:
+                    indirect_reference = idnum_hash.pop(old_hash, None)
+                    if indirect_reference is not None:
+                        indirect_reference_obj = indirect_reference.get_object()
+                        if indirect_reference_obj is not None:
+                            idnum_hash[indirect_reference_obj.hash_value()] = indirect_reference
 
     def _resolve_indirect_object(self, data: IndirectObject) -> IndirectObject:
         """
@@ -512,7 +777,25 @@ class PdfWriter(PdfDocCommon):
         Raises:
             ValueError: If the input stream is closed.
         """
-        pass
+        if hasattr(data.pdf, 'stream') and data.pdf.stream.closed:
+            raise ValueError(f'I/O operation on closed file: {data.pdf.stream.name}')
+        if data.pdf == self:
+            return data
+        if isinstance(data.pdf, PdfReader) and data.generation == 0 and data.idnum in data.pdf.xref_objStm:
+            data.pdf._prefetch_object_stream(data.pdf.xref_objStm[data.idnum][0])
+        real_obj = data.pdf.get_object(data)
+        if real_obj is None:
+            logger_warning(f'Unable to resolve [{data.__class__.__name__}: {data}], returning NullObject instead', __name__)
+            real_obj = NullObject()
+        hit = self._clone_id_cache.get(id(real_obj))
+        if hit is not None and hit[0] is real_obj:
+            return hit[1]
+        hash_value = real_obj.hash_value()
+        if hash_value not in self._idnum_hash:
+            self._idnum_hash[hash_value] = self._add_object(real_obj)
+        result = self._idnum_hash[hash_value]
+        self._clone_id_cache[id(real_obj)] = (real_obj, result)
+        return result
 
     def get_threads_root(self) -> ArrayObject:
         """
@@ -572,7 +855,25 @@ class PdfWriter(PdfDocCommon):
                 "/Movie", "/Screen", ...
                 If you want to remove all annotations, use subtypes=None.
         """
-        pass
+        if subtypes is not None:
+            subtypes = frozenset((subtypes,) if isinstance(subtypes, str) else subtypes)
+        for page in self.pages:
+            self._remove_annots_from_page(page, subtypes)
+
+    def _remove_annots_from_page(self, page: Union[IndirectObject, PageObject, DictionaryObject], subtypes: Optional[Iterable[str]]) -> None:
+        page = cast(DictionaryObject, page.get_object())
+        if PG.ANNOTS not in page:
+            return
+        annots = cast(ArrayObject, page[PG.ANNOTS])
+        # rebuilt in one pass rather than deleting the entries one by one
+        kept = []
+        for an in annots:
+            if subtypes is None or cast(str, cast(DictionaryObject, an.get_object())['/Subtype']) in subtypes:
+                if isinstance(an, IndirectObject):
+                    self._objects[an.idnum - 1] = NullObject()
+            else:
+                kept.append(an)
+        annots[:] = kept
 
     def remove_objects_from_page(self, page: Union[PageObject, DictionaryObject], to_delete: Union[ObjectDeletionFlag, Iterable[ObjectDeletionFlag]]) -> None:
         """
@@ -820,7 +1121,38 @@ class PdfWriter(PdfDocCommon):
         Returns:
             The added thread as an indirect reference
         """
-        pass
+        # only the thread dictionary is cloned; the beads are rebuilt as plain
+        # dictionaries pointing to the cloned pages, sharing their /R rectangle
+        nthread = thread.clone(self, force_duplicate=True, ignore_fields=('/F',))
+        self.threads.append(nthread.indirect_reference)
+        first_article = cast('DictionaryObject', thread['/F'])
+        current_article: Optional[DictionaryObject] = first_article
+        new_article: Optional[DictionaryObject] = None
+        while current_article is not None:
+            pag = self._get_cloned_page(cast('PageObject', current_article['/P']), pages, reader)
+            if pag is not None:
+                if new_article is None:
+                    new_article = cast('DictionaryObject', self._add_object(DictionaryObject()).get_object())
+                    new_first = new_article
+                    nthread[NameObject('/F')] = new_article.indirect_reference
+                else:
+                    new2 = cast('DictionaryObject', self._add_object(DictionaryObject({NameObject('/V'): new_article.indirect_reference})).get_object())
+                    new_article[NameObject('/N')] = new2.indirect_reference
+                    new_article = new2
+                new_article[NameObject('/P')] = pag
+                new_article[NameObject('/T')] = nthread.indirect_reference
+                new_article[NameObject('/R')] = current_article['/R']
+                pag_obj = cast('PageObject', pag.get_object())
+                if '/B' not in pag_obj:
+                    pag_obj[NameObject('/B')] = ArrayObject()
+                cast('ArrayObject', pag_obj['/B']).append(new_article.indirect_reference)
+            current_article = cast('DictionaryObject', current_article['/N'])
+            if current_article == first_article:
+                new_article[NameObject('/N')] = new_first.indirect_reference  # type: ignore
+                new_first[NameObject('/V')] = new_article.indirect_reference  # type: ignore
+                current_article = None
+        assert nthread.indirect_reference is not None
+        return nthread.indirect_reference
 
     def add_filtered_articles(self, fltr: Union[Pattern[Any], str], pages: Dict[int, PageObject], reader: PdfReader) -> None:
         """
@@ -831,7 +1163,27 @@ class PdfWriter(PdfDocCommon):
             pages:
             reader:
         """
-        pass
+        if isinstance(fltr, str):
+            fltr = re.compile(fltr)
+        elif not isinstance(fltr, Pattern):
+            fltr = re.compile('')
+        translated = self._id_translated[id(reader)]
+        # a thread is reached through the beads of all its pages, but its title
+        # only needs to be matched once
+        checked: Set[int] = set()
+        for p in pages.values():
+            pp = p.original_page
+            for a in pp.get('/B', ()):
+                thr = a.get_object().get('/T')
+                if thr is None:
+                    continue
+                thr = thr.get_object()
+                idnum = thr.indirect_reference.idnum
+                if idnum in checked:
+                    continue
+                checked.add(idnum)
+                if idnum not in translated and fltr.search((thr['/I'] if '/I' in thr else {}).get('/Title', '')):
+                    self._add_articles_thread(thr, pages, reader)
 
     def _get_filtered_outline(self, node: Any, pages: Dict[int, PageObject], reader: PdfReader) -> List[Destination]:
         """
@@ -845,12 +1197,67 @@ class PdfWriter(PdfDocCommon):
         Returns:
             A list of destination objects.
         """
-        pass
+        # walked with an explicit stack to not be bound by the recursion limit;
+        # items are collected in document order with the position of their
+        # parent, then kept if they point to a cloned page or keep a child
+        items: List[Tuple[Destination, int]] = []
+        stack: List[Tuple[Any, int]] = [(node, -1)]
+        while stack:
+            node, parent = stack.pop()
+            while True:
+                node = NullObject() if node is None else node.get_object()
+                if node is None or isinstance(node, NullObject):
+                    node = DictionaryObject()
+                if node.get('/Type', '') != '/Outlines' and '/Title' in node:
+                    break
+                node = node.get('/First', None)
+                if node is None:
+                    break
+            while node is not None:
+                node = node.get_object()
+                o = cast('Destination', reader._build_outline_item(node))
+                v: Union[None, IndirectObject, NullObject] = self._get_cloned_page(cast('PageObject', o['/Page']), pages, reader)
+                o[NameObject('/Page')] = NullObject() if v is None else v
+                o._filtered_children = []
+                items.append((o, parent))
+                if '/First' in node:
+                    stack.append((node['/First'], len(items) - 1))
+                node = node.get('/Next', None)
+        keep = [not isinstance(o['/Page'], NullObject) for o, _ in items]
+        for position in range(len(items) - 1, -1, -1):
+            parent = items[position][1]
+            if keep[position] and parent >= 0:
+                keep[parent] = True
+        new_outline: List[Destination] = []
+        for (o, parent), kept in zip(items, keep):
+            if kept:
+                (new_outline if parent < 0 else items[parent][0]._filtered_children).append(o)
+        return new_outline
 
     def close(self) -> None:
         """Implemented for API harmonization."""
         pass
 
+    def find_outline_item(self, outline_item: Dict[str, Any], root: Optional[OutlineType]=None) -> Optional[List[int]]:
+        o: Optional[TreeObject] = self.get_outline_root() if root is None else cast('TreeObject', root)
+        # pre-order walk; the stack holds the sibling chains still to visit,
+        # with the position and the path of their next node
+        stack: List[Tuple[Optional[TreeObject], int, List[int]]] = [(o, 0, [])]
+        while stack:
+            o, i, path = stack.pop()
+            while o is not None:
+                if o.indirect_reference == outline_item or o.get('/Title', None) == outline_item:
+                    return path + [i]
+                if '/Next' in o:
+                    stack.append((cast(TreeObject, o['/Next']), i + 1, path))
+                if '/First' in o:
+                    if '/Title' in o:
+                        path = path + [i]
+                    o, i = (cast(TreeObject, o['/First']), 0)
+                else:
+                    break
+        return None
+
     def find_bookmark(self, outline_item: Dict[str, Any], root: Optional[OutlineType]=None) -> Optional[List[int]]:
         """
         .. deprecated:: 2.9.0
@@ -868,7 +1275,14 @@ class PdfWriter(PdfDocCommon):
             reader: PdfReader or IndirectObject referencing a PdfReader object.
                 if set to None or omitted, all tables will be reset.
         """
-        pass
+        if reader is None:
+            self._id_translated = {}
+        elif isinstance(reader, PdfReader):
+            self._id_translated.pop(id(reader), None)
+        elif isinstance(reader, IndirectObject):
+            self._id_translated.pop(id(reader.pdf), None)
+        else:
+            raise Exception('invalid parameter {reader}')
 
     def set_page_label(self, page_index_from: int, page_index_to: int, style: Optional[PageLabelStyle]=None, prefix: Optional[str]=None, start: Optional[int]=0) -> None:
         """
@@ -898,7 +1312,19 @@ class PdfWriter(PdfDocCommon):
                     which must be greater than or equal to 1.
                     Default value: 1.
         """
-        pass
+        if style is None and prefix is None:
+            raise ValueError('at least one between style and prefix must be given')
+        if style is not None and style not in _PAGE_LABEL_STYLES:
+            raise ValueError(f'invalid page label style: {style!r}')
+        if page_index_from < 0:
+            raise ValueError('page_index_from must be equal or greater then 0')
+        if page_index_to < page_index_from:
+            raise ValueError('page_index_to must be equal or greater then page_index_from')
+        if page_index_to >= len(self.pages):
+            raise ValueError('page_index_to exceeds number of pages')
+        if start is not None and start != 0 and (start < 1):
+            raise ValueError('if given, start must be equal or greater than one')
+        self._set_page_label(page_index_from, page_index_to, style, prefix, start)
 
     def _set_page_label(self, page_index_from: int, page_index_to: int, style: Optional[PageLabelStyle]=None, prefix: Optional[str]=None, start: Optional[int]=0) -> None:
         """
@@ -926,4 +1352,27 @@ class PdfWriter(PdfDocCommon):
                     Subsequent pages are numbered sequentially from this value,
                     which must be greater than or equal to 1. Default value: 1.
         """
-        pass
\ No newline at end of file
+        default_page_label = DictionaryObject()
+        default_page_label[NameObject('/S')] = NameObject('/D')
+        if NameObject(CatalogDictionary.PAGE_LABELS) in self._root_object:
+            page_labels = cast(TreeObject, self._root_object[NameObject(CatalogDictionary.PAGE_LABELS)].get_object())
+            nums = cast(ArrayObject, page_labels[NameObject('/Nums')])
+            labels: Dict[int, PdfObject] = {int(key): value for key, value in zip(nums[::2], nums[1::2])}
+        else:
+            page_labels = TreeObject()
+            labels = {0: default_page_label}
+        # the labels are edited in a dict and /Nums is rebuilt once, in order
+        new_page_label = DictionaryObject()
+        if style is not None:
+            new_page_label[_cached_name_object('/S')] = NameObject(style)
+        if prefix is not None:
+            new_page_label[_cached_name_object('/P')] = TextStringObject(prefix)
+        if start != 0:
+            new_page_label[_cached_name_object('/St')] = _cached_number_object(start)
+        labels[page_index_from] = new_page_label
+        for index in [index for index in labels if page_index_from < index <= page_index_to]:
+            del labels[index]
+        if page_index_to + 1 not in labels and page_index_to + 1 < len(self.pages):
+            labels[page_index_to + 1] = default_page_label
+        page_labels[NameObject('/Nums')] = ArrayObject(chain.from_iterable(((_cached_number_object(index), labels[index]) for index in sorted(labels))))
+        self._root_object[NameObject(CatalogDictionary.PAGE_LABELS)] = page_labels
\ No newline at end of file
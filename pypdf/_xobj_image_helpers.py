@@ -1,7 +1,9 @@
 """Code in here is only used by pypdf.filters._xobj_to_image"""
+import functools
 import sys
+import weakref
 from io import BytesIO
-from typing import Any, List, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from ._utils import check_if_whitespace_only, logger_warning
 from .constants import ColorSpaces
 from .errors import PdfReadError
@@ -20,6 +22,12 @@ except ImportError:
     raise ImportError("pillow is required to do image extraction. It can be installed via 'pip install pypdf[image]'")
 mode_str_type: TypeAlias = Literal['', '1', 'RGB', '2bits', '4bits', 'P', 'L', 'RGBA', 'CMYK']
 MAX_IMAGE_MODE_NESTING_DEPTH: int = 10
+PACKED_MODES: Dict[str, str] = {'2bits': 'P;2', '4bits': 'P;4'}
+_IMAGEMODE_CACHE_SIZE = 1024
+_IMAGEMODE_CACHE: Dict[Tuple[Any, int, str, int], Tuple[Optional['weakref.ref[Any]'], Tuple[int, ...], Tuple[mode_str_type, bool]]] = {}
+
+def _forget_imagemode(key: Tuple[Any, int, str, int], ref: Any) -> None:
+    _IMAGEMODE_CACHE.pop(key, None)
 
 def _get_imagemode(color_space: Union[str, List[Any], Any], color_components: int, prev_mode: mode_str_type, depth: int=0) -> Tuple[mode_str_type, bool]:
     """
@@ -27,18 +35,168 @@ def _get_imagemode(color_space: Union[str, List[Any], Any], color_components: in
         Image mode not taking into account mask(transparency)
         ColorInversion is required (like for some DeviceCMYK)
     """
-    pass
+    # color spaces are mostly shared between images through indirect objects,
+    # so results are memoized on the identity of the color space object. An
+    # entry only holds a weak reference, which drops it with the object, and
+    # the ids of the array items, to notice arrays changed in place
+    is_name = isinstance(color_space, str)
+    key = (color_space if is_name else id(color_space), color_components, prev_mode, depth)
+    items = tuple(map(id, color_space)) if isinstance(color_space, list) else ()
+    hit = _IMAGEMODE_CACHE.get(key)
+    if hit is not None and (hit[0] is None or hit[0]() is color_space) and hit[1] == items:
+        return hit[2]
+    result = _compute_imagemode(color_space, color_components, prev_mode, depth)
+    ref: Optional['weakref.ref[Any]'] = None
+    if not is_name:
+        try:
+            ref = weakref.ref(color_space, functools.partial(_forget_imagemode, key))
+        except TypeError:
+            return result
+    if len(_IMAGEMODE_CACHE) >= _IMAGEMODE_CACHE_SIZE:
+        _IMAGEMODE_CACHE.clear()
+    _IMAGEMODE_CACHE[key] = (ref, items, result)
+    return result
+
+def _compute_imagemode(color_space: Union[str, List[Any], Any], color_components: int, prev_mode: mode_str_type, depth: int) -> Tuple[mode_str_type, bool]:
+    if depth > MAX_IMAGE_MODE_NESTING_DEPTH:
+        raise PdfReadError('Color spaces nested too deep. If required, consider increasing MAX_IMAGE_MODE_NESTING_DEPTH.')
+    if isinstance(color_space, NullObject):
+        return ('', False)
+    if isinstance(color_space, str):
+        pass
+    elif not isinstance(color_space, list):
+        raise PdfReadError('Cannot interpret colorspace', color_space)
+    elif color_space[0].startswith('/Cal'):
+        color_space = '/Device' + color_space[0][4:]
+    elif color_space[0] == '/ICCBased':
+        icc_profile = color_space[1].get_object()
+        color_components = cast(int, icc_profile['/N'])
+        color_space = icc_profile.get('/Alternate', '')
+    elif color_space[0] == '/Indexed':
+        color_space = color_space[1].get_object()
+        mode2, invert_color = _get_imagemode(color_space, color_components, prev_mode, depth + 1)
+        if mode2 in ('RGB', 'CMYK'):
+            mode2 = 'P'
+        return (mode2, invert_color)
+    elif color_space[0] == '/Separation':
+        color_space = color_space[2]
+        if isinstance(color_space, IndirectObject):
+            color_space = color_space.get_object()
+        mode2, invert_color = _get_imagemode(color_space, color_components, prev_mode, depth + 1)
+        return (mode2, True)
+    elif color_space[0] == '/DeviceN':
+        original_color_space = color_space
+        color_components = len(color_space[1])
+        color_space = color_space[2]
+        if isinstance(color_space, IndirectObject):
+            color_space = color_space.get_object()
+        if color_space == '/DeviceCMYK' and color_components == 1:
+            if original_color_space[1][0] != '/Black':
+                logger_warning(f'Color {original_color_space[1][0]} converted to Gray. Please share PDF with pypdf dev team', __name__)
+            return ('L', True)
+        mode2, invert_color = _get_imagemode(color_space, color_components, prev_mode, depth + 1)
+        return (mode2, invert_color)
+    mode_map = {'1bit': '1', '/DeviceGray': 'L', 'palette': 'P', '/DeviceRGB': 'RGB', '/DeviceCMYK': 'CMYK', '2bit': '2bits', '4bit': '4bits'}
+    mode: mode_str_type = mode_map.get(color_space) or list(mode_map.values())[color_components] or prev_mode  # type: ignore
+    return (mode, mode == 'CMYK')
 
 def _handle_flate(size: Tuple[int, int], data: bytes, mode: mode_str_type, color_space: str, colors: int, obj_as_text: str) -> Tuple[Image.Image, str, str, bool]:
     """
     Process image encoded in flateEncode
     Returns img, image_format, extension, color inversion
     """
-    pass
+    extension = '.png'
+    image_format = 'PNG'
+    lookup: Any
+    base: Any
+    hival: Any
+    if isinstance(color_space, ArrayObject) and color_space[0] == '/Indexed':
+        color_space, base, hival, lookup = (value.get_object() for value in color_space)
+    packed = mode in PACKED_MODES
+    if packed:
+        # pillow unpacks the 2 and 4 bits samples itself, rows being byte aligned
+        img = Image.frombytes('P', size, data, 'raw', PACKED_MODES[mode])
+        mode = 'P'
+    else:
+        img = Image.frombytes(mode, size, data)
+    if color_space == '/Indexed':
+        from .generic import TextStringObject
+        if isinstance(lookup, (EncodedStreamObject, DecodedStreamObject)):
+            lookup = lookup.get_data()
+        if isinstance(lookup, TextStringObject):
+            lookup = lookup.original_bytes
+        if isinstance(lookup, str):
+            lookup = lookup.encode()
+        try:
+            nb, conv, mode = {'1': (0, '', ''), 'L': (1, 'P', 'L'), 'P': (0, '', ''), 'RGB': (3, 'P', 'RGB'), 'CMYK': (4, 'P', 'CMYK')}[_get_imagemode(base, 0, '')[0]]  # type: ignore
+        except KeyError:
+            logger_warning(f'Base {base} not coded please share the pdf file with pypdf dev team', __name__)
+            lookup = None
+        else:
+            if img.mode == '1':
+                expected_count = 2 * nb
+                if len(lookup) != expected_count:
+                    if len(lookup) < expected_count:
+                        raise PdfReadError(f'Not enough lookup values: Expected {expected_count}, got {len(lookup)}.')
+                    if not check_if_whitespace_only(lookup[expected_count:]):
+                        raise PdfReadError(f'Too many lookup values: Expected {expected_count}, got {len(lookup)}.')
+                    lookup = lookup[:expected_count]
+                colors_arr = [lookup[:nb], lookup[nb:]]
+                arr = b''.join([b''.join([colors_arr[1 if img.getpixel((x, y)) > 127 else 0] for x in range(img.size[0])]) for y in range(img.size[1])])  # type: ignore
+                img = Image.frombytes(mode, img.size, arr)
+            else:
+                img = img.convert(conv)
+                if len(lookup) != (hival + 1) * nb:
+                    logger_warning(f'Invalid Lookup Table in {obj_as_text}', __name__)
+                    lookup = None
+                elif mode == 'L':
+                    lookup = b''.join([bytes([b, b, b]) for b in lookup])
+                    mode = 'RGB'
+                elif mode == 'CMYK':
+                    _rgb = []
+                    for _c, _m, _y, _k in (lookup[n:n + 4] for n in range(0, 4 * (len(lookup) // 4), 4)):
+                        _r = int(255 * (1 - _c / 255) * (1 - _k / 255))
+                        _g = int(255 * (1 - _m / 255) * (1 - _k / 255))
+                        _b = int(255 * (1 - _y / 255) * (1 - _k / 255))
+                        _rgb.append(bytes((_r, _g, _b)))
+                    lookup = b''.join(_rgb)
+                    mode = 'RGB'
+                if lookup is not None:
+                    img.putpalette(lookup, rawmode=mode)
+            img = img.convert('L' if base == ColorSpaces.DEVICE_GRAY else 'RGB')
+    elif not isinstance(color_space, NullObject) and color_space[0] == '/ICCBased':
+        mode2 = _get_imagemode(color_space, colors, mode)[0]
+        if mode != mode2:
+            if packed:
+                # data still holds the packed samples: reuse those unpacked by pillow
+                data = img.tobytes()
+            img = Image.frombytes(mode2, size, data)
+    if mode == 'CMYK':
+        extension = '.tif'
+        image_format = 'TIFF'
+    return (img, image_format, extension, False)
 
 def _handle_jpx(size: Tuple[int, int], data: bytes, mode: mode_str_type, color_space: str, colors: int) -> Tuple[Image.Image, str, str, bool]:
     """
     Process image encoded in flateEncode
     Returns img, image_format, extension, inversion
     """
-    pass
\ No newline at end of file
+    extension = '.jp2'
+    img1 = Image.open(BytesIO(data), formats=('JPEG2000',))
+    mode, invert_color = _get_imagemode(color_space, colors, mode)
+    if mode == '':
+        mode = cast(mode_str_type, img1.mode)
+        invert_color = mode in ('CMYK',)
+    if img1.mode == 'RGBA' and mode == 'RGB':
+        mode = 'RGBA'
+    try:
+        if img1.mode != mode or img1.size != (size[0], size[1]):
+            img = Image.frombytes(mode, img1.size, img1.tobytes())
+        else:
+            img = img1
+    except OSError:
+        img = Image.frombytes(mode, img1.size, img1.tobytes())
+    if img.mode == 'CMYK':
+        img = img.convert('RGB')
+    image_format = 'JPEG2000'
+    return (img, image_format, extension, invert_color)
\ No newline at end of file
@@ -2,10 +2,11 @@ from abc import ABC
 from ..constants import AnnotationFlag
 from ..generic import NameObject, NumberObject
 from ..generic._data_structures import DictionaryObject
+_ANNOT_TYPE_KEY = NameObject('/Type')
+_ANNOT_TYPE_VAL = NameObject('/Annot')
 
 class AnnotationDictionary(DictionaryObject, ABC):
 
     def __init__(self) -> None:
-        from ..generic._base import NameObject
-        self[NameObject('/Type')] = NameObject('/Annot')
+        self[_ANNOT_TYPE_KEY] = _ANNOT_TYPE_VAL
 NO_FLAGS = AnnotationFlag(0)
\ No newline at end of file
@@ -10,8 +10,9 @@ https://opensource.adobe.com/dc-acrobat-sdk-docs/pdfstandards/PDF32000_2008.pdf
 
 ISO 32000-2:2020 (PDF 2.0)
 """
+import sys
 from enum import IntFlag, auto
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Type
 from ._utils import classproperty, deprecate_with_replacement
 
 class Core:
@@ -87,21 +88,37 @@ class UserAccessPermissions(IntFlag):
     @classmethod
     def _is_reserved(cls, name: str) -> bool:
         """Check if the given name corresponds to a reserved flag entry."""
-        pass
+        return name.startswith('R') and name[1:].isdigit()
 
     @classmethod
     def _is_active(cls, name: str) -> bool:
         """Check if the given reserved name defaults to 1 = active."""
-        pass
+        return name not in {'R1', 'R2'}
 
     def to_dict(self) -> Dict[str, bool]:
         """Convert the given flag value to a corresponding verbose name mapping."""
-        pass
+        value = int(self)
+        return {name: value & bit == bit for name, bit in _UAP_NAMED_BITS}
 
     @classmethod
     def from_dict(cls, value: Dict[str, bool]) -> 'UserAccessPermissions':
         """Convert the verbose name mapping to the corresponding flag value."""
-        pass
+        if not value.keys() <= _UAP_NAME_TO_BIT.keys():
+            unknown = {key: val for key, val in value.items() if key not in _UAP_NAME_TO_BIT}
+            raise ValueError(f'Unknown dictionary keys: {unknown!r}')
+        result = _UAP_RESERVED_ACTIVE
+        for name, is_active in value.items():
+            if is_active:
+                result |= _UAP_NAME_TO_BIT[name]
+        return cls(result)
+
+    @classmethod
+    def all(cls) -> 'UserAccessPermissions':
+        return cls(2 ** 32 - 1 - cls.R1 - cls.R2)
+
+_UAP_NAMED_BITS: Tuple[Tuple[str, int], ...] = tuple(((name.lower(), member.value) for name, member in UserAccessPermissions.__members__.items() if not UserAccessPermissions._is_reserved(name)))
+_UAP_NAME_TO_BIT: Dict[str, int] = dict(_UAP_NAMED_BITS)
+_UAP_RESERVED_ACTIVE = sum((member.value for name, member in UserAccessPermissions.__members__.items() if UserAccessPermissions._is_reserved(name) and UserAccessPermissions._is_active(name)))
 
 class Resources:
     """
@@ -391,7 +408,7 @@ class FieldDictionaryAttributes:
         Returns:
             A tuple containing all the attribute constants.
         """
-        pass
+        return _FIELD_DICTIONARY_ATTRIBUTES
 
     @classmethod
     def attributes_dict(cls) -> Dict[str, str]:
@@ -407,7 +424,10 @@ class FieldDictionaryAttributes:
         Returns:
             A dictionary containing attribute keys and their names.
         """
-        pass
+        return dict(_FIELD_DICTIONARY_ATTRIBUTES_DICT)
+
+_FIELD_DICTIONARY_ATTRIBUTES = (FieldDictionaryAttributes.TM, FieldDictionaryAttributes.T, FieldDictionaryAttributes.FT, FieldDictionaryAttributes.Parent, FieldDictionaryAttributes.TU, FieldDictionaryAttributes.Ff, FieldDictionaryAttributes.V, FieldDictionaryAttributes.DV, FieldDictionaryAttributes.Kids, FieldDictionaryAttributes.AA)
+_FIELD_DICTIONARY_ATTRIBUTES_DICT: Dict[str, str] = {FieldDictionaryAttributes.FT: 'Field Type', FieldDictionaryAttributes.Parent: 'Parent', FieldDictionaryAttributes.T: 'Field Name', FieldDictionaryAttributes.TU: 'Alternate Field Name', FieldDictionaryAttributes.TM: 'Mapping Name', FieldDictionaryAttributes.Ff: 'Field Flags', FieldDictionaryAttributes.V: 'Value', FieldDictionaryAttributes.DV: 'Default Value'}
 
 class CheckboxRadioButtonAttributes:
     """Table 8.76 Field flags common to all field types."""
@@ -426,7 +446,7 @@ class CheckboxRadioButtonAttributes:
         Returns:
             A tuple containing all the attribute constants.
         """
-        pass
+        return _CHECKBOX_RADIO_BUTTON_ATTRIBUTES
 
     @classmethod
     def attributes_dict(cls) -> Dict[str, str]:
@@ -442,7 +462,10 @@ class CheckboxRadioButtonAttributes:
         Returns:
             A dictionary containing attribute keys and their names.
         """
-        pass
+        return dict(_CHECKBOX_RADIO_BUTTON_ATTRIBUTES_DICT)
+
+_CHECKBOX_RADIO_BUTTON_ATTRIBUTES = (CheckboxRadioButtonAttributes.Opt,)
+_CHECKBOX_RADIO_BUTTON_ATTRIBUTES_DICT: Dict[str, str] = {CheckboxRadioButtonAttributes.Opt: 'Options'}
 
 class FieldFlag(IntFlag):
     """Table 8.70 Field flags common to all field types."""
@@ -569,6 +592,14 @@ class AnnotationFlag(IntFlag):
     LOCKED_CONTENTS = 512
 PDF_KEYS = (AnnotationDictionaryAttributes, CatalogAttributes, CatalogDictionary, CcittFaxDecodeParameters, CheckboxRadioButtonAttributes, ColorSpaces, Core, DocumentInformationAttributes, EncryptionDictAttributes, FieldDictionaryAttributes, FilterTypeAbbreviations, FilterTypes, GoToActionArguments, GraphicsStateParameters, ImageAttributes, FileSpecificationDictionaryEntries, LzwFilterParameters, PageAttributes, PageLayouts, PagesAttributes, Resources, StreamAttributes, TrailerKeys, TypArguments, TypFitArguments)
 
+def _intern_names(*classes: Type[object]) -> None:
+    """Intern the "/Name" constants of the classes, so equal keys share one object."""
+    for cls in classes:
+        for attr, value in list(vars(cls).items()):
+            if isinstance(value, str) and value.startswith('/'):
+                setattr(cls, attr, sys.intern(value))
+_intern_names(*PDF_KEYS, InteractiveFormDictEntries, PageLabelStyle)
+
 class ImageType(IntFlag):
     NONE = 0
     XOBJECT_IMAGES = auto()
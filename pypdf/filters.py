@@ -5,6 +5,7 @@ See TABLE H.1 Abbreviations for standard filter names
 """
 __author__ = 'Mathieu Fenniak'
 __author_email__ = 'biziqe@mathieu.fenniak.net'
+import binascii
 import math
 import struct
 import zlib
@@ -21,6 +22,13 @@ from .constants import LzwFilterParameters as LZW
 from .constants import StreamAttributes as SA
 from .errors import DeprecationError, PdfReadError, PdfStreamError
 from .generic import ArrayObject, DictionaryObject, IndirectObject, NullObject
+try:
+    from isal import isal_zlib as _deflate_zlib
+except ImportError:
+    _deflate_zlib = zlib
+FLATE_CHUNK_SIZE = 1024 * 1024
+# PDF whitespace (§7.2.2) plus the vertical tab, which isspace() also skipped
+_ASCII_HEX_WHITESPACE = b' \t\n\r\x0b\x0c\x00'
 
 def decompress(data: bytes) -> bytes:
     """
@@ -30,13 +38,37 @@ def decompress(data: bytes) -> bytes:
     decompression fails due to a zlib error, it falls back to using a
     decompression object with a larger window size.
 
+    If ``isal`` is installed, its faster inflate implementation is tried
+    first; the fallbacks always use zlib.
+
     Args:
         data: The input data to be decompressed.
 
     Returns:
         The decompressed data.
     """
-    pass
+    try:
+        # inflated chunk by chunk, like FlateDecode.encode compresses; a
+        # truncated stream yields what was decoded, as the fallback would
+        decompressor = _deflate_zlib.decompressobj()
+        view = memoryview(data)
+        chunks = [decompressor.decompress(view[i:i + FLATE_CHUNK_SIZE]) for i in range(0, len(view), FLATE_CHUNK_SIZE)]
+        chunks.append(decompressor.flush())
+        return b''.join(chunks)
+    except (zlib.error, _deflate_zlib.error):
+        # damaged streams are recovered with zlib, whose partial output
+        # on truncated data the fallbacks rely on
+        try:
+            return zlib.decompressobj().decompress(data)
+        except zlib.error:
+            d = zlib.decompressobj(zlib.MAX_WBITS | 32)
+            result_str = b''
+            for b in [data[i:i + 1] for i in range(len(data))]:
+                try:
+                    result_str += d.decompress(b)
+                except zlib.error:
+                    pass
+            return result_str
 
 class FlateDecode:
 
@@ -56,13 +88,115 @@ class FlateDecode:
         Raises:
           PdfReadError:
         """
-        pass
+        if isinstance(decode_parms, ArrayObject):
+            raise DeprecationError('decode_parms as ArrayObject is deprecated')
+        str_data = decompress(data)
+        predictor = 1
+        if decode_parms:
+            try:
+                predictor = decode_parms.get('/Predictor', 1)
+            except (AttributeError, TypeError):
+                pass
+        if predictor != 1:
+            DEFAULT_BITS_PER_COMPONENT = 8
+            try:
+                columns = cast(int, decode_parms[LZW.COLUMNS].get_object())  # type: ignore
+            except (TypeError, KeyError):
+                columns = 1
+            try:
+                colors = cast(int, decode_parms[LZW.COLORS].get_object())  # type: ignore
+            except (TypeError, KeyError):
+                colors = 1
+            try:
+                bits_per_component = cast(int, decode_parms[LZW.BITS_PER_COMPONENT].get_object())  # type: ignore
+            except (TypeError, KeyError):
+                bits_per_component = DEFAULT_BITS_PER_COMPONENT
+            rowlength = math.ceil(columns * colors * bits_per_component / 8) + 1
+            if predictor == 2:
+                rowlength -= 1
+                bpp = rowlength // columns
+                buf = bytearray(str_data)
+                for row in range(0, len(buf), rowlength):
+                    for i in range(row + bpp, min(row + rowlength, len(buf))):
+                        buf[i] = buf[i] + buf[i - bpp] & 255
+                str_data = bytes(buf)
+            elif 10 <= predictor <= 15:
+                str_data = FlateDecode._decode_png_prediction(str_data, columns, rowlength)
+            else:
+                raise PdfReadError(f'Unsupported flatedecode predictor {predictor!r}')
+        return str_data
+
+    @staticmethod
+    def _decode_png_prediction(data: bytes, columns: int, rowlength: int) -> bytes:
+        if len(data) % rowlength != 0:
+            raise PdfReadError('Image data is not rectangular')
+        width = rowlength - 1
+        bpp = width // columns
+        # the Up filter adds whole rows as big integers; the top bit of each
+        # byte is summed separately so that no carry crosses a byte boundary
+        low = int.from_bytes(b'\x7f' * width, 'big')
+        high = int.from_bytes(b'\x80' * width, 'big')
+        output: bytearray = bytearray()
+        view = memoryview(data)
+        prev: Union[bytes, bytearray] = bytes(width)
+        # the row above as an integer, kept while Up rows follow each other
+        prev_int: Optional[int] = 0
+        for row in range(0, len(data), rowlength):
+            filter_byte = data[row]
+            if filter_byte == 2:
+                a = int.from_bytes(view[row + 1:row + rowlength], 'big')
+                b = int.from_bytes(prev, 'big') if prev_int is None else prev_int
+                prev_int = (a & low) + (b & low) ^ (a ^ b) & high
+                prev = prev_int.to_bytes(width, 'big')
+                output += prev
+                continue
+            prev_int = None
+            rowdata = bytearray(view[row + 1:row + rowlength])
+            if filter_byte == 0:
+                pass
+            elif filter_byte == 1:
+                for i in range(bpp, width):
+                    rowdata[i] = rowdata[i] + rowdata[i - bpp] & 255
+            elif filter_byte == 3:
+                for i in range(bpp):
+                    rowdata[i] = rowdata[i] + (prev[i] >> 1) & 255
+                for i in range(bpp, width):
+                    rowdata[i] = rowdata[i] + (rowdata[i - bpp] + prev[i] >> 1) & 255
+            elif filter_byte == 4:
+                for i in range(bpp):
+                    rowdata[i] = rowdata[i] + prev[i] & 255
+                for i in range(bpp, width):
+                    left = rowdata[i - bpp]
+                    up = prev[i]
+                    up_left = prev[i - bpp]
+                    p = left + up - up_left
+                    dist_left = abs(p - left)
+                    dist_up = abs(p - up)
+                    dist_up_left = abs(p - up_left)
+                    if dist_left <= dist_up and dist_left <= dist_up_left:
+                        paeth = left
+                    elif dist_up <= dist_up_left:
+                        paeth = up
+                    else:
+                        paeth = up_left
+                    rowdata[i] = rowdata[i] + paeth & 255
+            else:
+                raise PdfReadError(f'Unsupported PNG filter {filter_byte!r}')
+            output += rowdata
+            prev = rowdata
+        return bytes(output)
 
     @staticmethod
     def encode(data: bytes, level: int=-1) -> bytes:
         """
         Compress the input data using zlib.
 
+        If ``isal`` is installed, its faster deflate implementation is used.
+        It only knows levels 0 to 3: levels 1 to 9 are capped at 3 and the
+        default level maps to its default. Level 0, which stores the data
+        without compressing it, is always left to zlib, as isal level 0
+        still compresses.
+
         Args:
             data: The data to be compressed.
             level: See https://docs.python.org/3/library/zlib.html#zlib.compress
@@ -70,7 +204,17 @@ class FlateDecode:
         Returns:
             The compressed data.
         """
-        pass
+        if level == 0:
+            # stored blocks follow the input chunks, so a chunked store
+            # would not match zlib.compress
+            return zlib.compress(data, 0)
+        if _deflate_zlib is not zlib:
+            level = _deflate_zlib.ISAL_DEFAULT_COMPRESSION if level < 0 else min(level, _deflate_zlib.ISAL_BEST_COMPRESSION)
+        compressor = _deflate_zlib.compressobj(level)
+        view = memoryview(data)
+        chunks = [compressor.compress(view[i:i + FLATE_CHUNK_SIZE]) for i in range(0, len(view), FLATE_CHUNK_SIZE)]
+        chunks.append(compressor.flush())
+        return b''.join(chunks)
 
 class ASCIIHexDecode:
     """
@@ -96,7 +240,22 @@ class ASCIIHexDecode:
         Raises:
           PdfStreamError:
         """
-        pass
+        if isinstance(data, str):
+            data = data.encode()
+        eod = data.find(b'>')
+        if eod < 0:
+            logger_warning('missing EOD in ASCIIHexDecode, check if output is OK', __name__)
+        else:
+            data = data[:eod]
+        # whitespace removed and the digits converted by C code in two passes,
+        # rather than a pair of digits at a time
+        data = data.translate(None, _ASCII_HEX_WHITESPACE)
+        if len(data) % 2:
+            data += b'0'
+        try:
+            return binascii.unhexlify(data)
+        except binascii.Error as exc:
+            raise PdfStreamError(f'Invalid hexadecimal data in ASCIIHexDecode: {exc}') from exc
 
 class RunLengthDecode:
     """
@@ -127,7 +286,28 @@ class RunLengthDecode:
         Raises:
           PdfStreamError:
         """
-        pass
+        # runs are copied from a view and repeated as whole slices by C code
+        view = memoryview(data)
+        out = bytearray()
+        index = 0
+        size = len(data)
+        while True:
+            if index >= size:
+                logger_warning('missing EOD in RunLengthDecode, check if output is OK', __name__)
+                break
+            length = data[index]
+            index += 1
+            if length == 128:
+                if index < size:
+                    raise PdfStreamError('early EOD in RunLengthDecode')
+                break
+            if length < 128:
+                out += view[index:index + length + 1]
+                index += length + 1
+            else:
+                out += data[index:index + 1] * (257 - length)
+                index += 1
+        return bytes(out)
 
 class LZWDecode:
     """
@@ -145,9 +325,9 @@ class LZWDecode:
             self.data = data
             self.bytepos = 0
             self.bitpos = 0
-            self.dict = [''] * 4096
-            for i in range(256):
-                self.dict[i] = chr(i)
+            self.dict = [bytes((i,)) for i in range(256)] + [b''] * (4096 - 256)
+            self.dictlen: int
+            self.bitspercode: int
             self.reset_dict()
 
         def decode(self) -> str:
@@ -162,7 +342,67 @@ class LZWDecode:
             Raises:
               PdfReadError: If the stop code is missing
             """
-            pass
+            return self.decode_bytes().decode('latin-1')
+
+        def decode_bytes(self) -> bytes:
+            """
+            Same as :meth:`decode`, without the final conversion to ``str``.
+
+            Raises:
+              PdfReadError: If the stop code is missing
+            """
+            data = b_(self.data)
+            size = len(data)
+            table = self.dict
+            dictlen = self.dictlen
+            width = self.bitspercode
+            pos = self.bytepos
+            # codes are read MSB first from a rolling integer buffer instead
+            # of being assembled bit by bit
+            buf = 0
+            nbits = 0
+            out = bytearray()
+            cW = self.CLEARDICT
+            while True:
+                pW = cW
+                while nbits < width:
+                    if pos >= size:
+                        raise PdfReadError('Missed the stop code in LZWDecode!')
+                    buf = buf << 8 | data[pos]
+                    pos += 1
+                    nbits += 8
+                nbits -= width
+                cW = buf >> nbits
+                buf &= (1 << nbits) - 1
+                if cW == self.STOP:
+                    break
+                if cW == self.CLEARDICT:
+                    dictlen = 258
+                    width = 9
+                    continue
+                if pW == self.CLEARDICT:
+                    out += table[cW]
+                    continue
+                if cW < dictlen:
+                    entry = table[cW]
+                    p = table[pW] + entry[:1]
+                else:
+                    p = table[pW] + table[pW][:1]
+                    entry = p
+                out += entry
+                if dictlen < 4096:
+                    table[dictlen] = p
+                    dictlen += 1
+                if dictlen >= (1 << width) - 1 and width < 12:
+                    width += 1
+            self.bytepos = pos
+            self.dictlen = dictlen
+            self.bitspercode = width
+            return bytes(out)
+
+        def reset_dict(self) -> None:
+            self.dictlen = 258
+            self.bitspercode = 9
 
     @staticmethod
     def decode(data: bytes, decode_parms: Optional[DictionaryObject]=None, **kwargs: Any) -> str:
@@ -176,7 +416,11 @@ class LZWDecode:
         Returns:
           decoded data.
         """
-        pass
+        return LZWDecode.Decoder(data).decode()
+
+    @staticmethod
+    def _decodeb(data: bytes, decode_parms: Optional[DictionaryObject]=None, **kwargs: Any) -> bytes:
+        return LZWDecode.Decoder(data).decode_bytes()
 
 class ASCII85Decode:
     """Decodes string ASCII85-encoded data into a byte format."""
@@ -193,13 +437,29 @@ class ASCII85Decode:
         Returns:
           decoded data.
         """
-        pass
+        if isinstance(data, str):
+            data = data.encode()
+        data = data.strip(WHITESPACES_AS_BYTES)
+        # the framing is handled here, so that a85decode only sees the groups;
+        # they are passed as a view, which a85decode copies once
+        start = 2 if data.startswith(b'<~') else 0
+        eod = data.find(b'~>', start)
+        if eod < 0:
+            logger_warning('Ignoring missing Ascii85 end marker.', __name__)
+            eod = len(data)
+        return a85decode(memoryview(data)[start:eod], adobe=False, ignorechars=WHITESPACES_AS_BYTES)
 
 class DCTDecode:
-    pass
+
+    @staticmethod
+    def decode(data: bytes, decode_parms: Optional[DictionaryObject]=None, **kwargs: Any) -> bytes:
+        return data
 
 class JPXDecode:
-    pass
+
+    @staticmethod
+    def decode(data: bytes, decode_parms: Optional[DictionaryObject]=None, **kwargs: Any) -> bytes:
+        return data
 
 class CCITParameters:
     """§7.4.6, optional parameters for the CCITTFaxDecode filter."""
@@ -213,6 +473,14 @@ class CCITParameters:
         self.rows = rows
         self.DamagedRowsBeforeError = None
 
+    @property
+    def group(self) -> int:
+        if self.K < 0:
+            CCITTgroup = 4
+        else:
+            CCITTgroup = 3
+        return CCITTgroup
+
 class CCITTFaxDecode:
     """
     §7.4.6, CCITTFaxDecode filter (ISO 32000).
@@ -223,6 +491,64 @@ class CCITTFaxDecode:
     §7.4.6, optional parameters for the CCITTFaxDecode filter.
     """
 
+    @staticmethod
+    def _get_parameters(parameters: Union[None, ArrayObject, DictionaryObject, IndirectObject], rows: int) -> CCITParameters:
+        k = 0
+        columns = 1728
+        if parameters:
+            parameters_unwrapped = cast(Union[ArrayObject, DictionaryObject], parameters.get_object())
+            if isinstance(parameters_unwrapped, ArrayObject):
+                for decode_parm in parameters_unwrapped:
+                    if CCITT.COLUMNS in decode_parm:
+                        columns = decode_parm[CCITT.COLUMNS]
+                    if CCITT.K in decode_parm:
+                        k = decode_parm[CCITT.K]
+            else:
+                if CCITT.COLUMNS in parameters_unwrapped:
+                    columns = parameters_unwrapped[CCITT.COLUMNS]  # type: ignore
+                if CCITT.K in parameters_unwrapped:
+                    k = parameters_unwrapped[CCITT.K]  # type: ignore
+        return CCITParameters(k, columns, rows)
+
+    @staticmethod
+    def decode(data: bytes, decode_parms: Optional[DictionaryObject]=None, height: int=0, **kwargs: Any) -> bytes:
+        """
+        Wrap the fax data into a single strip TIFF file.
+
+        The data is not decompressed here: the bit-level Group 3 and Group 4
+        decoding is left to Pillow (libtiff) when the image is opened.
+
+        Args:
+          data: CCITT encoded data.
+          decode_parms: a dictionary of parameter values.
+          height: the number of rows of the image.
+
+        Returns:
+          A TIFF file holding the encoded data.
+        """
+        if isinstance(decode_parms, ArrayObject):
+            deprecation_no_replacement('decode_parms being an ArrayObject', removed_in='3.15.5')
+        params = CCITTFaxDecode._get_parameters(decode_parms, height)
+        img_size = len(data)
+        tiff_header_struct = '<2shlh' + 'hhll' * 8 + 'h'
+        tiff_header = struct.pack(
+            tiff_header_struct,
+            b'II',  # byte order: little endian
+            42,  # version number
+            8,  # offset to the first IFD
+            8,  # number of tags in the IFD
+            256, 4, 1, params.columns,  # ImageWidth
+            257, 4, 1, params.rows,  # ImageLength
+            258, 3, 1, 1,  # BitsPerSample
+            259, 3, 1, params.group,  # Compression: 3 or 4 for CCITT Group 3 / 4
+            262, 3, 1, 0,  # PhotometricInterpretation: WhiteIsZero
+            273, 4, 1, struct.calcsize(tiff_header_struct),  # StripOffsets
+            278, 4, 1, params.rows,  # RowsPerStrip
+            279, 4, 1, img_size,  # StripByteCounts
+            0,  # no next IFD
+        )
+        return tiff_header + data
+
 def decode_stream_data(stream: Any) -> Union[bytes, str]:
     """
     Decode the stream data based on the specified filters.
@@ -241,7 +567,45 @@ def decode_stream_data(stream: Any) -> Union[bytes, str]:
     Raises:
         NotImplementedError: If an unsupported filter type is encountered.
     """
-    pass
+    filters = stream.get(SA.FILTER, ())
+    if isinstance(filters, IndirectObject):
+        filters = cast(ArrayObject, filters.get_object())
+    if not isinstance(filters, ArrayObject):
+        # we have a single filter instance
+        filters = (filters,)
+    decodparms = stream.get(SA.DECODE_PARMS, ({},) * len(filters))
+    if not isinstance(decodparms, (list, tuple)):
+        decodparms = (decodparms,)
+    data: bytes = b_(stream._data)
+    # If there is not data to decode we should not try to decode the data.
+    if data:
+        for filter_type, params in zip(filters, decodparms):
+            if isinstance(params, NullObject):
+                params = {}
+            if filter_type in (FT.FLATE_DECODE, FTA.FL):
+                data = FlateDecode.decode(data, params)
+            elif filter_type in (FT.ASCII_HEX_DECODE, FTA.AHx):
+                data = ASCIIHexDecode.decode(data)
+            elif filter_type in (FT.RUN_LENGTH_DECODE, FTA.RL):
+                data = RunLengthDecode.decode(data)
+            elif filter_type in (FT.LZW_DECODE, FTA.LZW):
+                data = LZWDecode._decodeb(data, params)
+            elif filter_type in (FT.ASCII_85_DECODE, FTA.A85):
+                data = ASCII85Decode.decode(data)
+            elif filter_type == FT.DCT_DECODE:
+                data = DCTDecode.decode(data)
+            elif filter_type == FT.JPX_DECODE:
+                data = JPXDecode.decode(data)
+            elif filter_type == FT.CCITT_FAX_DECODE:
+                height = stream.get(IA.HEIGHT, ())
+                data = CCITTFaxDecode.decode(data, params, height)
+            elif filter_type == '/Crypt':
+                if '/Name' in params or '/Type' in params:
+                    raise NotImplementedError('/Crypt filter with /Name or /Type not supported yet')
+            else:
+                # Unsupported filter
+                raise NotImplementedError(f'unsupported filter {filter_type}')
+    return data
 
 def decodeStreamData(stream: Any) -> Union[str, bytes]:
     """Deprecated. Use decode_stream_data."""
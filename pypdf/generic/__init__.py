@@ -102,6 +102,11 @@ def createStringObject(
 
 PAGE_FIT = Fit.fit()
 
+# plain ints, so that building the /F entry of an outline item does not go
+# through the IntFlag machinery
+_OUTLINE_FONT_ITALIC = int(OutlineFontFlag.italic)
+_OUTLINE_FONT_BOLD = int(OutlineFontFlag.bold)
+
 
 class AnnotationBuilder:
     """
@@ -420,6 +425,35 @@ class AnnotationBuilder:
         )
 
 
+def _create_outline_item(
+    action_ref: Union[None, IndirectObject],
+    title: str,
+    color: Union[Tuple[float, float, float], str, None],
+    italic: bool,
+    bold: bool,
+) -> TreeObject:
+    outline_item = TreeObject()
+    if action_ref is not None:
+        outline_item[NameObject("/A")] = action_ref
+    outline_item.update(
+        {
+            NameObject("/Title"): create_string_object(title),
+        }
+    )
+    if color:
+        if isinstance(color, str):
+            color = hex_to_rgb(color)
+        outline_item.update(
+            {NameObject("/C"): ArrayObject([FloatObject(c) for c in color])}
+        )
+    format_flag = (_OUTLINE_FONT_ITALIC if italic else 0) | (
+        _OUTLINE_FONT_BOLD if bold else 0
+    )
+    if format_flag:
+        outline_item.update({NameObject("/F"): NumberObject(format_flag)})
+    return outline_item
+
+
 __all__ = [
     # Base types
     "BooleanObject",
@@ -1,10 +1,11 @@
 import binascii
 import codecs
+import functools
 import hashlib
 import re
 from binascii import unhexlify
 from math import log10
-from typing import Any, Callable, ClassVar, Dict, Optional, Sequence, Union, cast
+from typing import Any, Callable, ClassVar, Dict, Optional, Sequence, Tuple, Union, cast
 from .._codecs import _pdfdoc_encoding_rev
 from .._protocols import PdfObjectProtocol, PdfWriterProtocol
 from .._utils import StreamType, b_, deprecate_no_replacement, logger_warning, read_non_whitespace, read_until_regex, str_
@@ -12,10 +13,36 @@ from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfReadError, PdfStreamError
 __author__ = 'Mathieu Fenniak'
 __author_email__ = 'biziqe@mathieu.fenniak.net'
 
+_STRING_ESCAPE_PATTERN = re.compile(b'[^0-9A-Za-z ]')
+_OCTAL_ESCAPES = [b'\\%03o' % i for i in range(256)]
+_PDFDOC_ENCODABLE = frozenset(_pdfdoc_encoding_rev)
+
+def _escape_string_byte(m: 're.Match[bytes]') -> bytes:
+    return _OCTAL_ESCAPES[m[0][0]]
+
+def _renumber_name_char(m: 're.Match[str]') -> str:
+    return ''.join([f'#{x:02X}' for x in m[0].encode('utf-8')])
+
+def _unnumber_name_escape(m: 're.Match[bytes]') -> bytes:
+    return unhexlify(m[1])
+
 class PdfObject(PdfObjectProtocol):
-    hash_func: Callable[..., 'hashlib._Hash'] = hashlib.sha1
+    # blake2b objects are not typed as hashlib._Hash
+    hash_func: Callable[..., Any] = functools.partial(hashlib.blake2b, digest_size=20)
     indirect_reference: Optional['IndirectObject']
 
+    def hash_value_data(self) -> bytes:
+        return f'{self}'.encode()
+
+    def hash_value(self) -> bytes:
+        """
+        Return a digest identifying the object by type and content.
+
+        The digest is computed with :attr:`hash_func`, a 20 byte BLAKE2b by
+        default; set it to ``hashlib.sha1`` to get the previous values back.
+        """
+        return f'{self.__class__.__name__}:{self.hash_func(self.hash_value_data()).hexdigest()}'.encode()
+
     def clone(self, pdf_dest: PdfWriterProtocol, force_duplicate: bool=False, ignore_fields: Optional[Sequence[Union[str, int]]]=()) -> 'PdfObject':
         """
         Clone object into pdf_dest (PdfWriterProtocol which is an interface for PdfWriter).
@@ -57,7 +84,7 @@ class PdfObject(PdfObjectProtocol):
 
     def get_object(self) -> Optional['PdfObject']:
         """Resolve indirect references."""
-        pass
+        return self
 
 class NullObject(PdfObject):
 
@@ -102,14 +129,31 @@ class IndirectObject(PdfObject):
     def __deepcopy__(self, memo: Any) -> 'IndirectObject':
         return IndirectObject(self.idnum, self.generation, self.pdf)
 
+    def get_object(self) -> Optional['PdfObject']:
+        return self.pdf.get_object(self)
+
+    def _get_object_with_check(self) -> Optional['PdfObject']:
+        o = self.pdf.get_object(self)
+        if isinstance(o, IndirectObject):
+            raise PdfStreamError(f'{self.__repr__()} references an IndirectObject {o.__repr__()}')
+        return o
+
     def __getattr__(self, name: str) -> Any:
+        # only reached for names IndirectObject lacks; resolved inline as
+        # this proxies most attribute reads on referenced objects
+        o = self.pdf.get_object(self)
+        if isinstance(o, IndirectObject):
+            raise PdfStreamError(f'{self.__repr__()} references an IndirectObject {o.__repr__()}')
         try:
-            return getattr(self._get_object_with_check(), name)
+            return getattr(o, name)
         except AttributeError:
             raise AttributeError(f'No attribute {name} found in IndirectObject or pointed object')
 
     def __getitem__(self, key: Any) -> Any:
-        return self._get_object_with_check()[key]
+        o = self.pdf.get_object(self)
+        if isinstance(o, IndirectObject):
+            raise PdfStreamError(f'{self.__repr__()} references an IndirectObject {o.__repr__()}')
+        return o[key]
 
     def __str__(self) -> str:
         return self.get_object().__str__()
@@ -124,6 +168,14 @@ class IndirectObject(PdfObject):
         return not self.__eq__(other)
 FLOAT_WRITE_PRECISION = 8
 
+@functools.lru_cache(maxsize=4096)
+def _float_repr(value: float, precision: int) -> str:
+    """Format a float with ``precision`` significant digits and no trailing zeros."""
+    if value == 0:
+        return '0.0'
+    nb = precision - int(log10(abs(value)))
+    return f'{value:.{max(1, nb)}f}'.rstrip('0').rstrip('.')
+
 class FloatObject(float, PdfObject):
 
     def __new__(cls, value: Union[str, Any]='0.0', context: Optional[Any]=None) -> 'FloatObject':
@@ -138,9 +190,19 @@ class FloatObject(float, PdfObject):
         """Clone object into pdf_dest."""
         pass
 
+    def myrepr(self) -> str:
+        # coordinates repeat a lot in content streams, so the formatting is
+        # cached per value
+        return _float_repr(float(self), FLOAT_WRITE_PRECISION)
+
     def __repr__(self) -> str:
         return self.myrepr()
 
+    def write_to_stream(self, stream: StreamType, encryption_key: Union[None, str, bytes]=None) -> None:
+        if encryption_key is not None:
+            deprecate_no_replacement('the encryption_key parameter of write_to_stream', '5.0.0')
+        stream.write(self.myrepr().encode('utf8'))
+
 class NumberObject(int, PdfObject):
     NumberPattern = re.compile(b'[^+-.0-9]')
 
@@ -155,6 +217,28 @@ class NumberObject(int, PdfObject):
         """Clone object into pdf_dest."""
         pass
 
+    def write_to_stream(self, stream: StreamType, encryption_key: Union[None, str, bytes]=None) -> None:
+        if encryption_key is not None:
+            deprecate_no_replacement('the encryption_key parameter of write_to_stream', '5.0.0')
+        stream.write(b'%d' % self)
+
+    @staticmethod
+    def read_from_stream(stream: StreamType) -> Union['NumberObject', 'FloatObject']:
+        num = read_until_regex(stream, NumberObject.NumberPattern)
+        if num.find(b'.') != -1:
+            return FloatObject(num)
+        return NumberObject(num)
+
+@functools.lru_cache(maxsize=4096)
+def _cached_number_object(value: int) -> NumberObject:
+    """
+    Return a shared NumberObject for the value.
+
+    Only for direct values created by pypdf, like the keys of a number tree:
+    the object is shared, so it must never be made indirect.
+    """
+    return NumberObject(value)
+
 class ByteStringObject(bytes, PdfObject):
     """
     Represents a string object where the text encoding could not be determined.
@@ -184,6 +268,7 @@ class TextStringObject(str, PdfObject):
     autodetect_pdfdocencoding: bool
     autodetect_utf16: bool
     utf16_bom: bytes
+    _original_bytes: Optional[Tuple[Tuple[bool, bool, bytes], bytes]]
 
     def __new__(cls, value: Any) -> 'TextStringObject':
         if isinstance(value, bytes):
@@ -192,15 +277,14 @@ class TextStringObject(str, PdfObject):
         o.autodetect_utf16 = False
         o.autodetect_pdfdocencoding = False
         o.utf16_bom = b''
+        o._original_bytes = None
         if value.startswith(('þÿ', 'ÿþ')):
             o.autodetect_utf16 = True
             o.utf16_bom = value[:2].encode('charmap')
+        elif _PDFDOC_ENCODABLE.issuperset(value):
+            o.autodetect_pdfdocencoding = True
         else:
-            try:
-                encode_pdfdocencoding(o)
-                o.autodetect_pdfdocencoding = True
-            except UnicodeEncodeError:
-                o.autodetect_utf16 = True
+            o.autodetect_utf16 = True
         return o
 
     def clone(self, pdf_dest: Any, force_duplicate: bool=False, ignore_fields: Optional[Sequence[Union[str, int]]]=()) -> 'TextStringObject':
@@ -215,14 +299,115 @@ class TextStringObject(str, PdfObject):
         if that occurs, this "original_bytes" property can be used to
         back-calculate what the original encoded bytes were.
         """
-        pass
+        return self.get_original_bytes()
+
+    def _set_original_bytes(self, original: bytes) -> None:
+        self._original_bytes = ((self.autodetect_utf16, self.autodetect_pdfdocencoding, self.utf16_bom), original)
+
+    def get_original_bytes(self) -> bytes:
+        # the autodetect attributes can still be changed after creation, so
+        # the cached bytes are only reused while they match them
+        key = (self.autodetect_utf16, self.autodetect_pdfdocencoding, self.utf16_bom)
+        if self._original_bytes is not None and self._original_bytes[0] == key:
+            return self._original_bytes[1]
+        if self.autodetect_utf16:
+            if self.utf16_bom == codecs.BOM_UTF16_LE:
+                original = codecs.BOM_UTF16_LE + self.encode('utf-16le')
+            elif self.utf16_bom == codecs.BOM_UTF16_BE:
+                original = codecs.BOM_UTF16_BE + self.encode('utf-16be')
+            else:
+                original = self.encode('utf-16be')
+        elif self.autodetect_pdfdocencoding:
+            original = encode_pdfdocencoding(self)
+        else:
+            raise Exception('no information about original bytes')
+        self._original_bytes = (key, original)
+        return original
+
+    def get_encoded_bytes(self) -> bytes:
+        try:
+            if self.autodetect_utf16:
+                raise UnicodeEncodeError('', 'forced', -1, -1, '')
+            bytearr = encode_pdfdocencoding(self)
+        except UnicodeEncodeError:
+            if self.utf16_bom == codecs.BOM_UTF16_LE:
+                bytearr = codecs.BOM_UTF16_LE + self.encode('utf-16le')
+            elif self.utf16_bom == codecs.BOM_UTF16_BE:
+                bytearr = codecs.BOM_UTF16_BE + self.encode('utf-16be')
+            else:
+                bytearr = self.encode('utf-16be')
+        return bytearr
+
+    def write_to_stream(self, stream: StreamType, encryption_key: Union[None, str, bytes]=None) -> None:
+        if encryption_key is not None:
+            deprecate_no_replacement('the encryption_key parameter of write_to_stream', '5.0.0')
+        bytearr = _STRING_ESCAPE_PATTERN.sub(_escape_string_byte, self.get_encoded_bytes())
+        stream.write(b'(' + bytearr + b')')
 
 class NameObject(str, PdfObject):
-    delimiter_pattern = re.compile(b'\\s+|[\\(\\)<>\\[\\]{}/%]')
+    delimiter_pattern = re.compile(b'[\\s()<>\\[\\]{}/%]')
+    hex_escape_pattern = re.compile(b'#([0-9A-Fa-f]{2})')
     surfix = b'/'
     renumber_table: ClassVar[Dict[str, bytes]] = {'#': b'#23', '(': b'#28', ')': b'#29', '/': b'#2F', '%': b'#25', **{chr(i): f'#{i:02X}'.encode() for i in range(33)}}
+    renumber_pattern = re.compile('[' + re.escape(''.join(renumber_table)) + '\x7f-\U0010ffff]')
 
     def clone(self, pdf_dest: Any, force_duplicate: bool=False, ignore_fields: Optional[Sequence[Union[str, int]]]=()) -> 'NameObject':
         """Clone object into pdf_dest."""
         pass
-    CHARSETS = ('utf-8', 'gbk', 'latin1')
\ No newline at end of file
+
+    def write_to_stream(self, stream: StreamType, encryption_key: Union[None, str, bytes]=None) -> None:
+        if encryption_key is not None:
+            deprecate_no_replacement('the encryption_key parameter of write_to_stream', '5.0.0')
+        stream.write(self.renumber())
+
+    def renumber(self) -> bytes:
+        out = self[0].encode('utf-8')
+        if out != b'/':
+            deprecate_no_replacement(f"Incorrect first char in NameObject, should start with '/': ({self})", '6.0.0')
+        name = self[1:]
+        if self.renumber_pattern.search(name) is None:
+            return out + name.encode('ascii')
+        return out + self.renumber_pattern.sub(_renumber_name_char, name).encode('ascii')
+
+    @staticmethod
+    def unnumber(sin: bytes) -> bytes:
+        # a '#' that is not followed by two hex digits is kept as is
+        return NameObject.hex_escape_pattern.sub(_unnumber_name_escape, sin)
+    CHARSETS = ('utf-8', 'gbk', 'latin1')
+
+    @staticmethod
+    def read_from_stream(stream: StreamType, pdf: Any) -> 'NameObject':
+        name = stream.read(1)
+        if name != NameObject.surfix:
+            raise PdfReadError('name read error')
+        name += read_until_regex(stream, NameObject.delimiter_pattern)
+        try:
+            name = NameObject.unnumber(name)
+            for enc in NameObject.CHARSETS:
+                try:
+                    ret = name.decode(enc)
+                    return NameObject(ret)
+                except Exception:
+                    pass
+            raise UnicodeDecodeError('', name, 0, 0, 'Code Not Found')
+        except (UnicodeEncodeError, UnicodeDecodeError) as e:
+            if not pdf.strict:
+                logger_warning(f'Illegal character in NameObject ({name!r}), you may need to adjust NameObject.CHARSETS', __name__)
+                return NameObject(name.decode('charmap'))
+            else:
+                raise PdfReadError(f'Illegal character in NameObject ({name!r}). You may need to adjust NameObject.CHARSETS.') from e
+
+@functools.lru_cache(maxsize=1024)
+def _cached_name_object(value: str) -> NameObject:
+    """
+    Return a shared NameObject for the value.
+
+    Only for direct names created by pypdf, like dictionary keys: the object
+    is shared, so it must never be made indirect.
+    """
+    return NameObject(value)
+
+def encode_pdfdocencoding(unicode_string: str) -> bytes:
+    if not _PDFDOC_ENCODABLE.issuperset(unicode_string):
+        raise UnicodeEncodeError('pdfdocencoding', unicode_string, -1, -1, 'does not exist in translation table')
+    return bytes([_pdfdoc_encoding_rev[k] for k in unicode_string])
@@ -3,6 +3,7 @@ __author_email__ = 'biziqe@mathieu.fenniak.net'
 import logging
 import re
 import sys
+from collections import Counter
 from io import BytesIO
 from math import ceil
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
@@ -25,6 +26,9 @@ else:
 logger = logging.getLogger(__name__)
 NumberSigns = b'+-'
 IndirectPattern = re.compile(b'[+-]?(\\d+)\\s+(\\d+)\\s+R[^a-zA-Z]')
+_FIELD_ATTRIBUTES = FieldDictionaryAttributes.attributes() + CheckboxRadioButtonAttributes.attributes()
+# shared by every Field: the names are only ever used as direct keys
+_FIELD_ATTRIBUTE_NAMES = tuple((NameObject(attr) for attr in _FIELD_ATTRIBUTES))
 
 class ArrayObject(List[Any], PdfObject):
 
@@ -70,14 +74,45 @@ class ArrayObject(List[Any], PdfObject):
 
     def __isub__(self, lst: Any) -> Self:
         """Allow to remove items"""
-        for x in self._to_lst(lst):
+        to_remove = self._to_lst(lst)
+        try:
+            pending = Counter(to_remove)
+        except TypeError:
+            # arrays and dictionaries are unhashable: search them one by one
+            for x in to_remove:
+                try:
+                    del self[self.index(x)]
+                except ValueError:
+                    pass
+            return self
+        kept = []
+        for x in self:
             try:
-                x = self.index(x)
-                del self[x]
-            except ValueError:
+                if pending[x] > 0:
+                    pending[x] -= 1
+                    continue
+            except TypeError:
                 pass
+            kept.append(x)
+        self[:] = kept
         return self
 
+    def _to_lst(self, lst: Any) -> List[Any]:
+        if isinstance(lst, (list, tuple, set)):
+            pass
+        elif isinstance(lst, PdfObject):
+            lst = [lst]
+        elif isinstance(lst, str):
+            if lst[0] == '/':
+                lst = [NameObject(lst)]
+            else:
+                lst = [TextStringObject(lst)]
+        elif isinstance(lst, bytes):
+            lst = [ByteStringObject(lst)]
+        else:
+            lst = [lst]
+        return lst
+
 class DictionaryObject(Dict[Any, Any], PdfObject):
 
     def clone(self, pdf_dest: PdfWriterProtocol, force_duplicate: bool=False, ignore_fields: Optional[Sequence[Union[str, int]]]=()) -> 'DictionaryObject':
@@ -109,17 +144,30 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
         Returns:
             Current key or inherited one, otherwise default value.
         """
-        pass
+        node: Optional[DictionaryObject] = self
+        visited: Set[int] = set()
+        while node is not None:
+            if key in node:
+                return node[key]
+            if id(node) in visited:
+                # a malformed /Parent chain loops back on itself
+                return default
+            visited.add(id(node))
+            parent = node.get('/Parent')
+            node = None if parent is None else cast(DictionaryObject, parent.get_object())
+        return default
 
     def __setitem__(self, key: Any, value: Any) -> Any:
-        if not isinstance(key, PdfObject):
+        if key.__class__ is not NameObject and not isinstance(key, PdfObject):
             raise ValueError('key must be PdfObject')
-        if not isinstance(value, PdfObject):
+        if value.__class__ not in _COMMON_VALUE_TYPES and not isinstance(value, PdfObject):
             raise ValueError('value must be PdfObject')
         return dict.__setitem__(self, key, value)
 
     def __getitem__(self, key: Any) -> PdfObject:
-        return dict.__getitem__(self, key).get_object()
+        value = dict.__getitem__(self, key)
+        # most values are direct objects, whose get_object() returns themselves
+        return cast(PdfObject, value.get_object()) if value.__class__ is IndirectObject else value
 
     @property
     def xmp_metadata(self) -> Optional[XmpInformationProtocol]:
@@ -134,7 +182,18 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
           that can be used to access XMP metadata from the document. Can also
           return None if no metadata was found on the document root.
         """
-        pass
+        from ..xmp import XmpInformation
+        metadata = self.get('/Metadata', None)
+        if metadata is None:
+            return None
+        metadata = metadata.get_object()
+        if not isinstance(metadata, XmpInformation):
+            metadata = XmpInformation(metadata)
+            self[NameObject('/Metadata')] = metadata
+        return metadata  # type: ignore
+
+# exact classes of the values stored most often, checked before isinstance()
+_COMMON_VALUE_TYPES = frozenset((NameObject, TextStringObject, ByteStringObject, NumberObject, FloatObject, BooleanObject, NullObject, IndirectObject, ArrayObject, DictionaryObject))
 
 class TreeObject(DictionaryObject):
 
@@ -143,9 +202,107 @@ class TreeObject(DictionaryObject):
         if dct:
             self.update(dct)
 
+    def has_children(self) -> bool:
+        return '/First' in self
+
     def __iter__(self) -> Any:
         return self.children()
 
+    def children(self) -> Iterable[Any]:
+        if not self.has_children():
+            return
+        # resolved once: the reader and writer hand out the same object for
+        # a reference, so the end of the list is found by identity instead
+        # of comparing whole dictionaries at every step
+        last = self.get(NameObject('/Last'))
+        last = None if last is None else last.get_object()
+        child = self[NameObject('/First')]
+        while True:
+            yield child
+            if child is last:
+                return
+            child_ref = child.get(NameObject('/Next'))  # type: ignore
+            if child_ref is None:
+                return
+            child = child_ref.get_object()
+
+    def add_child(self, child: Any, pdf: PdfWriterProtocol) -> None:
+        self.insert_child(child, None, pdf)
+
+    def inc_parent_counter_default(self, parent: Union[None, IndirectObject, 'TreeObject'], n: int) -> None:
+        if parent is None:
+            return
+        parent = cast('TreeObject', parent.get_object())
+        if '/Count' in parent:
+            parent[NameObject('/Count')] = NumberObject(max(0, cast(int, parent[NameObject('/Count')]) + n))
+            self.inc_parent_counter_default(parent.get('/Parent', None), n)
+
+    def inc_parent_counter_outline(self, parent: Union[None, IndirectObject, 'TreeObject'], n: int) -> None:
+        if parent is None:
+            return
+        parent = cast('TreeObject', parent.get_object())
+        opn = parent.get('/%is_open%', True) == True
+        c = cast(int, parent.get('/Count', 0))
+        if c < 0:
+            c = abs(c)
+        parent[NameObject('/Count')] = NumberObject((c + n) * (1 if opn else -1))
+        if not opn:
+            return
+        self.inc_parent_counter_outline(parent.get('/Parent', None), n)
+
+    def insert_child(self, child: Any, before: Any, pdf: PdfWriterProtocol, inc_parent_counter: Optional[Callable[[Any, Any], Any]]=None) -> IndirectObject:
+        """
+        Insert ``child`` before the sibling ``before``, or append it if ``before`` is None.
+
+        Appending links the new node to ``/Last`` directly, so building a tree
+        child by child does not walk the ``/Next`` chain for every insertion.
+        """
+        if inc_parent_counter is None:
+            inc_parent_counter = self.inc_parent_counter_default
+        child_obj = child.get_object()
+        child = child.indirect_reference
+        if '/First' not in self:
+            self[NameObject('/First')] = child
+            self[NameObject('/Count')] = NumberObject(0)
+            self[NameObject('/Last')] = child
+            child_obj[NameObject('/Parent')] = self.indirect_reference
+            inc_parent_counter(self, child_obj.get('/Count', 1))
+            if '/Next' in child_obj:
+                del child_obj['/Next']
+            if '/Prev' in child_obj:
+                del child_obj['/Prev']
+            return child
+        prev = None
+        if before is not None:
+            prev = cast('DictionaryObject', self['/First'])
+            while prev.indirect_reference != before:
+                prev = cast('DictionaryObject', prev['/Next']) if '/Next' in prev else None
+                if prev is None:
+                    break
+        if prev is None:
+            last = cast('DictionaryObject', self['/Last'])
+            last[NameObject('/Next')] = child
+            child_obj[NameObject('/Prev')] = last.indirect_reference
+            child_obj[NameObject('/Parent')] = self.indirect_reference
+            if '/Next' in child_obj:
+                del child_obj['/Next']
+            self[NameObject('/Last')] = child
+            inc_parent_counter(self, child_obj.get('/Count', 1))
+            return child
+        if '/Prev' in prev:
+            prev_prev = cast('DictionaryObject', prev['/Prev'])
+            prev_prev[NameObject('/Next')] = child
+            child_obj[NameObject('/Prev')] = prev_prev.indirect_reference
+        else:
+            self[NameObject('/First')] = child
+            if '/Prev' in child_obj:
+                del child_obj['/Prev']
+        child_obj[NameObject('/Next')] = prev.indirect_reference
+        prev[NameObject('/Prev')] = child
+        child_obj[NameObject('/Parent')] = self.indirect_reference
+        inc_parent_counter(self, child_obj.get('/Count', 1))
+        return child
+
     def _remove_node_from_tree(self, prev: Any, prev_ref: Any, cur: Any, last: Any) -> None:
         """
         Adjust the pointers of the linked list and tree node count.
@@ -191,6 +348,55 @@ class StreamObject(DictionaryObject):
         """
         pass
 
+    def hash_value_data(self) -> bytes:
+        data = super().hash_value_data()
+        data += b_(self._data)
+        return data
+
+    def get_data(self) -> Union[bytes, str]:
+        return self._data
+
+    def set_data(self, data: bytes) -> None:
+        self._data = data
+
+    def flate_encode(self, level: int=-1) -> 'EncodedStreamObject':
+        """
+        Return a copy of the stream compressed with the FlateDecode filter.
+
+        The filter is prepended to any filter already applied to the data.
+
+        Args:
+            level: zlib compression level, see
+                https://docs.python.org/3/library/zlib.html#zlib.compress
+
+        Returns:
+            The compressed stream object.
+        """
+        from ..filters import FlateDecode
+        params: Optional[ArrayObject]
+        if SA.FILTER in self:
+            f = self[SA.FILTER]
+            if isinstance(f, ArrayObject):
+                f = ArrayObject([NameObject(FT.FLATE_DECODE), *f])
+                try:
+                    params = ArrayObject([NullObject(), *self.get(SA.DECODE_PARMS, ArrayObject())])
+                except TypeError:
+                    # /DecodeParms is not an array
+                    params = ArrayObject([NullObject(), self.get(SA.DECODE_PARMS, ArrayObject())])
+            else:
+                f = ArrayObject([NameObject(FT.FLATE_DECODE), f])
+                params = ArrayObject([NullObject(), self.get(SA.DECODE_PARMS, NullObject())])
+        else:
+            f = NameObject(FT.FLATE_DECODE)
+            params = None
+        retval = EncodedStreamObject()
+        retval.update(self)
+        retval[NameObject(SA.FILTER)] = f
+        if params is not None:
+            retval[NameObject(SA.DECODE_PARMS)] = params
+        retval._data = FlateDecode.encode(b_(self._data), level)
+        return retval
+
     def decode_as_image(self) -> Any:
         """
         Try to decode the stream object as an image
@@ -213,6 +419,31 @@ class EncodedStreamObject(StreamObject):
     def __init__(self) -> None:
         self.decoded_self: Optional[DecodedStreamObject] = None
 
+    def get_data(self) -> Union[bytes, str]:
+        from ..filters import decode_stream_data
+        if self.decoded_self is not None:
+            # cached version of decoded object
+            return self.decoded_self.get_data()
+        decoded = DecodedStreamObject()
+        decoded.set_data(b_(decode_stream_data(self)))
+        for key, value in list(self.items()):
+            if key not in (SA.LENGTH, SA.FILTER, SA.DECODE_PARMS):
+                decoded[key] = value
+        self.decoded_self = decoded
+        return decoded.get_data()
+
+    def set_data(self, data: bytes) -> None:
+        from ..filters import FlateDecode
+        if self.get(SA.FILTER, '') not in (FT.FLATE_DECODE, [FT.FLATE_DECODE]):
+            raise PdfReadError('Streams encoded with a filter different from FlateDecode is not supported')
+        if not isinstance(data, bytes):
+            raise TypeError('data must be bytes')
+        if self.decoded_self is None:
+            self.get_data()
+        assert self.decoded_self is not None, 'mypy'
+        self.decoded_self.set_data(data)
+        super().set_data(FlateDecode.encode(data))
+
 class ContentStream(DecodedStreamObject):
     """
     In order to be fast, this data structure can contain either:
@@ -242,12 +473,19 @@ class ContentStream(DecodedStreamObject):
         else:
             stream = stream.get_object()
             if isinstance(stream, ArrayObject):
-                data = b''
+                # each piece is followed by a newline, so that tokens of
+                # consecutive pieces are never glued together
+                parts: List[bytes] = []
+                # the same piece may be listed several times: fetch it once
+                seen: Dict[Any, bytes] = {}
                 for s in stream:
-                    data += b_(s.get_object().get_data())
-                    if len(data) == 0 or data[-1] != b'\n':
-                        data += b'\n'
-                super().set_data(bytes(data))
+                    key = (s.idnum, s.generation) if isinstance(s, IndirectObject) else id(s)
+                    data = seen.get(key)
+                    if data is None:
+                        data = seen[key] = b_(s.get_object().get_data())
+                    parts.append(data)
+                    parts.append(b'\n')
+                super().set_data(b''.join(parts))
             else:
                 stream_data = stream.get_data()
                 assert stream_data is not None
@@ -290,13 +528,8 @@ class Field(TreeObject):
 
     def __init__(self, data: DictionaryObject) -> None:
         DictionaryObject.__init__(self)
-        field_attributes = FieldDictionaryAttributes.attributes() + CheckboxRadioButtonAttributes.attributes()
         self.indirect_reference = data.indirect_reference
-        for attr in field_attributes:
-            try:
-                self[NameObject(attr)] = data[attr]
-            except KeyError:
-                pass
+        self.update({name: data[name] for name in _FIELD_ATTRIBUTE_NAMES if name in data})
         if isinstance(self.get('/V'), EncodedStreamObject):
             d = cast(EncodedStreamObject, self[NameObject('/V')]).get_data()
             if isinstance(d, bytes):
@@ -399,77 +632,57 @@ class Destination(TreeObject):
         self[NameObject('/Title')] = TextStringObject(title)
         self[NameObject('/Page')] = page
         self[NameObject('/Type')] = typ
-        if typ == '/XYZ':
-            if len(args) < 1:
-                args.append(NumberObject(0.0))
-            if len(args) < 2:
-                args.append(NumberObject(0.0))
-            if len(args) < 3:
-                args.append(NumberObject(0.0))
-            self[NameObject(TA.LEFT)], self[NameObject(TA.TOP)], self[NameObject('/Zoom')] = args
-        elif len(args) == 0:
-            pass
-        elif typ == TF.FIT_R:
-            self[NameObject(TA.LEFT)], self[NameObject(TA.BOTTOM)], self[NameObject(TA.RIGHT)], self[NameObject(TA.TOP)] = args
-        elif typ in [TF.FIT_H, TF.FIT_BH]:
-            try:
-                self[NameObject(TA.TOP)], = args
-            except Exception:
-                self[NameObject(TA.TOP)], = (NullObject(),)
-        elif typ in [TF.FIT_V, TF.FIT_BV]:
-            try:
-                self[NameObject(TA.LEFT)], = args
-            except Exception:
-                self[NameObject(TA.LEFT)], = (NullObject(),)
-        elif typ in [TF.FIT, TF.FIT_B]:
-            pass
-        else:
+        if typ != '/XYZ' and len(args) == 0:
+            return
+        set_args = _DESTINATION_ARGS_SETTERS.get(typ)
+        if set_args is None:
             raise PdfReadError(f'Unknown Destination Type: {typ!r}')
+        set_args(self, args)
 
     @property
     def title(self) -> Optional[str]:
         """Read-only property accessing the destination title."""
-        pass
+        return self.get('/Title')
 
     @property
     def page(self) -> Optional[int]:
         """Read-only property accessing the destination page number."""
-        pass
+        return self.get('/Page')
 
     @property
     def typ(self) -> Optional[str]:
         """Read-only property accessing the destination type."""
-        pass
+        return self.get('/Type')
 
     @property
     def zoom(self) -> Optional[int]:
         """Read-only property accessing the zoom factor."""
-        pass
+        return self.get('/Zoom', None)
 
     @property
     def left(self) -> Optional[FloatObject]:
         """Read-only property accessing the left horizontal coordinate."""
-        pass
+        return self.get('/Left', None)
 
     @property
     def right(self) -> Optional[FloatObject]:
         """Read-only property accessing the right horizontal coordinate."""
-        pass
+        return self.get('/Right', None)
 
     @property
     def top(self) -> Optional[FloatObject]:
         """Read-only property accessing the top vertical coordinate."""
-        pass
+        return self.get('/Top', None)
 
     @property
     def bottom(self) -> Optional[FloatObject]:
         """Read-only property accessing the bottom vertical coordinate."""
-        pass
+        return self.get('/Bottom', None)
 
     @property
     def color(self) -> Optional['ArrayObject']:
         """Read-only property accessing the color in (R, G, B) with values 0.0-1.0."""
-        pass
+        return self.get('/C', ArrayObject([FloatObject(0), FloatObject(0), FloatObject(0)]))
 
     @property
     def font_format(self) -> Optional[OutlineFontFlag]:
@@ -478,7 +691,7 @@ class Destination(TreeObject):
 
         1=italic, 2=bold, 3=both
         """
-        pass
+        return self.get('/F', 0)
 
     @property
     def outline_count(self) -> Optional[int]:
@@ -489,4 +702,28 @@ class Destination(TreeObject):
         negative = collapsed
         absolute value = number of visible descendants at all levels
         """
-        pass
\ No newline at end of file
+        return self.get('/Count', None)
+
+def _set_xyz_args(dest: Destination, args: List[Any]) -> None:
+    while len(args) < 3:
+        args.append(NumberObject(0.0))
+    dest[NameObject(TA.LEFT)], dest[NameObject(TA.TOP)], dest[NameObject('/Zoom')] = args
+
+def _set_fit_r_args(dest: Destination, args: List[Any]) -> None:
+    dest[NameObject(TA.LEFT)], dest[NameObject(TA.BOTTOM)], dest[NameObject(TA.RIGHT)], dest[NameObject(TA.TOP)] = args
+
+def _set_fit_h_args(dest: Destination, args: List[Any]) -> None:
+    try:
+        dest[NameObject(TA.TOP)], = args
+    except Exception:
+        dest[NameObject(TA.TOP)], = (NullObject(),)
+
+def _set_fit_v_args(dest: Destination, args: List[Any]) -> None:
+    try:
+        dest[NameObject(TA.LEFT)], = args
+    except Exception:
+        dest[NameObject(TA.LEFT)], = (NullObject(),)
+
+def _ignore_args(dest: Destination, args: List[Any]) -> None:
+    pass
+_DESTINATION_ARGS_SETTERS: Dict[str, Callable[[Destination, List[Any]], None]] = {'/XYZ': _set_xyz_args, TF.FIT_R: _set_fit_r_args, TF.FIT_H: _set_fit_h_args, TF.FIT_BH: _set_fit_h_args, TF.FIT_V: _set_fit_v_args, TF.FIT_BV: _set_fit_v_args, TF.FIT: _ignore_args, TF.FIT_B: _ignore_args}
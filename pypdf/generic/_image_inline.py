@@ -5,37 +5,162 @@ from ..errors import PdfReadError
 logger = logging.getLogger(__name__)
 BUFFER_SIZE = 8192
 
+def _check_end_image_tag(stream: StreamType) -> None:
+    ei_tok = read_non_whitespace(stream)
+    ei_tok += stream.read(2)
+    stream.seek(-3, 1)
+    if ei_tok[:2] != b'EI' or not (ei_tok[2:3] == b'' or ei_tok[2:3] in WHITESPACES):
+        raise PdfReadError('EI stream not found')
+
 def extract_inline_AHx(stream: StreamType) -> bytes:
     """
     Extract HexEncoded Stream from Inline Image.
     the stream will be moved onto the EI
     """
-    pass
+    data_out = bytearray()
+    while True:
+        data_buffered = read_non_whitespace(stream) + stream.read(BUFFER_SIZE)
+        if not data_buffered:
+            raise PdfReadError('Unexpected end of stream')
+        pos_tok = data_buffered.find(b'>')
+        if pos_tok >= 0:
+            data_out += data_buffered[:pos_tok + 1]
+            stream.seek(-len(data_buffered) + pos_tok + 1, 1)
+            break
+        pos_ei = data_buffered.find(b'EI')
+        if pos_ei >= 0:
+            stream.seek(-len(data_buffered) + pos_ei - 1, 1)
+            c = stream.read(1)
+            while c in WHITESPACES:
+                stream.seek(-2, 1)
+                c = stream.read(1)
+                pos_ei -= 1
+            data_out += data_buffered[:pos_ei]
+            break
+        elif len(data_buffered) == 2:
+            data_out += data_buffered
+            raise PdfReadError('Unexpected end of stream')
+        else:
+            data_out += data_buffered[:-2]
+            stream.seek(-2, 1)
+    _check_end_image_tag(stream)
+    return bytes(data_out)
 
 def extract_inline_A85(stream: StreamType) -> bytes:
     """
     Extract A85 Stream from Inline Image.
     the stream will be moved onto the EI
     """
-    pass
+    data_out = bytearray()
+    while True:
+        data_buffered = read_non_whitespace(stream) + stream.read(BUFFER_SIZE)
+        if not data_buffered:
+            raise PdfReadError('Unexpected end of stream')
+        pos_tok = data_buffered.find(b'~>')
+        if pos_tok >= 0:
+            data_out += data_buffered[:pos_tok + 2]
+            stream.seek(-len(data_buffered) + pos_tok + 2, 1)
+            break
+        elif len(data_buffered) == 2:
+            data_out += data_buffered
+            raise PdfReadError('Unexpected end of stream')
+        # the last bytes are read again, in case they start "~>"
+        data_out += data_buffered[:-2]
+        stream.seek(-2, 1)
+    _check_end_image_tag(stream)
+    return bytes(data_out)
 
 def extract_inline_RL(stream: StreamType) -> bytes:
     """
     Extract RL Stream from Inline Image.
     the stream will be moved onto the EI
     """
-    pass
+    data_out = bytearray()
+    while True:
+        data_buffered = stream.read(BUFFER_SIZE)
+        if not data_buffered:
+            raise PdfReadError('Unexpected end of stream')
+        pos_tok = data_buffered.find(b'\x80')
+        if pos_tok >= 0:
+            data_out += data_buffered[:pos_tok + 1]
+            stream.seek(-len(data_buffered) + pos_tok + 1, 1)
+            break
+        data_out += data_buffered
+    _check_end_image_tag(stream)
+    return bytes(data_out)
 
 def extract_inline_DCT(stream: StreamType) -> bytes:
     """
     Extract DCT (JPEG) Stream from Inline Image.
     the stream will be moved onto the EI
     """
-    pass
+    data_out = bytearray()
+    notfirst = False
+    while True:
+        # the data up to the next marker is found with bytes.find on a
+        # buffer; anything before the first marker is dropped
+        while True:
+            data_buffered = stream.read(BUFFER_SIZE)
+            if not data_buffered:
+                raise PdfReadError('Unexpected end of stream')
+            pos = data_buffered.find(b'\xff')
+            if pos < 0:
+                if notfirst:
+                    data_out += data_buffered
+                continue
+            data_out += data_buffered[:pos + 1] if notfirst else b'\xff'
+            stream.seek(pos + 1 - len(data_buffered), 1)
+            break
+        notfirst = True
+        c = stream.read(1)
+        if not c:
+            raise PdfReadError('Unexpected end of stream')
+        data_out += c
+        if c == b'\xff':
+            stream.seek(-1, 1)
+        elif c == b'\x00':
+            pass
+        elif c == b'\xd9':
+            break
+        elif c in b'\xc0\xc1\xc2\xc3\xc5\xc6\xc7\xc9\xca\xcb\xcc\xcd\xce\xcf\xda\xdb\xdc\xdd\xde\xdf\xe0\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef\xfe':
+            c = stream.read(2)
+            data_out += c
+            sz = c[0] * 256 + c[1]
+            data_out += stream.read(sz - 2)
+    _check_end_image_tag(stream)
+    return bytes(data_out)
 
 def extract_inline_default(stream: StreamType) -> bytes:
     """
     Legacy method
     used by default
     """
-    pass
\ No newline at end of file
+    data_out = bytearray()
+    while True:
+        data_buffered = stream.read(BUFFER_SIZE)
+        if not data_buffered:
+            raise PdfReadError('Unexpected end of stream')
+        pos_ei = data_buffered.find(b'EI')
+        if pos_ei == -1:
+            # the last byte is read again, in case it is the E of "EI"
+            if len(data_buffered) > 1:
+                data_out += data_buffered[:-1]
+                stream.seek(-1, 1)
+            else:
+                data_out += data_buffered
+            continue
+        data_out += data_buffered[:pos_ei]
+        # the stream is put right after the "EI" candidate
+        stream.seek(pos_ei + 2 - len(data_buffered), 1)
+        saved_pos = stream.tell()
+        tok3 = stream.read(1)
+        if tok3 in WHITESPACES:
+            while tok3 in WHITESPACES:
+                tok3 = stream.read(1)
+            # [\s]EI[\s] or EI[\s](Q|EMC)
+            if data_out[-1:] in WHITESPACES or tok3 in (b'Q', b'E'):
+                stream.seek(saved_pos - 2, 0)
+                break
+        data_out += b'EI'
+        stream.seek(saved_pos, 0)
+    return bytes(data_out)
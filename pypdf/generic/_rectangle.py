@@ -1,4 +1,4 @@
-from typing import Any, Tuple, Union
+from typing import Any, Iterable, Tuple, Union
 from ._base import FloatObject, NumberObject
 from ._data_structures import ArrayObject
 
@@ -19,16 +19,86 @@ class RectangleObject(ArrayObject):
         assert len(arr) == 4
         ArrayObject.__init__(self, [self._ensure_is_number(x) for x in arr])
 
+    def _ensure_is_number(self, value: Any) -> Union[FloatObject, NumberObject]:
+        if not isinstance(value, (FloatObject, NumberObject)):
+            value = FloatObject(value)
+        return value
+
+    def scale(self, sx: float, sy: float) -> 'RectangleObject':
+        left, bottom, right, top = self
+        return RectangleObject((float(left) * sx, float(bottom) * sy, float(right) * sx, float(top) * sy))
+
+    @classmethod
+    def union_many(cls, rects: Iterable['RectangleObject']) -> 'RectangleObject':
+        """
+        Return the smallest box containing all of the given boxes.
+
+        Args:
+            rects: the boxes to combine; they need not be normalized.
+
+        Returns:
+            A normalized RectangleObject.
+
+        Raises:
+            ValueError: If no box is given.
+        """
+        columns = tuple(zip(*rects))
+        if not columns:
+            raise ValueError('union_many() needs at least one rectangle')
+        x0, y0, x1, y1 = columns
+        return cls((min(min(x0), min(x1)), min(min(y0), min(y1)), max(max(x0), max(x1)), max(max(y0), max(y1))))
+
+    def contains_point(self, x: float, y: float) -> bool:
+        """Return True if the point (x, y) lies inside or on the border of this box."""
+        x0, y0, x1, y1 = self
+        return min(x0, x1) <= x <= max(x0, x1) and min(y0, y1) <= y <= max(y0, y1)
+
     def __repr__(self) -> str:
         return f'RectangleObject({list(self)!r})'
 
+    @property
+    def left(self) -> FloatObject:
+        return self[0]
+
+    @left.setter
+    def left(self, f: float) -> None:
+        self[0] = FloatObject(f)
+
+    @property
+    def bottom(self) -> FloatObject:
+        return self[1]
+
+    @bottom.setter
+    def bottom(self, f: float) -> None:
+        self[1] = FloatObject(f)
+
+    @property
+    def right(self) -> FloatObject:
+        return self[2]
+
+    @right.setter
+    def right(self, f: float) -> None:
+        self[2] = FloatObject(f)
+
+    @property
+    def top(self) -> FloatObject:
+        return self[3]
+
+    @top.setter
+    def top(self, f: float) -> None:
+        self[3] = FloatObject(f)
+
     @property
     def lower_left(self) -> Tuple[float, float]:
         """
         Property to read and modify the lower left coordinate of this box
         in (x,y) form.
         """
-        pass
+        return (self[0], self[1])
+
+    @lower_left.setter
+    def lower_left(self, value: Tuple[float, float]) -> None:
+        self[0], self[1] = (self._ensure_is_number(x) for x in value)
 
     @property
     def lower_right(self) -> Tuple[float, float]:
@@ -36,7 +106,11 @@ class RectangleObject(ArrayObject):
         Property to read and modify the lower right coordinate of this box
         in (x,y) form.
         """
-        pass
+        return (self[2], self[1])
+
+    @lower_right.setter
+    def lower_right(self, value: Tuple[float, float]) -> None:
+        self[2], self[1] = (self._ensure_is_number(x) for x in value)
 
     @property
     def upper_left(self) -> Tuple[float, float]:
@@ -44,7 +118,11 @@ class RectangleObject(ArrayObject):
         Property to read and modify the upper left coordinate of this box
         in (x,y) form.
         """
-        pass
+        return (self[0], self[3])
+
+    @upper_left.setter
+    def upper_left(self, value: Tuple[float, float]) -> None:
+        self[0], self[3] = (self._ensure_is_number(x) for x in value)
 
     @property
     def upper_right(self) -> Tuple[float, float]:
@@ -52,4 +130,16 @@ class RectangleObject(ArrayObject):
         Property to read and modify the upper right coordinate of this box
         in (x,y) form.
         """
-        pass
\ No newline at end of file
+        return (self[2], self[3])
+
+    @upper_right.setter
+    def upper_right(self, value: Tuple[float, float]) -> None:
+        self[2], self[3] = (self._ensure_is_number(x) for x in value)
+
+    @property
+    def width(self) -> float:
+        return self[2] - self[0]
+
+    @property
+    def height(self) -> float:
+        return self[3] - self[1]
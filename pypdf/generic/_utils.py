@@ -1,10 +1,15 @@
 import codecs
+import re
 from typing import Dict, List, Tuple, Union
 from .._codecs import _pdfdoc_encoding
 from .._utils import StreamType, b_, logger_warning, read_non_whitespace
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfStreamError
 from ._base import ByteStringObject, TextStringObject
 
+# bytes which are either not ASCII or which PDFDocEncoding does not map
+# to the same code point; strings without any of them decode as ASCII
+_PDFDOC_NOT_ASCII = re.compile(b'[\\x00\\x16\\x18-\\x1f\\x7f-\\xff]')
+
 def create_string_object(string: Union[str, bytes], forced_encoding: Union[None, str, List[str], Dict[int, str]]=None) -> Union[TextStringObject, ByteStringObject]:
     """
     Create a ByteStringObject or a TextStringObject from a string to represent the string.
@@ -19,4 +24,55 @@ def create_string_object(string: Union[str, bytes], forced_encoding: Union[None,
     Raises:
         TypeError: If string is not of type str or bytes.
     """
-    pass
\ No newline at end of file
+    if isinstance(string, str):
+        return TextStringObject(string)
+    elif isinstance(string, bytes):
+        if isinstance(forced_encoding, (list, dict)):
+            out = ''
+            for x in string:
+                try:
+                    out += forced_encoding[x]
+                except Exception:
+                    out += bytes((x,)).decode('charmap')
+            obj = TextStringObject(out)
+            obj._set_original_bytes(string)
+            return obj
+        elif isinstance(forced_encoding, str):
+            if forced_encoding == 'bytes':
+                return ByteStringObject(string)
+            obj = TextStringObject(string.decode(forced_encoding))
+            obj._set_original_bytes(string)
+            return obj
+        else:
+            try:
+                if _PDFDOC_NOT_ASCII.search(string) is None:
+                    # most strings are plain ASCII, which PDFDocEncoding
+                    # leaves unchanged: skip the per-byte table lookup
+                    retval = TextStringObject(string.decode('ascii'))
+                    retval.autodetect_pdfdocencoding = True
+                    retval._set_original_bytes(string)
+                    return retval
+                if string.startswith((codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)):
+                    retval = TextStringObject(string.decode('utf-16'))
+                    retval.autodetect_utf16 = True
+                    retval.utf16_bom = string[:2]
+                    retval._set_original_bytes(string)
+                    return retval
+                else:
+                    retval = TextStringObject(decode_pdfdocencoding(string))
+                    retval.autodetect_pdfdocencoding = True
+                    retval._set_original_bytes(string)
+                    return retval
+            except UnicodeDecodeError:
+                return ByteStringObject(string)
+    else:
+        raise TypeError('create_string_object should have str or unicode arg')
+
+def decode_pdfdocencoding(byte_array: bytes) -> str:
+    retval = ''
+    for b in byte_array:
+        c = _pdfdoc_encoding[b]
+        if c == '\u0000':
+            raise UnicodeDecodeError('pdfdocencoding', bytearray(b), -1, -1, 'does not exist in translation table')
+        retval += c
+    return retval
\ No newline at end of file
@@ -3,46 +3,83 @@ from ._base import BooleanObject, NameObject, NumberObject
 from ._data_structures import ArrayObject, DictionaryObject
 f_obj = BooleanObject(False)
 
+def _add_prop_bool(key: str, deft: Optional[BooleanObject]) -> property:
+    return property(lambda self: self._get_bool(key, deft), lambda self, v: self._set_bool(key, v), None, f'\n        Returns/Modify the status of {key}, Returns {deft} if not defined\n        ')
+
+def _add_prop_name(key: str, lst: List[str], deft: Optional[NameObject]) -> property:
+    return property(lambda self: self._get_name(key, deft), lambda self, v: self._set_name(key, lst, v), None, f'\n        Returns/Modify the status of {key}, Returns {deft} if not defined.\n        Acceptable values: {lst}\n        ')
+
+def _add_prop_arr(key: str, deft: Optional[ArrayObject]) -> property:
+    return property(lambda self: self._get_arr(key, deft), lambda self, v: self._set_arr(key, v), None, f'\n        Returns/Modify the status of {key}, Returns {deft} if not defined\n        ')
+
+def _add_prop_int(key: str, deft: Optional[int]) -> property:
+    return property(lambda self: self._get_int(key, deft), lambda self, v: self._set_int(key, v), None, f'\n        Returns/Modify the status of {key}, Returns {deft} if not defined\n        ')
+
 class ViewerPreferences(DictionaryObject):
 
-    def __new__(cls: Any, value: Any=None) -> 'ViewerPreferences':
-
-        def _add_prop_bool(key: str, deft: Optional[BooleanObject]) -> property:
-            return property(lambda self: self._get_bool(key, deft), lambda self, v: self._set_bool(key, v), None, f'\n            Returns/Modify the status of {key}, Returns {deft} if not defined\n            ')
-
-        def _add_prop_name(key: str, lst: List[str], deft: Optional[NameObject]) -> property:
-            return property(lambda self: self._get_name(key, deft), lambda self, v: self._set_name(key, lst, v), None, f'\n            Returns/Modify the status of {key}, Returns {deft} if not defined.\n            Acceptable values: {lst}\n            ')
-
-        def _add_prop_arr(key: str, deft: Optional[ArrayObject]) -> property:
-            return property(lambda self: self._get_arr(key, deft), lambda self, v: self._set_arr(key, v), None, f'\n            Returns/Modify the status of {key}, Returns {deft} if not defined\n            ')
-
-        def _add_prop_int(key: str, deft: Optional[int]) -> property:
-            return property(lambda self: self._get_int(key, deft), lambda self, v: self._set_int(key, v), None, f'\n            Returns/Modify the status of {key}, Returns {deft} if not defined\n            ')
-        cls.hide_toolbar = _add_prop_bool('/HideToolbar', f_obj)
-        cls.hide_menubar = _add_prop_bool('/HideMenubar', f_obj)
-        cls.hide_windowui = _add_prop_bool('/HideWindowUI', f_obj)
-        cls.fit_window = _add_prop_bool('/FitWindow', f_obj)
-        cls.center_window = _add_prop_bool('/CenterWindow', f_obj)
-        cls.display_doctitle = _add_prop_bool('/DisplayDocTitle', f_obj)
-        cls.non_fullscreen_pagemode = _add_prop_name('/NonFullScreenPageMode', ['/UseNone', '/UseOutlines', '/UseThumbs', '/UseOC'], NameObject('/UseNone'))
-        cls.direction = _add_prop_name('/Direction', ['/L2R', '/R2L'], NameObject('/L2R'))
-        cls.view_area = _add_prop_name('/ViewArea', [], None)
-        cls.view_clip = _add_prop_name('/ViewClip', [], None)
-        cls.print_area = _add_prop_name('/PrintArea', [], None)
-        cls.print_clip = _add_prop_name('/PrintClip', [], None)
-        cls.print_scaling = _add_prop_name('/PrintScaling', [], None)
-        cls.duplex = _add_prop_name('/Duplex', ['/Simplex', '/DuplexFlipShortEdge', '/DuplexFlipLongEdge'], None)
-        cls.pick_tray_by_pdfsize = _add_prop_bool('/PickTrayByPDFSize', None)
-        cls.print_pagerange = _add_prop_arr('/PrintPageRange', None)
-        cls.num_copies = _add_prop_int('/NumCopies', None)
-        cls.enforce = _add_prop_arr('/Enforce', ArrayObject())
-        return DictionaryObject.__new__(cls)
+    def _get_bool(self, key: str, deft: Optional[BooleanObject]) -> BooleanObject:
+        return self.get(key, deft)  # type: ignore
+
+    def _set_bool(self, key: str, v: bool) -> None:
+        self[NameObject(key)] = BooleanObject(v is True)
+
+    def _get_name(self, key: str, deft: Optional[NameObject]) -> Optional[NameObject]:
+        return self.get(key, deft)
+
+    def _set_name(self, key: str, lst: List[str], v: NameObject) -> None:
+        if v[0] != '/':
+            raise ValueError(f"{v} does not start with '/'")
+        if lst != [] and v not in lst:
+            raise ValueError(f'{v} is an unacceptable value')
+        self[NameObject(key)] = NameObject(v)
+
+    def _get_arr(self, key: str, deft: Optional[List[Any]]) -> NumberObject:
+        return self.get(key, None if deft is None else ArrayObject(deft))  # type: ignore
+
+    def _set_arr(self, key: str, v: Optional[ArrayObject]) -> None:
+        if v is None:
+            try:
+                del self[NameObject(key)]
+            except KeyError:
+                pass
+            return
+        if not isinstance(v, ArrayObject):
+            raise ValueError('ArrayObject is expected')
+        self[NameObject(key)] = v
+
+    def _get_int(self, key: str, deft: Optional[NumberObject]) -> NumberObject:
+        return self.get(key, deft)  # type: ignore
+
+    def _set_int(self, key: str, v: int) -> None:
+        self[NameObject(key)] = NumberObject(v)
+
+    @property
+    def PRINT_SCALING(self) -> NameObject:
+        return NameObject('/PrintScaling')
+    hide_toolbar = _add_prop_bool('/HideToolbar', f_obj)
+    hide_menubar = _add_prop_bool('/HideMenubar', f_obj)
+    hide_windowui = _add_prop_bool('/HideWindowUI', f_obj)
+    fit_window = _add_prop_bool('/FitWindow', f_obj)
+    center_window = _add_prop_bool('/CenterWindow', f_obj)
+    display_doctitle = _add_prop_bool('/DisplayDocTitle', f_obj)
+    non_fullscreen_pagemode = _add_prop_name('/NonFullScreenPageMode', ['/UseNone', '/UseOutlines', '/UseThumbs', '/UseOC'], NameObject('/UseNone'))
+    direction = _add_prop_name('/Direction', ['/L2R', '/R2L'], NameObject('/L2R'))
+    view_area = _add_prop_name('/ViewArea', [], None)
+    view_clip = _add_prop_name('/ViewClip', [], None)
+    print_area = _add_prop_name('/PrintArea', [], None)
+    print_clip = _add_prop_name('/PrintClip', [], None)
+    print_scaling = _add_prop_name('/PrintScaling', [], None)
+    duplex = _add_prop_name('/Duplex', ['/Simplex', '/DuplexFlipShortEdge', '/DuplexFlipLongEdge'], None)
+    pick_tray_by_pdfsize = _add_prop_bool('/PickTrayByPDFSize', None)
+    print_pagerange = _add_prop_arr('/PrintPageRange', None)
+    num_copies = _add_prop_int('/NumCopies', None)
+    enforce = _add_prop_arr('/Enforce', ArrayObject())
 
     def __init__(self, obj: Optional[DictionaryObject]=None) -> None:
         super().__init__(self)
         if obj is not None:
             self.update(obj.items())
         try:
-            self.indirect_reference = obj.indirect_reference
+            self.indirect_reference = obj.indirect_reference  # type: ignore
         except AttributeError:
             pass
\ No newline at end of file
@@ -10,6 +10,7 @@ from typing import Any, List, Tuple, Union
 from .errors import ParseError
 _INT_RE = '(0|-?[1-9]\\d*)'
 PAGE_RANGE_RE = f'^({_INT_RE}|({_INT_RE}?(:{_INT_RE}?(:{_INT_RE}?)?)))$'
+_PAGE_RANGE_PATTERN = re.compile(PAGE_RANGE_RE)
 
 class PageRange:
     """
@@ -58,7 +59,7 @@ class PageRange:
         if isinstance(arg, PageRange):
             self._slice = arg.to_slice()
             return
-        m = isinstance(arg, str) and re.match(PAGE_RANGE_RE, arg)
+        m = isinstance(arg, str) and _PAGE_RANGE_PATTERN.match(arg)
         if not m:
             raise ParseError(arg)
         elif m.group(2):
@@ -79,7 +80,7 @@ class PageRange:
         Returns:
             True, if the ``input`` is a valid PageRange.
         """
-        pass
+        return isinstance(input, (slice, PageRange)) or (isinstance(input, str) and bool(_PAGE_RANGE_PATTERN.match(input)))
 
     def to_slice(self) -> slice:
         """Return the slice equivalent of this page range."""
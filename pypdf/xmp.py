@@ -4,15 +4,15 @@ Anything related to Extensible Metadata Platform (XMP) metadata.
 https://en.wikipedia.org/wiki/Extensible_Metadata_Platform
 """
 import datetime
-import decimal
 import re
-from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
-from xml.dom.minidom import Document, parseString
-from xml.dom.minidom import Element as XmlElement
-from xml.parsers.expat import ExpatError
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 from ._utils import StreamType, deprecate_no_replacement
 from .errors import PdfReadError
 from .generic import ContentStream, PdfObject
+if TYPE_CHECKING:
+    from xml.dom.minidom import Document
+    from xml.dom.minidom import Element as XmlElement
 RDF_NAMESPACE = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
 DC_NAMESPACE = 'http://purl.org/dc/elements/1.1/'
 XMP_NAMESPACE = 'http://ns.adobe.com/xap/1.0/'
@@ -21,6 +21,152 @@ XMPMM_NAMESPACE = 'http://ns.adobe.com/xap/1.0/mm/'
 PDFX_NAMESPACE = 'http://ns.adobe.com/pdfx/1.3/'
 iso8601 = re.compile('\n        (?P<year>[0-9]{4})\n        (-\n            (?P<month>[0-9]{2})\n            (-\n                (?P<day>[0-9]+)\n                (T\n                    (?P<hour>[0-9]{2}):\n                    (?P<minute>[0-9]{2})\n                    (:(?P<second>[0-9]{2}(.[0-9]+)?))?\n                    (?P<tzd>Z|[-+][0-9]{2}:[0-9]{2})\n                )?\n            )?\n        )?\n        ', re.VERBOSE)
 K = TypeVar('K')
+# marks a property not looked up yet: empty and None results are cached too
+_NOT_CACHED = object()
+
+def _identity(value: K) -> K:
+    return value
+
+def _converter_date(value: str) -> datetime.datetime:
+    matches = iso8601.match(value)
+    if matches is None:
+        raise ValueError(f'Invalid date format: {value}')
+    year, month, day, hour, minute, second, tzd = matches.group('year', 'month', 'day', 'hour', 'minute', 'second', 'tzd')
+    if second and second[2:3] not in ('', '.'):
+        raise ValueError(f'Invalid date format: {value}')
+    if tzd and sys.version_info >= (3, 11) and matches.end() == len(value):
+        # a complete timestamp: fromisoformat parses it in C from 3.11 on,
+        # when it learnt to read the "Z" designator
+        try:
+            return datetime.datetime.fromisoformat(value).astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        except ValueError:
+            pass
+    seconds = 0
+    microseconds = 0
+    if second:
+        # "SS" or "SS.fff...": fractions below a microsecond are truncated
+        seconds = int(second[:2])
+        microseconds = int(second[3:9].ljust(6, '0'))
+    dt = datetime.datetime(int(year), int(month or 1), int(day or 1), int(hour or 0), int(minute or 0), seconds, microseconds)
+    if tzd and tzd != 'Z':
+        offset = datetime.timedelta(hours=int(tzd[1:3]), minutes=int(tzd[4:6]))
+        dt = dt - offset if tzd[0] == '+' else dt + offset
+    return dt
+
+# characters not allowed in XML names are written as U+2182 followed by
+# their four hex digits in pdfx property names
+_PDFX_ESCAPE = re.compile('\u2182(.{0,4})', re.DOTALL)
+
+def _unescape_pdfx_char(m: 're.Match[str]') -> str:
+    return chr(int(m[1], base=16))
+
+def _child_elements(node: Any, namespace: str, name: str) -> Iterator['XmlElement']:
+    # rdf:Bag/Seq/Alt sit directly under the property and rdf:li directly
+    # under them: only the children are looked at, where
+    # getElementsByTagNameNS would walk the whole subtree
+    for child in node.childNodes:
+        if child.nodeType == child.ELEMENT_NODE and child.localName == name and child.namespaceURI == namespace:
+            yield child
+
+def _index_elements(node: Any) -> Dict[Tuple[str, str], List['XmlElement']]:
+    # one walk over the subtree, in document order, serves the lookups of
+    # every property instead of one getElementsByTagNameNS walk each
+    index: Dict[Tuple[str, str], List[XmlElement]] = {}
+    stack = list(reversed(node.childNodes))
+    while stack:
+        child = stack.pop()
+        if child.nodeType == child.ELEMENT_NODE:
+            index.setdefault((child.namespaceURI, child.localName), []).append(child)
+            stack.extend(reversed(child.childNodes))
+    return index
+
+def _getter_bag(namespace: str, name: str) -> Callable[['XmpInformation'], Optional[List[str]]]:
+
+    def get(self: 'XmpInformation') -> Optional[List[str]]:
+        ns_cache = self.cache.setdefault(namespace, {})
+        cached = ns_cache.get(name, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+        retval = []
+        for element in self.get_element('', namespace, name):
+            bags = list(_child_elements(element, RDF_NAMESPACE, 'Bag'))
+            if bags:
+                for bag in bags:
+                    for item in _child_elements(bag, RDF_NAMESPACE, 'li'):
+                        value = self._get_text(item)
+                        retval.append(value)
+            else:
+                retval.append(self._get_text(element))
+        ns_cache[name] = retval
+        return retval
+    return get
+
+def _getter_seq(namespace: str, name: str, converter: Callable[[Any], Any]=_identity) -> Callable[['XmpInformation'], Optional[List[Any]]]:
+    # decided once here rather than calling _identity for every value
+    convert = None if converter is _identity else converter
+
+    def get(self: 'XmpInformation') -> Optional[List[Any]]:
+        ns_cache = self.cache.setdefault(namespace, {})
+        cached = ns_cache.get(name, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+        retval = []
+        for element in self.get_element('', namespace, name):
+            seqs = list(_child_elements(element, RDF_NAMESPACE, 'Seq'))
+            if seqs:
+                for seq in seqs:
+                    for item in _child_elements(seq, RDF_NAMESPACE, 'li'):
+                        retval.append(self._get_text(item))
+            else:
+                retval.append(self._get_text(element))
+        if convert is not None:
+            retval = [convert(value) for value in retval]
+        ns_cache[name] = retval
+        return retval
+    return get
+
+def _getter_langalt(namespace: str, name: str) -> Callable[['XmpInformation'], Optional[Dict[Any, Any]]]:
+
+    def get(self: 'XmpInformation') -> Optional[Dict[Any, Any]]:
+        ns_cache = self.cache.setdefault(namespace, {})
+        cached = ns_cache.get(name, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+        retval = {}
+        for element in self.get_element('', namespace, name):
+            alts = list(_child_elements(element, RDF_NAMESPACE, 'Alt'))
+            if alts:
+                for alt in alts:
+                    for item in _child_elements(alt, RDF_NAMESPACE, 'li'):
+                        value = self._get_text(item)
+                        # a handful of language tags recur in every document
+                        retval[sys.intern(item.getAttribute('xml:lang'))] = value
+            else:
+                retval['x-default'] = self._get_text(element)
+        ns_cache[name] = retval
+        return retval
+    return get
+
+def _getter_single(namespace: str, name: str, converter: Callable[[str], Any]=_identity) -> Callable[['XmpInformation'], Optional[Any]]:
+    convert = None if converter is _identity else converter
+
+    def get(self: 'XmpInformation') -> Optional[Any]:
+        ns_cache = self.cache.setdefault(namespace, {})
+        cached = ns_cache.get(name, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+        value = None
+        for element in self.get_element('', namespace, name):
+            if element.nodeType == element.ATTRIBUTE_NODE:
+                value = element.nodeValue
+            else:
+                value = self._get_text(element)
+            break
+        if value is not None and convert is not None:
+            value = convert(value)
+        ns_cache[name] = value
+        return value
+    return get
 
 class XmpInformation(PdfObject):
     """
@@ -32,14 +178,74 @@ class XmpInformation(PdfObject):
     """
 
     def __init__(self, stream: ContentStream) -> None:
+        # xml.dom.minidom is only imported once XMP data is actually read
+        from xml.dom.minidom import parseString
+        from xml.parsers.expat import ExpatError
         self.stream = stream
-        try:
-            data = self.stream.get_data()
-            doc_root: Document = parseString(data)
-        except ExpatError as e:
-            raise PdfReadError(f'XML in XmpInformation was invalid: {e}')
-        self.rdf_root: XmlElement = doc_root.getElementsByTagNameNS(RDF_NAMESPACE, 'RDF')[0]
+        data = self.stream.get_data()
+        # the parsed tree is kept on the stream, for as long as its data is
+        # the very same object, so that wrapping it again does not reparse
+        parsed = getattr(stream, '_xmp_parsed', None)
+        if parsed is not None and parsed[0] is data:
+            rdf_root = parsed[1]
+        else:
+            try:
+                doc_root: Document = parseString(data)
+            except ExpatError as e:
+                raise PdfReadError(f'XML in XmpInformation was invalid: {e}')
+            rdf_root = doc_root.getElementsByTagNameNS(RDF_NAMESPACE, 'RDF')[0]
+            try:
+                stream._xmp_parsed = (data, rdf_root)  # type: ignore[attr-defined]
+            except AttributeError:
+                pass
+        self.rdf_root: XmlElement = rdf_root
         self.cache: Dict[Any, Any] = {}
+        self._descriptions: Optional[List[XmlElement]] = None
+        self._element_indexes: Dict[int, Dict[Tuple[str, str], List[XmlElement]]] = {}
+
+    def write_to_stream(self, stream: StreamType, encryption_key: Union[None, str, bytes]=None) -> None:
+        if encryption_key is not None:
+            deprecate_no_replacement('the encryption_key parameter of write_to_stream', '5.0.0')
+        self.stream.write_to_stream(stream)  # type: ignore
+
+    def _get_descriptions(self, about_uri: str) -> Iterator['XmlElement']:
+        # getElementsByTagNameNS walks the whole DOM in Python: collect the
+        # rdf:Description elements once instead of once per property
+        if self._descriptions is None:
+            self._descriptions = list(self.rdf_root.getElementsByTagNameNS(RDF_NAMESPACE, 'Description'))
+        for desc in self._descriptions:
+            if desc.getAttributeNS(RDF_NAMESPACE, 'about') == about_uri:
+                yield desc
+
+    def get_element(self, about_uri: str, namespace: str, name: str) -> Iterator[Any]:
+        for desc in self._get_descriptions(about_uri):
+            attr = desc.getAttributeNodeNS(namespace, name)
+            if attr is not None:
+                yield attr
+            if namespace == '*' or name == '*':
+                yield from desc.getElementsByTagNameNS(namespace, name)
+                continue
+            index = self._element_indexes.get(id(desc))
+            if index is None:
+                index = self._element_indexes[id(desc)] = _index_elements(desc)
+            yield from index.get((namespace, name), ())
+
+    def get_nodes_in_namespace(self, about_uri: str, namespace: str) -> Iterator[Any]:
+        for desc in self._get_descriptions(about_uri):
+            for i in range(desc.attributes.length):
+                attr = desc.attributes.item(i)
+                if attr.namespaceURI == namespace:  # type: ignore
+                    yield attr
+            for child in desc.childNodes:
+                if child.namespaceURI == namespace:
+                    yield child
+
+    def _get_text(self, element: 'XmlElement') -> str:
+        children = element.childNodes
+        if len(children) == 1 and children[0].nodeType == children[0].TEXT_NODE:
+            # the usual leaf value: a single text node
+            return children[0].data
+        return ''.join([child.data for child in children if child.nodeType == child.TEXT_NODE])
     dc_contributor = property(_getter_bag(DC_NAMESPACE, 'contributor'))
     '\n    Contributors to the resource (other than the authors).\n\n    An unsorted array of names.\n    '
     dc_coverage = property(_getter_single(DC_NAMESPACE, 'coverage'))
@@ -98,4 +304,13 @@ class XmpInformation(PdfObject):
         Returns:
             A dictionary of key/value items for custom metadata properties.
         """
-        pass
\ No newline at end of file
+        if not hasattr(self, '_custom_properties'):
+            self._custom_properties = {}
+            for node in self.get_nodes_in_namespace('', PDFX_NAMESPACE):
+                key = _PDFX_ESCAPE.sub(_unescape_pdfx_char, node.localName)
+                if node.nodeType == node.ATTRIBUTE_NODE:
+                    value = node.nodeValue
+                else:
+                    value = self._get_text(node)
+                self._custom_properties[sys.intern(key)] = value
+        return self._custom_properties
\ No newline at end of file
@@ -1,10 +1,18 @@
 """Test the pypdf.constants module."""
 import re
+import sys
 from typing import Callable
 
 import pytest
 
-from pypdf.constants import PDF_KEYS, GraphicsStateParameters, UserAccessPermissions
+from pypdf.constants import (
+    PDF_KEYS,
+    CheckboxRadioButtonAttributes,
+    FieldDictionaryAttributes,
+    GraphicsStateParameters,
+    PageAttributes,
+    UserAccessPermissions,
+)
 
 
 def test_slash_prefix():
@@ -38,6 +46,11 @@ def test_slash_prefix():
             assert pattern.match(constant_value)
 
 
+def test_pdf_keys_are_interned():
+    assert PageAttributes.ANNOTS is sys.intern("/Annots")
+    assert FieldDictionaryAttributes.Kids is sys.intern("/Kids")
+
+
 def test_user_access_permissions__dict_handling():
     # Value is mix of configurable and reserved bits.
     # Reserved bits should not be part of the dictionary.
@@ -114,3 +127,13 @@ def test_user_access_permissions__all():
     assert all_int & UserAccessPermissions.PRINT == UserAccessPermissions.PRINT
     assert all_int & UserAccessPermissions.R7 == UserAccessPermissions.R7
     assert all_int & UserAccessPermissions.R31 == UserAccessPermissions.R31
+
+
+@pytest.mark.parametrize("cls", [FieldDictionaryAttributes, CheckboxRadioButtonAttributes])
+def test_field_attributes_dict_is_a_fresh_copy(cls):
+    assert cls.attributes() is cls.attributes()
+    assert set(cls.attributes_dict()) <= set(cls.attributes())
+    field_attributes = cls.attributes_dict()
+    field_attributes.update(CheckboxRadioButtonAttributes.attributes_dict())
+    field_attributes["/Foo"] = "Foo"
+    assert "/Foo" not in cls.attributes_dict()
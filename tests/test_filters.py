@@ -2,6 +2,7 @@
 import shutil
 import string
 import subprocess
+import zlib
 from io import BytesIO
 from itertools import product as cartesian_product
 from pathlib import Path
@@ -11,15 +12,19 @@ import pytest
 from PIL import Image
 
 from pypdf import PdfReader
-from pypdf.errors import DeprecationError, PdfReadError
+from pypdf.errors import DeprecationError, PdfReadError, PdfStreamError
 from pypdf.filters import (
+    FLATE_CHUNK_SIZE,
     ASCII85Decode,
     ASCIIHexDecode,
     CCITParameters,
     CCITTFaxDecode,
     FlateDecode,
+    LZWDecode,
+    RunLengthDecode,
+    decode_stream_data,
 )
-from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject, StreamObject
 
 from . import PILContext, get_data_from_url
 from .test_encryption import HAS_AES
@@ -52,6 +57,76 @@ def test_flate_decode_encode(predictor, s):
     assert codec.decode(encoded, DictionaryObject({"/Predictor": predictor})) == s
 
 
+def test_flate_decode_png_predictor():
+    """Each PNG row filter is undone against the row above."""
+    data = bytes(
+        [0, 200, 100]  # None
+        + [2, 100, 200]  # Up, wrapping past 255
+        + [1, 1, 255]  # Sub
+        + [3, 0, 0]  # Average
+        + [4, 5, 5]  # Paeth
+    )
+    decode_parms = DictionaryObject(
+        {NameObject("/Predictor"): NumberObject(12), NameObject("/Columns"): NumberObject(2)}
+    )
+    assert FlateDecode.decode(zlib.compress(data), decode_parms) == bytes(
+        [200, 100, 44, 44, 1, 0, 0, 0, 5, 10]
+    )
+
+
+@pytest.mark.parametrize("level", [-1, 0, 9])
+def test_flate_encode_in_chunks(monkeypatch, level):
+    """Chunked compression yields the same stream as a one-shot compress."""
+    monkeypatch.setattr("pypdf.filters.FLATE_CHUNK_SIZE", 7)
+    monkeypatch.setattr("pypdf.filters._deflate_zlib", zlib)
+    data = b"q 1 0 0 1 72 720 cm BT /F1 12 Tf (Hello) Tj ET Q\n" * 20
+    encoded = FlateDecode.encode(data, level)
+    assert encoded == zlib.compress(data, level)
+    assert zlib.decompress(encoded) == data
+
+
+@pytest.mark.parametrize("level", [-1, 0, 1, 9])
+def test_flate_encode_larger_than_a_chunk(monkeypatch, level):
+    monkeypatch.setattr("pypdf.filters._deflate_zlib", zlib)
+    data = b"".join(b"%d 0 obj << /Length %d >> endobj\n" % (i, i * 7) for i in range(60_000))
+    assert len(data) > FLATE_CHUNK_SIZE
+    encoded = FlateDecode.encode(data, level)
+    assert encoded == zlib.compress(data, level)
+    assert zlib.decompress(encoded) == data
+
+
+def test_flate_decode_in_chunks(monkeypatch):
+    """Chunked decompression tolerates trailing data and truncation."""
+    monkeypatch.setattr("pypdf.filters.FLATE_CHUNK_SIZE", 7)
+    monkeypatch.setattr("pypdf.filters._deflate_zlib", zlib)
+    data = b"q 1 0 0 1 72 720 cm BT /F1 12 Tf (Hello) Tj ET Q\n" * 20
+    encoded = zlib.compress(data)
+    assert FlateDecode.decode(encoded) == data
+    assert FlateDecode.decode(encoded + b"\r\n") == data
+    assert FlateDecode.decode(encoded[:-4]) == data
+
+
+@pytest.mark.parametrize("level", [-1, 0, 9])
+def test_flate_encode_isal(monkeypatch, level):
+    """isal output is plain Flate data, whatever zlib level is requested."""
+    isal_zlib = pytest.importorskip("isal.isal_zlib")
+    monkeypatch.setattr("pypdf.filters._deflate_zlib", isal_zlib)
+    data = b"q 1 0 0 1 72 720 cm BT /F1 12 Tf (Hello) Tj ET Q\n" * 20
+    assert zlib.decompress(FlateDecode.encode(data, level)) == data
+    if level == 0:
+        assert FlateDecode.encode(data, level) == zlib.compress(data, 0)
+
+
+def test_flate_decode_isal(monkeypatch):
+    """isal inflates complete streams; truncated ones still fall back to zlib."""
+    isal_zlib = pytest.importorskip("isal.isal_zlib")
+    monkeypatch.setattr("pypdf.filters._deflate_zlib", isal_zlib)
+    data = b"q 1 0 0 1 72 720 cm BT /F1 12 Tf (Hello) Tj ET Q\n" * 20
+    encoded = zlib.compress(data)
+    assert FlateDecode.decode(encoded) == data
+    assert FlateDecode.decode(encoded[:-4]) == data
+
+
 def test_flatedecode_unsupported_predictor():
     """
     FlateDecode raises PdfReadError for unsupported predictors.
@@ -136,6 +211,17 @@ def test_ascii_hex_decode_missing_eod():
     # assert exc.value.args[0] == "Unexpected EOD in ASCIIHexDecode"
 
 
+def test_ascii_hex_decode_odd_digits_and_invalid_data():
+    # a final odd digit is completed by a zero
+    assert ASCIIHexDecode.decode(b"4 14>") == b"A@"
+    # form feed, vertical tab and NUL are whitespace too
+    assert ASCIIHexDecode.decode(b"61\x0c62\x0b\x0063>") == b"abc"
+    # data after the EOD marker is ignored
+    assert ASCIIHexDecode.decode(b"41>zz") == b"A"
+    with pytest.raises(PdfStreamError, match="Invalid hexadecimal data"):
+        ASCIIHexDecode.decode(b"4z>")
+
+
 @pytest.mark.enable_socket()
 def test_decode_ahx():
     """
@@ -187,6 +273,14 @@ def test_ascii85decode_five_zero_bytes():
         assert ASCII85Decode.decode(i + "~>") == expected
 
 
+def test_ascii85decode_framing(caplog):
+    assert ASCII85Decode.decode(b"<~87cURD]j7BEbo80~>\n") == b"Hello world!"
+    # data after the end marker is ignored
+    assert ASCII85Decode.decode(b"87cURD]j7BEbo80~>garbage") == b"Hello world!"
+    assert ASCII85Decode.decode(b"87cURD]j7BEbo80") == b"Hello world!"
+    assert "Ignoring missing Ascii85 end marker." in caplog.text
+
+
 def test_ccitparameters():
     params = CCITParameters()
     assert params.K == 0  # zero is the default according to page 78
@@ -235,6 +329,20 @@ def test_decompress_zlib_error(mock_logger_warning):
     )
 
 
+def test_lzw_decode():
+    """Example from the PDF reference, section 7.4.4.2."""
+    data = bytes.fromhex("800B6050220C0C8501")
+    assert LZWDecode._decodeb(data) == b"-----A---B"
+    assert LZWDecode.decode(data) == "-----A---B"
+
+
+def test_decode_stream_data_lzw_returns_bytes():
+    stream = StreamObject()
+    stream[NameObject("/Filter")] = NameObject("/LZWDecode")
+    stream._data = bytes.fromhex("800B6050220C0C8501")
+    assert decode_stream_data(stream) == b"-----A---B"
+
+
 @pytest.mark.enable_socket()
 def test_lzw_decode_neg1():
     reader = PdfReader(BytesIO(get_data_from_url(name="tika-921632.pdf")))
@@ -505,6 +613,14 @@ def test_runlengthdecode():
     reader.pages[0].images[0]
 
 
+def test_runlengthdecode_runs():
+    data = bytes([2]) + b"abc" + bytes([254]) + b"x" + bytes([128])
+    assert RunLengthDecode.decode(data) == b"abcxxx"
+    with pytest.raises(PdfStreamError) as exc:
+        RunLengthDecode.decode(bytes([128, 0]))
+    assert exc.value.args[0] == "early EOD in RunLengthDecode"
+
+
 @pytest.mark.enable_socket()
 def test_gray_separation_cmyk():
     """
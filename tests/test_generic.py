@@ -1,6 +1,7 @@
 """Test the pypdf.generic module."""
 
 import codecs
+import hashlib
 from base64 import a85encode
 from copy import deepcopy
 from io import BytesIO
@@ -33,6 +34,7 @@ from pypdf.generic import (
     StreamObject,
     TextStringObject,
     TreeObject,
+    _create_outline_item,
     create_string_object,
     encode_pdfdocencoding,
     read_hex_string_from_stream,
@@ -44,6 +46,7 @@ from pypdf.generic._image_inline import (
     extract_inline_AHx,
     extract_inline_DCT,
     extract_inline_RL,
+    extract_inline_default,
 )
 
 from . import ReaderDummy, get_data_from_url
@@ -73,6 +76,13 @@ def test_number_object_no_exception():
     NumberObject(2**100_000_000)
 
 
+@pytest.mark.parametrize("value", [0, 42, -7, 2**40])
+def test_number_object_write_to_stream(value):
+    stream = BytesIO()
+    NumberObject(value).write_to_stream(stream)
+    assert stream.getvalue() == str(value).encode()
+
+
 def test_create_string_object_exception():
     with pytest.raises(TypeError) as exc:
         create_string_object(123)
@@ -484,11 +494,44 @@ def test_rectangleobject():
     assert ro.upper_right == (14, 18)
 
 
+def test_rectangleobject_union_many_and_contains_point():
+    boxes = [
+        RectangleObject((0, 0, 10, 10)),
+        RectangleObject((20, 5, 15, -5)),
+        RectangleObject((-3, 2, 4, 30)),
+    ]
+    union = RectangleObject.union_many(boxes)
+    assert list(union) == [-3, -5, 20, 30]
+    with pytest.raises(ValueError):
+        RectangleObject.union_many([])
+
+    assert boxes[0].contains_point(10, 0)
+    assert not boxes[0].contains_point(10.5, 0)
+    assert boxes[1].contains_point(17, 0)
+
+
 def test_textstringobject_exc():
     tso = TextStringObject("foo")
     assert tso.get_original_bytes() == b"foo"
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Hello World 42", b"(Hello World 42)"),
+        ("a(b)\\c\n", b"(a\\050b\\051\\134c\\012)"),
+        # spaces are written as is, other non alphanumeric bytes are escaped
+        ("a b, c!", b"(a b\\054 c\\041)"),
+        ("caf\u00e9 au lait", b"(caf\\351 au lait)"),
+        ("", b"()"),
+    ],
+)
+def test_textstringobject_write_to_stream(value, expected):
+    stream = BytesIO()
+    TextStringObject(value).write_to_stream(stream)
+    assert stream.getvalue() == expected
+
+
 def test_textstringobject_autodetect_utf16():
     tso = TextStringObject("foo")
     tso.autodetect_utf16 = True
@@ -496,6 +539,15 @@ def test_textstringobject_autodetect_utf16():
     assert tso.get_original_bytes() == b"\xfe\xff\x00f\x00o\x00o"
 
 
+def test_textstringobject_original_bytes_cached():
+    tso = TextStringObject("foo")
+    original = tso.original_bytes
+    assert original == b"foo"
+    assert tso.original_bytes is original
+    tso.autodetect_utf16 = True
+    assert tso.original_bytes == b"\x00f\x00o\x00o"
+
+
 def test_remove_child_not_in_tree():
     tree = TreeObject()
     with pytest.raises(ValueError) as exc:
@@ -600,6 +652,35 @@ def test_remove_child_found_in_tree():
     tree.empty_tree()
 
 
+def test_insert_child_order():
+    writer = PdfWriter()
+    tree = TreeObject()
+    writer._add_object(tree)
+    refs = []
+    for name in ("a", "b", "c"):
+        child = TreeObject()
+        child[NameObject("/Foo")] = TextStringObject(name)
+        refs.append(writer._add_object(child))
+        tree.add_child(refs[-1], writer)
+    assert tree["/Last"] == refs[2]
+
+    middle = TreeObject()
+    middle[NameObject("/Foo")] = TextStringObject("between")
+    tree.insert_child(writer._add_object(middle), refs[1], writer)
+    first = TreeObject()
+    first[NameObject("/Foo")] = TextStringObject("first")
+    tree.insert_child(writer._add_object(first), refs[0], writer)
+
+    assert [child["/Foo"] for child in tree.children()] == [
+        "first",
+        "a",
+        "between",
+        "b",
+        "c",
+    ]
+    assert tree[NameObject("/Count")] == 5
+
+
 def test_remove_child_in_tree():
     pdf = RESOURCE_ROOT / "form.pdf"
 
@@ -1107,6 +1188,28 @@ def test_indirect_object_invalid_read():
     assert exc.value.args[0] == "Error reading indirect object reference at byte 0x5"
 
 
+def test_indirect_object_proxies_referenced_object():
+    class Objects:
+        def __init__(self, *objects):
+            self.objects = objects
+
+        def get_object(self, indirect_reference):
+            return self.objects[indirect_reference.idnum - 1]
+
+    pdf = Objects(DictionaryObject({NameObject("/A"): NumberObject(1)}))
+    ref = IndirectObject(1, 0, pdf)
+    assert ref["/A"] == 1
+    assert list(ref.keys()) == ["/A"]
+    with pytest.raises(AttributeError):
+        ref.missing_attribute
+    pdf.objects += (ref,)
+    chained = IndirectObject(2, 0, pdf)
+    with pytest.raises(PdfStreamError):
+        chained["/A"]
+    with pytest.raises(PdfStreamError):
+        chained.keys()
+
+
 def test_create_string_object_utf16_bom():
     # utf16-be
     result = create_string_object(
@@ -1140,6 +1243,17 @@ def test_create_string_object_utf16_bom():
     assert result.original_bytes == b"\x00\xFF"
 
 
+def test_create_string_object_ascii():
+    result = create_string_object(b"Hello World")
+    assert isinstance(result, TextStringObject)
+    assert result == "Hello World"
+    assert result.autodetect_pdfdocencoding is True
+    assert result.original_bytes == b"Hello World"
+    # PDFDocEncoding does not map these ASCII bytes to themselves
+    assert create_string_object(b"\x18") == "\u02d8"
+    assert isinstance(create_string_object(b"a\x7f"), ByteStringObject)
+
+
 def test_create_string_object_force():
     assert create_string_object(b"Hello World", []) == "Hello World"
     assert create_string_object(b"Hello World", {72: "A"}) == "Aello World"
@@ -1343,6 +1457,16 @@ def test_indirect_object_page_dimensions():
     assert mediabox == RectangleObject((0, 0, 792, 612))
 
 
+def test_dictionaryobject_get_inherited():
+    root = DictionaryObject({NameObject("/Rotate"): NumberObject(90)})
+    middle = DictionaryObject({NameObject("/Parent"): root})
+    leaf = DictionaryObject({NameObject("/Parent"): middle})
+    assert leaf.get_inherited("/Rotate") == 90
+    assert leaf.get_inherited("/MediaBox", "default") == "default"
+    root[NameObject("/Parent")] = leaf
+    assert middle.get_inherited("/MediaBox") is None
+
+
 def test_array_operators():
     a = ArrayObject(
         [
@@ -1371,6 +1495,13 @@ def test_array_operators():
     a -= 300
     assert len(a) == la
 
+    a = ArrayObject([NumberObject(1), NumberObject(2), NumberObject(1), NumberObject(1)])
+    a -= [1, 1, 5]
+    assert a == [2, 1]
+    a = ArrayObject([ArrayObject([1]), NumberObject(2), ArrayObject([1])])
+    a -= [ArrayObject([1])]
+    assert a == [2, [1]]
+
 
 def test_unitary_extract_inline_buffer_invalid():
     with pytest.raises(PdfReadError):
@@ -1395,6 +1526,13 @@ def test_unitary_extract_inline_buffer_invalid():
         extract_inline_DCT(BytesIO(b"\xFF\xD9"))
 
 
+def test_extract_inline_default_across_buffers(monkeypatch):
+    monkeypatch.setattr("pypdf.generic._image_inline.BUFFER_SIZE", 5)
+    stream = BytesIO(b"xxEIyEIzabcd\nEI\nQ")
+    assert extract_inline_default(stream) == b"xxEIyEIzabcd\n"
+    assert stream.read(4) == b"EI\nQ"
+
+
 def test_unitary_extract_inline():
     # AHx
     b = 16000 * b"00"
@@ -1459,3 +1597,72 @@ Q\nQ\nBT 1 0 0 1 200 100 Tm (Test) Tj T* ET\n \n"""
     ec.set_data(b)
     co = ContentStream(ec, None)
     assert co.operations[7][0]["data"] == b"abcdefghijklmnop"
+
+
+@pytest.mark.parametrize(
+    ("italic", "bold", "expected"),
+    [(False, False, None), (True, False, 1), (False, True, 2), (True, True, 3)],
+)
+def test_create_outline_item_font_flags(italic, bold, expected):
+    outline_item = _create_outline_item(None, "title", "#ff0000", italic, bold)
+    assert outline_item["/Title"] == "title"
+    assert outline_item["/C"] == [1, 0, 0]
+    assert outline_item.get("/F") == expected
+    if expected is not None:
+        assert type(outline_item["/F"]) is NumberObject
+
+
+def test_hash_value(monkeypatch):
+    value = NumberObject(42).hash_value()
+    assert value == b"NumberObject:" + hashlib.blake2b(b"42", digest_size=20).hexdigest().encode()
+    assert NumberObject(42).hash_value() == value
+    assert NumberObject(43).hash_value() != value
+    monkeypatch.setattr(PdfObject, "hash_func", hashlib.sha1)
+    assert NumberObject(42).hash_value() == b"NumberObject:" + hashlib.sha1(b"42").hexdigest().encode()
+
+
+def test_stream_hash_value_covers_data():
+    a = DecodedStreamObject()
+    a[NameObject("/Length")] = NumberObject(3)
+    a._data = b"abc"
+    b = DecodedStreamObject()
+    b[NameObject("/Length")] = NumberObject(3)
+    b._data = b"xyz"
+    assert a.hash_value() != b.hash_value()
+    b._data = b"abc"
+    assert a.hash_value() == b.hash_value()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (0, b"0.0"),
+        (1.5, b"1.5"),
+        (100.060779, b"100.060779"),
+        (-0.000012345678912, b"-0.000012345679"),
+        (1e20, b"100000000000000000000"),
+    ],
+)
+def test_float_object_write_to_stream(value, expected):
+    stream = BytesIO()
+    FloatObject(value).write_to_stream(stream)
+    assert stream.getvalue() == expected
+    assert repr(FloatObject(value)) == expected.decode()
+
+
+def test_cached_number_object():
+    from pypdf.generic._base import _cached_number_object
+
+    number = _cached_number_object(7)
+    assert type(number) is NumberObject
+    assert number == 7
+    assert _cached_number_object(7) is number
+
+
+def test_cached_name_object():
+    from pypdf.generic._base import _cached_name_object
+
+    name = _cached_name_object("/Resources")
+    assert type(name) is NameObject
+    assert name == "/Resources"
+    assert _cached_name_object("/Resources") is name
@@ -558,6 +558,41 @@ def test_read_missing_startxref():
     assert exc.value.args[0] == "startxref not found"
 
 
+def test_read_eof_marker_beyond_first_buffer():
+    pdf_data = (
+        b"%%PDF-1.7\n"
+        b"1 0 obj << /Count 1 /Kids [4 0 R] /Type /Pages >> endobj\n"
+        b"2 0 obj << >> endobj\n"
+        b"3 0 obj << >> endobj\n"
+        b"4 0 obj << /Contents 3 0 R /CropBox [0.0 0.0 2550.0 3508.0]"
+        b" /MediaBox [0.0 0.0 2550.0 3508.0] /Parent 1 0 R"
+        b" /Resources << /Font << >> >>"
+        b" /Rotate 0 /Type /Page >> endobj\n"
+        b"5 0 obj << /Pages 1 0 R /Type /Catalog >> endobj\n"
+        b"xref 1 5\n"
+        b"%010d 00000 n\n"
+        b"%010d 00000 n\n"
+        b"%010d 00000 n\n"
+        b"%010d 00000 n\n"
+        b"%010d 00000 n\n"
+        b"trailer << /Root 5 0 R /Size 6 >>\n"
+        b"startxref\n%d\n"
+        b"%%%%EOF\n"
+    )
+    pdf_data = pdf_data % (
+        pdf_data.find(b"1 0 obj"),
+        pdf_data.find(b"2 0 obj"),
+        pdf_data.find(b"3 0 obj"),
+        pdf_data.find(b"4 0 obj"),
+        pdf_data.find(b"5 0 obj"),
+        pdf_data.find(b"xref") - 1,
+    )
+    # trailing garbage pushes the marker out of the first tail block
+    pdf_data += b"x%%EOF\n" * 2000
+    reader = PdfReader(io.BytesIO(pdf_data))
+    assert len(reader.pages) == 1
+
+
 def test_read_unknown_zero_pages(caplog):
     pdf_data = (
         b"%%PDF-1.7\n"
@@ -1577,3 +1612,21 @@ def test_context_manager_with_stream():
     with PdfReader(pdf_stream) as reader:
         assert not reader.stream.closed
     assert not pdf_stream.closed
+
+
+def test_prefetch_object_stream():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    stmnums = {stmnum for stmnum, _ in reader.xref_objStm.values()}
+    assert stmnums
+    stmnum = min(stmnums)
+    members = [idnum for idnum, (num, _) in reader.xref_objStm.items() if num == stmnum]
+    reader._prefetch_object_stream(stmnum)
+    assert stmnum in reader._objstm_prefetched
+    for idnum in members:
+        prefetched = reader.resolved_objects[0, idnum]
+        assert prefetched.indirect_reference.idnum == idnum
+
+    # a bounded cache is not filled ahead of use
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf", cache_size=2)
+    reader._prefetch_object_stream(stmnum)
+    assert not reader._objstm_prefetched
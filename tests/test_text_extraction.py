@@ -129,6 +129,40 @@ def test_layout_mode_font_class_to_dict():
     }
 
 
+def test_layout_mode_text_state_params_transforms():
+    from pypdf._text_extraction._layout_mode._font import Font
+    from pypdf._text_extraction._layout_mode._text_state_params import (
+        TextStateParams,
+    )
+
+    font = Font("foo", space_width=250, encoding="utf-8", char_map={}, font_dictionary={})
+    tsp = TextStateParams(
+        "ab c", font, 12, Tc=0.5, Tw=1.5, Tz=90, Ts=2, transform=[2, 0.5, 0.25, 3, 10, 20]
+    )
+    assert tsp.render_transform() == pytest.approx(
+        mult(tsp.font_size_matrix(), tsp.transform)
+    )
+    assert tsp.displaced_transform() == pytest.approx(
+        mult(tsp.displacement_matrix(), tsp.transform)
+    )
+    assert TextStateParams.to_dict(tsp) == {
+        k: getattr(tsp, k) for k in tsp.__dataclass_fields__ if k != "font"
+    }
+
+
+def test_layout_mode_font_space_tx():
+    from pypdf._text_extraction._layout_mode._font import Font
+
+    font = Font("foo", space_width=250, encoding="utf-8", char_map={}, font_dictionary={})
+    font.width_map = {" ": 300}
+    assert font.space_tx(10, 0.5, 2, 50) == round((10 * 0.3 + 0.5 + 2) * 0.5, 3)
+    assert font.space_tx(10, 0.5, 2, 50) is font.space_tx(10, 0.5, 2, 50)
+    # a zero width space falls back to twice the font's space_width
+    font = Font("foo", space_width=250, encoding="utf-8", char_map={}, font_dictionary={})
+    font.width_map = {" ": 0}
+    assert font.space_tx(10, 0, 0, 100) == 5.0
+
+
 @pytest.mark.enable_socket()
 def test_layout_mode_epic_page_fonts():
     url = "https://github.com/py-pdf/pypdf/files/13836944/Epic.Page.PDF"
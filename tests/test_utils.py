@@ -18,6 +18,7 @@ from pypdf._utils import (
     matrix_multiply,
     parse_iso8824_date,
     read_block_backwards,
+    read_non_whitespace,
     read_previous_line,
     read_until_regex,
     read_until_whitespace,
@@ -49,6 +50,31 @@ def test_skip_over_whitespace(stream, expected):
     assert skip_over_whitespace(stream) == expected
 
 
+@pytest.mark.parametrize(
+    ("data", "expected", "remainder"),
+    [
+        (b"", b"", b""),
+        (b"foo", b"f", b"oo"),
+        (b" \n\r\t\x00foo", b"f", b"oo"),
+        (b" " * 100 + b"/Name", b"/", b"Name"),
+        (b" " * 100, b"", b""),
+    ],
+)
+@pytest.mark.parametrize("buffered", [False, True])
+def test_read_non_whitespace(data, expected, remainder, buffered):
+    stream = io.BufferedReader(io.BytesIO(data)) if buffered else io.BytesIO(data)
+    assert read_non_whitespace(stream) == expected
+    assert stream.read() == remainder
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_skip_over_whitespace_consumes_next_byte(buffered):
+    data = b" " * 100 + b"obj"
+    stream = io.BufferedReader(io.BytesIO(data)) if buffered else io.BytesIO(data)
+    assert skip_over_whitespace(stream)
+    assert stream.read() == b"bj"
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     [
@@ -70,6 +96,24 @@ def test_read_until_whitespace():
     assert read_until_whitespace(io.BytesIO(b"foo"), maxchars=1) == b"f"
 
 
+@pytest.mark.parametrize(
+    ("data", "maxchars", "expected", "remainder"),
+    [
+        (b"foo bar", None, b"foo", b"bar"),
+        (b"foo\r\nbar", None, b"foo", b"\nbar"),
+        (b"foo", None, b"foo", b""),
+        (b"x" * 500 + b"\tbar", None, b"x" * 500, b"bar"),
+        (b"x" * 500 + b"\tbar", 200, b"x" * 200, b"x" * 300 + b"\tbar"),
+        (b"\x0bfoo", None, b"", b"foo"),
+    ],
+)
+@pytest.mark.parametrize("buffered", [False, True])
+def test_read_until_whitespace_position(data, maxchars, expected, remainder, buffered):
+    stream = io.BufferedReader(io.BytesIO(data)) if buffered else io.BytesIO(data)
+    assert read_until_whitespace(stream, maxchars) == expected
+    assert stream.read() == remainder
+
+
 @pytest.mark.parametrize(
     ("stream", "remainder"),
     [
@@ -91,6 +135,25 @@ def test_read_until_regex_premature_ending_name():
     assert read_until_regex(stream, re.compile(b".")) == b""
 
 
+@pytest.mark.parametrize(
+    ("data", "pattern", "expected", "remainder"),
+    [
+        (b"123.45 Td", b"[^+-.0-9]", b"123.45", b" Td"),
+        (b"Name/Other", b"\\s+|[\\(\\)<>\\[\\]{}/%]", b"Name", b"/Other"),
+        (b"x" * 1000 + b"endstream", b"endstream", b"x" * 1000, b"endstream"),
+        (b"x" * 60 + b"endstream", b"endstream", b"x" * 60, b"endstream"),
+        (b"x" * 1000, b"endstream", b"x" * 1000, b""),
+    ],
+)
+@pytest.mark.parametrize("buffered", [False, True])
+def test_read_until_regex(data, pattern, expected, remainder, buffered):
+    import re
+
+    stream = io.BufferedReader(io.BytesIO(data)) if buffered else io.BytesIO(data)
+    assert read_until_regex(stream, re.compile(pattern)) == expected
+    assert stream.read() == remainder
+
+
 @pytest.mark.parametrize(
     ("a", "b", "expected"),
     [
@@ -423,6 +486,22 @@ def test_version_compare_lt_str():
     assert exc.value.args[0] == "Version cannot be compared against <class 'str'>"
 
 
+def test_version_rich_comparison():
+    assert Version("3.0") <= Version("3.0")
+    assert Version("3.0") <= Version("3.1")
+    assert Version("3.1") > Version("3.0")
+    assert Version("3.1") >= Version("3.1")
+    assert Version("3.1") != Version("3.0")
+    assert Version("3.1") != "3.1"
+    assert len({Version("1.0"), Version("1.0"), Version("1.1")}) == 2
+    with pytest.raises(ValueError):
+        Version("1.0") >= "1.0"  # noqa
+
+
+def test_version_has_no_instance_dict():
+    assert not hasattr(Version("1.0"), "__dict__")
+
+
 def test_bad_version():
     assert Version("a").components == [(0, "a")]
 
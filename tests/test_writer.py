@@ -3,6 +3,7 @@
 import re
 import shutil
 import subprocess
+import sys
 from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -23,7 +24,9 @@ from pypdf.annotations import Link
 from pypdf.errors import PageSizeNotDefinedError, PyPdfError
 from pypdf.generic import (
     ArrayObject,
+    ByteStringObject,
     ContentStream,
+    DecodedStreamObject,
     DictionaryObject,
     Fit,
     IndirectObject,
@@ -79,6 +82,150 @@ def test_writer_clone():
     assert "PageObject" in str(type(writer.pages[0]))
 
 
+def test_write_flushes_buffer_in_blocks(monkeypatch):
+    src = RESOURCE_ROOT / "pdflatex-outline.pdf"
+    writer = PdfWriter(clone_from=src)
+    expected = BytesIO()
+    writer.write(expected)
+
+    monkeypatch.setattr("pypdf._writer.WRITE_BUFFER_SIZE", 1)
+    actual = BytesIO()
+    writer.write(actual)
+    assert actual.getvalue() == expected.getvalue()
+    reader = PdfReader(actual, strict=True)
+    assert len(reader.pages) == 4
+
+
+def test_deduplicate_resources():
+    def make_writer():
+        writer = PdfWriter()
+        for _ in range(3):
+            page = writer.add_blank_page(100, 100)
+            font = DictionaryObject(
+                {
+                    NameObject("/Type"): NameObject("/Font"),
+                    NameObject("/Subtype"): NameObject("/Type1"),
+                    NameObject("/BaseFont"): NameObject("/Helvetica"),
+                }
+            )
+            page[NameObject("/Resources")] = DictionaryObject(
+                {NameObject("/Font"): DictionaryObject({NameObject("/F1"): writer._add_object(font)})}
+            )
+        return writer
+
+    plain = BytesIO()
+    make_writer().write(plain)
+    deduplicated = BytesIO()
+    writer = make_writer()
+    writer.deduplicate_resources()
+    writer.write(deduplicated)
+    assert len(deduplicated.getvalue()) < len(plain.getvalue())
+
+    def font_refs(stream):
+        reader = PdfReader(stream)
+        return {
+            page["/Resources"]["/Font"].raw_get("/F1").idnum for page in reader.pages
+        }
+
+    assert len(font_refs(plain)) == 3
+    assert len(font_refs(deduplicated)) == 1
+
+
+def test_deduplicate_resources_keeps_distinct_streams():
+    writer = PdfWriter()
+    for data in (b"q 1 0 0 1 0 0 cm Q", b"q 2 0 0 2 0 0 cm Q"):
+        page = writer.add_blank_page(100, 100)
+        form = DecodedStreamObject()
+        form[NameObject("/Type")] = NameObject("/XObject")
+        form[NameObject("/Subtype")] = NameObject("/Form")
+        form[NameObject("/Length")] = NumberObject(len(data))
+        form._data = data
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/XObject"): DictionaryObject({NameObject("/Fm0"): writer._add_object(form)})}
+        )
+    writer.deduplicate_resources()
+    assert all(obj is not None for obj in writer._objects)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_compress_content_streams_with_workers(workers):
+    src = RESOURCE_ROOT / "pdflatex-outline.pdf"
+    expected = PdfWriter(clone_from=src)
+    for page in expected.pages:
+        page.compress_content_streams()
+    writer = PdfWriter(clone_from=src)
+    writer.compress_content_streams(workers=workers)
+    for page, expected_page in zip(writer.pages, expected.pages):
+        assert page.get_contents().get_data() == expected_page.get_contents().get_data()
+        assert page["/Contents"]["/Filter"] == "/FlateDecode"
+
+
+def test_clone_from_reader_with_object_streams():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    assert reader.xref_objStm
+    writer = PdfWriter(clone_from=reader)
+    assert reader._objstm_prefetched
+    assert reader._objstm_prefetched <= {stmnum for stmnum, _ in reader.xref_objStm.values()}
+    out = BytesIO()
+    writer.write(out)
+    assert PdfReader(out).pages[0].extract_text() == reader.pages[0].extract_text()
+
+
+def test_get_page_number_by_indirect_follows_page_changes():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf")
+    refs = [page.indirect_reference for page in writer.pages]
+    assert [writer._get_page_number_by_indirect(ref) for ref in refs] == [0, 1, 2, 3]
+    assert writer._get_page_number_by_indirect(refs[2].idnum) == 2
+    assert writer._get_page_number_by_indirect(writer._root) is None
+
+    del writer.pages[0]
+    assert writer._get_page_number_by_indirect(refs[2]) == 1
+    assert writer._get_page_number_by_indirect(refs[0]) is None
+
+
+def test_generate_file_identifiers():
+    writer = PdfWriter()
+    writer.generate_file_identifiers()
+    id1, id2 = writer._ID
+    assert isinstance(id1, ByteStringObject)
+    assert len(id1) == 16
+    assert id1 == id2
+
+    writer.generate_file_identifiers()
+    assert writer._ID[0] == id1
+    assert writer._ID[1] != id2
+
+
+def test_resolve_indirect_object_skips_hash_on_revisit(monkeypatch):
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    writer = PdfWriter()
+    calls = []
+    original = DictionaryObject.hash_value
+
+    def counting_hash_value(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(DictionaryObject, "hash_value", counting_hash_value)
+    ref = reader.pages[0].indirect_reference
+    first = writer._resolve_indirect_object(ref)
+    assert writer._resolve_indirect_object(ref) is first
+    assert len(calls) == 1
+
+
+def test_sweep_indirect_references_nested_arrays():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    writer = PdfWriter()
+    ref = reader.pages[0].indirect_reference
+    inner = ArrayObject([ref, ref])
+    root = inner
+    for _ in range(200):
+        root = ArrayObject([root])
+    writer._sweep_indirect_references(root)
+    assert inner[0].pdf is writer
+    assert inner[0] == inner[1]
+
+
 def test_writer_clone_bookmarks():
     # Arrange
     src = RESOURCE_ROOT / "Seige_of_Vicksburg_Sample_OCR-crazyones-merged.pdf"
@@ -2300,3 +2447,101 @@ def test_matrix_entry_in_field_annots():
         auto_regenerate=False,
     )
     assert "/Matrix" in writer.pages[0]["/Annots"][5].get_object()["/AP"]["/N"]
+
+
+def test_get_filtered_outline_builds_new_items():
+    reader = PdfReader(RESOURCE_ROOT / "pdflatex-outline.pdf")
+    writer = PdfWriter()
+    pages = {page.indirect_reference.idnum: writer.add_page(page) for page in reader.pages}
+    node = reader.trailer["/Root"]["/Outlines"]
+
+    outline = writer._get_filtered_outline(node, pages, reader)
+    assert outline
+    again = writer._get_filtered_outline(node, pages, reader)
+    assert [o.title for o in again] == [o.title for o in outline]
+    assert all(a is not b for a, b in zip(again, outline))
+
+
+def test_set_page_label_overlapping_ranges():
+    writer = PdfWriter()
+    for _ in range(10):
+        writer.add_blank_page(100, 100)
+    writer._set_page_label(0, 1, "/r", None, 0)
+    writer._set_page_label(5, 6, "/A", None, 0)
+    writer._set_page_label(2, 8, None, "x-", 3)
+    writer._set_page_label(4, 4, "/R", None, 0)
+    nums = writer.root_object["/PageLabels"]["/Nums"]
+    assert nums[::2] == [0, 2, 4, 5, 9]
+    assert nums[1] == {"/S": "/r"}
+    assert nums[3] == {"/P": "x-", "/St": 3}
+    assert nums[5] == {"/S": "/R"}
+    assert nums[7] == {"/S": "/D"}
+    assert nums[9] == {"/S": "/D"}
+
+
+def test_get_filtered_outline_deep_nesting():
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    parent = None
+    for depth in range(sys.getrecursionlimit() + 100):
+        parent = writer.add_outline_item(f"Level {depth}", 0, parent=parent)
+    buffer = BytesIO()
+    writer.write(buffer)
+
+    reader = PdfReader(buffer)
+    writer = PdfWriter()
+    pages = {reader.pages[0].indirect_reference.idnum: writer.add_page(reader.pages[0])}
+    outline = writer._get_filtered_outline(reader.trailer["/Root"]["/Outlines"], pages, reader)
+    depth = 0
+    while outline:
+        assert len(outline) == 1
+        depth += 1
+        outline = outline[0]._filtered_children
+    assert depth == sys.getrecursionlimit() + 100
+
+
+def test_set_page_label_invalid_style():
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    with pytest.raises(ValueError, match="invalid page label style: '/X'"):
+        writer.set_page_label(0, 0, "/X")
+    writer.set_page_label(0, 0, "/a")
+    assert writer.root_object["/PageLabels"]["/Nums"] == [0, {"/S": "/a"}]
+
+
+def test_remove_annotations_matches_whole_subtypes():
+    writer = PdfWriter()
+    page = writer.add_blank_page(100, 100)
+    annots = ArrayObject(
+        DictionaryObject({NameObject("/Subtype"): NameObject(subtype)})
+        for subtype in ("/Link", "/Text", "/Link", "/Popup")
+    )
+    annots.append(writer._add_object(DictionaryObject({NameObject("/Subtype"): NameObject("/Link")})))
+    page[NameObject("/Annots")] = annots
+
+    writer.remove_annotations("/Lin")
+    assert len(page["/Annots"]) == 5
+    writer.remove_annotations(["/Link", "/Popup"])
+    assert page["/Annots"] is annots
+    assert [a["/Subtype"] for a in annots] == ["/Text"]
+    assert isinstance(writer._objects[-1], NullObject)
+    writer.remove_annotations(None)
+    assert len(annots) == 0
+
+
+def test_find_outline_item_nested():
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    first = writer.add_outline_item("first", 0)
+    child = writer.add_outline_item("child", 0, parent=first)
+    writer.add_outline_item("grandchild", 0, parent=child)
+    writer.add_outline_item("second child", 0, parent=first)
+    writer.add_outline_item("second", 0)
+
+    assert writer.find_outline_item("first") == [0]
+    assert writer.find_outline_item("child") == [0, 0]
+    assert writer.find_outline_item("grandchild") == [0, 0, 0]
+    assert writer.find_outline_item("second child") == [0, 1]
+    assert writer.find_outline_item("second") == [1]
+    assert writer.find_outline_item(child) == [0, 0]
+    assert writer.find_outline_item("missing") is None
@@ -93,6 +93,16 @@ def test_converter_date():
     assert date == datetime(2021, 4, 28, 15, 23, 1)
 
 
+def test_converter_date_offsets():
+    """Offsets below one hour keep their sign."""
+    date = pypdf.xmp._converter_date("2021-04-28T12:23:59+00:45")
+    assert date == datetime(2021, 4, 28, 11, 38, 59)
+    date = pypdf.xmp._converter_date("2021-04-28T12:23:59-00:45")
+    assert date == datetime(2021, 4, 28, 13, 8, 59)
+    date = pypdf.xmp._converter_date("2021-04-5T12:23Z")
+    assert date == datetime(2021, 4, 5, 12, 23)
+
+
 def test_modify_date():
     """
     xmp_modify_date is extracted correctly.
@@ -242,3 +252,27 @@ def test_xmp_getter_bag_function():
 
     assert xmp_info is not None
     f(xmp_info)
+
+
+def test_xmp_bag_and_seq_written_as_attributes():
+    stream = pypdf.generic.DecodedStreamObject()
+    stream.set_data(
+        b'<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+        b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+        b'<rdf:Description rdf:about="" xmlns:dc="http://purl.org/dc/elements/1.1/"'
+        b' dc:subject="pdf" dc:creator="me"/>'
+        b"</rdf:RDF></x:xmpmeta>"
+    )
+    xmp = pypdf.xmp.XmpInformation(stream)
+    assert xmp.dc_subject == ["pdf"]
+    assert xmp.dc_creator == ["me"]
+
+
+def test_xmp_missing_property_is_cached():
+    """Absent properties are cached as well, not looked up again."""
+    reader = PdfReader(RESOURCE_ROOT / "commented-xmp.pdf")
+    xmp = reader.xmp_metadata
+    assert xmp.pdf_producer is None
+    assert xmp.dc_contributor == []
+    assert xmp.cache[pypdf.xmp.PDF_NAMESPACE] == {"Producer": None}
+    assert xmp.cache[pypdf.xmp.DC_NAMESPACE] == {"contributor": []}
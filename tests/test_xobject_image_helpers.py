@@ -4,7 +4,7 @@ from io import BytesIO
 import pytest
 
 from pypdf import PdfReader
-from pypdf._xobj_image_helpers import _handle_flate
+from pypdf._xobj_image_helpers import _handle_flate, _handle_jpx
 from pypdf.errors import PdfReadError
 from pypdf.generic import ArrayObject, DecodedStreamObject, NameObject, NumberObject
 
@@ -113,3 +113,89 @@ def test_handle_flate__image_mode_1():
             colors=2,
             obj_as_text="dummy",
         )
+
+
+def test_get_imagemode_cached_on_color_space_identity():
+    from pypdf._xobj_image_helpers import _IMAGEMODE_CACHE, _get_imagemode
+
+    _IMAGEMODE_CACHE.clear()
+    color_space = ArrayObject([NameObject("/Indexed"), NameObject("/DeviceRGB"), NumberObject(1)])
+    assert _get_imagemode(color_space, 2, "") == ("P", False)
+    key = (id(color_space), 2, "", 0)
+    assert _IMAGEMODE_CACHE[key][2] == ("P", False)
+    assert _get_imagemode(color_space, 2, "") == ("P", False)
+
+    # another array does not hit the entry of the first one
+    other = ArrayObject([NameObject("/Indexed"), NameObject("/DeviceCMYK"), NumberObject(1)])
+    assert _get_imagemode(other, 4, "") == ("P", True)
+
+    # an array changed in place is resolved again
+    color_space[1] = NameObject("/DeviceCMYK")
+    assert _get_imagemode(color_space, 2, "") == ("P", True)
+
+    # the cache does not keep the color space alive
+    del color_space
+    assert key not in _IMAGEMODE_CACHE
+
+
+def test_handle_jpx():
+    from PIL import Image, features
+
+    if not features.check("jpg_2000"):
+        pytest.skip("pillow built without JPEG 2000 support")
+    buffer = BytesIO()
+    Image.new("RGB", (4, 3), (255, 0, 0)).save(buffer, format="JPEG2000")
+
+    img, image_format, extension, invert_color = _handle_jpx(
+        size=(4, 3), data=buffer.getvalue(), mode="", color_space="/DeviceRGB", colors=3
+    )
+    assert (image_format, extension, invert_color) == ("JPEG2000", ".jp2", False)
+    assert img.mode == "RGB"
+    assert img.getpixel((0, 0))[0] > 200
+
+
+def test_handle_flate__packed_samples():
+    lookup = DecodedStreamObject()
+    lookup.set_data(b"\x00\x00\x00\x55\x55\x55\xaa\xaa\xaa\xff\xff\xff")
+    color_space = ArrayObject(
+        [NameObject("/Indexed"), NameObject("/DeviceRGB"), NumberObject(3), lookup]
+    )
+    # 2 rows of 3 samples of 2 bits, each row padded to a full byte
+    img, image_format, extension, _ = _handle_flate(
+        size=(3, 2),
+        data=b"\x18\xe4",
+        mode="2bits",
+        color_space=color_space,
+        colors=1,
+        obj_as_text="dummy",
+    )
+    assert (image_format, extension) == ("PNG", ".png")
+    assert [pixel[0] for pixel in img.getdata()] == [0x00, 0x55, 0xAA, 0xFF, 0xAA, 0x55]
+
+    # 4 bits samples: one row of 3, padded to 2 bytes
+    img, *_ = _handle_flate(
+        size=(3, 1),
+        data=b"\x01\x20",
+        mode="4bits",
+        color_space=color_space,
+        colors=1,
+        obj_as_text="dummy",
+    )
+    assert [pixel[0] for pixel in img.getdata()] == [0x00, 0x55, 0xAA]
+
+
+def test_handle_flate__packed_samples_icc_based():
+    icc_profile = DecodedStreamObject()
+    icc_profile[NameObject("/N")] = NumberObject(1)
+    color_space = ArrayObject([NameObject("/ICCBased"), icc_profile])
+    # 2 rows of 5 samples of 2 bits, each row padded to a full byte
+    img, *_ = _handle_flate(
+        size=(5, 2),
+        data=b"\x1b\xc0\x93\x40",
+        mode="2bits",
+        color_space=color_space,
+        colors=1,
+        obj_as_text="dummy",
+    )
+    assert img.mode == "L"
+    assert list(img.getdata()) == [0, 1, 2, 3, 3, 2, 1, 0, 3, 1]